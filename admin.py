@@ -0,0 +1,48 @@
+import os
+import streamlit as st
+import pandas as pd
+import instrumentacao
+from database import estatisticas_banco
+
+# Painel oculto: só aparece com ?admin=1 na URL e para usuários listados em MEDPLANNER_ADMINS
+ADMINS = {u.strip() for u in os.environ.get("MEDPLANNER_ADMINS", "").split(",") if u.strip()}
+
+def e_admin(username):
+    return username in ADMINS
+
+def render_admin(conn_ignored):
+    if not e_admin(st.session_state.get("username")):
+        return
+    with st.expander("🛠️ Admin · Consultas ao banco", expanded=True):
+        top = instrumentacao.top_consultas(1000)
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Consultas distintas", len(top))
+        c2.metric("Execuções", sum(r["execucoes"] for r in top))
+        c3.metric("Tempo total (ms)", f"{sum(r['total_ms'] for r in top):.0f}")
+        c4.metric("Esperas de escrita", estatisticas_banco().get("esperas_escrita", 0))
+
+        n = st.slider("Top N por tempo total", 5, 50, 10, key="adm_top_n")
+        if top:
+            st.dataframe(pd.DataFrame(top[:n]), use_container_width=True, hide_index=True)
+        else:
+            st.caption("Nenhuma consulta registrada (MEDPLANNER_INSTRUMENTAR=0?).")
+
+        rerun = instrumentacao.consultas_do_rerun()
+        st.markdown(f"**Este rerun:** {len(rerun)} consultas · {sum(c['ms'] for c in rerun):.1f} ms")
+        if rerun:
+            st.dataframe(pd.DataFrame(rerun), use_container_width=True, hide_index=True)
+        anteriores = instrumentacao.reruns_anteriores()
+        if anteriores:
+            st.markdown("**Reruns anteriores desta sessão**")
+            st.dataframe(pd.DataFrame(anteriores[::-1]), use_container_width=True, hide_index=True)
+
+        lentas = instrumentacao.ultimas_lentas()
+        st.markdown(f"**Lentas (≥ {instrumentacao.LIMIAR_LENTA_MS:.0f} ms)** · `{instrumentacao.ARQUIVO_LENTAS}`")
+        if lentas:
+            st.dataframe(pd.DataFrame(lentas[::-1]), use_container_width=True, hide_index=True)
+        else:
+            st.caption("Nenhuma consulta lenta no log.")
+
+        if st.button("Zerar estatísticas", key="adm_zerar"):
+            instrumentacao.zerar()
+            st.rerun()
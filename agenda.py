@@ -1,96 +1,112 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
 from datetime import datetime, timedelta, date
 import calendar
-from database import listar_revisoes_completas, concluir_revisao, excluir_revisao, reagendar_inteligente
+from database import (
+    get_agenda_resumo,
+    get_agenda_pendentes_ate,
+    get_agenda_proximos_dias,
+    get_agenda_janela,
+    listar_revisoes,
+    get_cartoes_srs,
+    reagendar_cartoes,
+    concluir_revisao,
+    excluir_revisao,
+    reagendar_inteligente,
+    concluir_revisoes,
+    adiar_revisoes,
+    excluir_revisoes
+)
+from previsao import HORIZONTE, prever_carga, balancear, dias_ate
+
+MAX_DAYS_SHOW = 15   # dias com revisões no "Futuro"
+LIMITE_LISTA = 500   # linhas da aba Lista em "Concluídas"/"Todas" (as mais recentes)
+DIAS_SEMANA = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+DESEMPENHOS = ["Muito Ruim", "Ruim", "Bom", "Excelente"]
+SEL_HOJE_KEY = "agenda_sel_hoje"
 
 def render_agenda(conn_ignored):
     st.header("📅 Agenda de Revisões")
     
     u = st.session_state.username
-    nonce = st.session_state.data_nonce
+    hoje = datetime.now().date()
     
     # --- OTIMIZAÇÃO DE CARGA ---
-    # Carrega TODOS os dados de uma vez e coloca em cache de função (st.cache_data no database.py já ajuda)
-    # Aqui garantimos que só processamos datas uma vez por renderização
-    df = listar_revisoes_completas(u, nonce)
+    # Nada de carregar o histórico inteiro: cada aba pede ao banco só a janela que mostra,
+    # já agrupada por dia ({date: [linhas]}), e cada dia/célula é um lookup no dict.
+    resumo = get_agenda_resumo(u, hoje)
     
-    if df.empty:
+    if resumo['vazia']:
         st.info("Sua agenda está vazia! Complete temas no Cronograma para agendar revisões.")
         return
     
-    # Processamento ÚNICO de datas para todo o script
-    if not pd.api.types.is_datetime64_any_dtype(df['data_agendada']):
-        df['data_agendada'] = pd.to_datetime(df['data_agendada'])
-    
-    hoje = datetime.now().date()
-    
-    # Pré-cálculo de filtros comuns para agilidade
-    mask_pendente = df['status'] == 'Pendente'
-    df_pendente = df[mask_pendente]
-    
     # --- ESTADO DE NAVEGAÇÃO ---
     if 'agenda_week_offset' not in st.session_state: st.session_state.agenda_week_offset = 0
     if 'agenda_month_offset' not in st.session_state: st.session_state.agenda_month_offset = 0
     
     # --- INTERFACE DE ABAS ---
-    # Como 'df' já está na memória, a troca de abas é instantânea visualmente
     tab_hoje, tab_futuro, tab_semana, tab_mes, tab_lista = st.tabs(["🔥 Foco Hoje", "🔮 Futuro", "🗓️ Semana", "📅 Mês", "📚 Lista"])
 
     # --- 1. HOJE ---
     with tab_hoje:
-        # Filtros rápidos em memória
-        tarefas_hoje = df_pendente[df_pendente['data_agendada'].dt.date == hoje]
-        atrasadas = df_pendente[df_pendente['data_agendada'].dt.date < hoje]
-        futuras_count = len(df_pendente[df_pendente['data_agendada'].dt.date > hoje])
+        ate_hoje = get_agenda_pendentes_ate(u, hoje)
+        tarefas_hoje = ate_hoje.get(hoje, [])
+        atrasadas = [t for d, ts in ate_hoje.items() if d < hoje for t in ts]
         
         # KPIs
         c1, c2, c3 = st.columns(3)
-        c1.metric("Para Hoje", len(tarefas_hoje))
-        c2.metric("Atrasadas", len(atrasadas), delta_color="inverse")
-        c3.metric("Futuras", futuras_count)
+        c1.metric("Para Hoje", resumo['hoje'])
+        c2.metric("Atrasadas", resumo['atrasadas'], delta_color="inverse")
+        c3.metric("Futuras", resumo['futuras'])
         
         st.divider()
 
-        if not atrasadas.empty:
+        # Ações em lote: concluir/adiar/excluir várias de uma vez (uma transação, um rerun)
+        if atrasadas or tarefas_hoje:
+            with st.expander("☑️ Ações em lote", expanded=False):
+                rotulos = {t['id']: f"{t['data_agendada']:%d/%m} · {t['assunto_nome']}" for t in atrasadas + tarefas_hoje}
+                # Seleção antiga pode citar revisões que já saíram da lista
+                st.session_state[SEL_HOJE_KEY] = [i for i in st.session_state.get(SEL_HOJE_KEY, []) if i in rotulos]
+                c_sel, c_todas = st.columns([5, 1])
+                c_todas.button("Todas", key="agenda_sel_todas", on_click=_selecionar, args=(SEL_HOJE_KEY, list(rotulos)), use_container_width=True)
+                sel = c_sel.multiselect("Revisões", list(rotulos), format_func=rotulos.get, key=SEL_HOJE_KEY,
+                                        placeholder="Escolha as revisões...", label_visibility="collapsed")
+                render_acoes_em_lote(u, sel, "lote_hoje", SEL_HOJE_KEY)
+
+        if atrasadas:
             st.error(f"⚠️ {len(atrasadas)} revisões atrasadas! Prioridade máxima.")
-            # Renderiza lista
-            for i, row in atrasadas.sort_values('data_agendada').iterrows():
+            # Já vêm ordenadas por data
+            for row in atrasadas:
                 render_cartao_tarefa(row, "atrasada", hoje)
             st.divider()
         
-        if not tarefas_hoje.empty:
+        if tarefas_hoje:
             st.subheader("📝 Tarefas do Dia")
-            for i, row in tarefas_hoje.iterrows():
+            for row in tarefas_hoje:
                 render_cartao_tarefa(row, "hoje", hoje)
-        elif atrasadas.empty:
+        elif not atrasadas:
             st.success("🎉 Tudo limpo por hoje!")
 
     # --- 2. FUTURO ---
     with tab_futuro:
+        render_previsao(u, hoje)
         st.subheader("🔮 Próximas Revisões")
-        futuras = df_pendente[df_pendente['data_agendada'].dt.date > hoje].sort_values('data_agendada')
+        futuras, dias_restantes = get_agenda_proximos_dias(u, hoje, MAX_DAYS_SHOW)
         
-        if futuras.empty:
+        if not futuras:
             st.info("Nada agendado para o futuro próximo.")
         else:
-            datas_unicas = futuras['data_agendada'].dt.date.unique()
-            # Limita a exibição inicial para não travar se tiver mil revisões futuras
-            # Mostra os próximos 30 dias com revisões
-            MAX_DAYS_SHOW = 15
-            
-            for i, d in enumerate(datas_unicas):
-                if i >= MAX_DAYS_SHOW:
-                    st.caption(f"E mais {len(datas_unicas) - MAX_DAYS_SHOW} dias com revisões...")
-                    break
-                    
+            for i, (d, tarefas_d) in enumerate(futuras.items()):
                 delta = (d - hoje).days
                 label_dia = f"Amanhã" if delta == 1 else f"Daqui a {delta} dias"
                 
-                with st.expander(f"📅 {d.strftime('%d/%m/%Y')} ({label_dia}) - {len(futuras[futuras['data_agendada'].dt.date == d])} tarefas", expanded=(i<3)):
-                    tarefas_d = futuras[futuras['data_agendada'].dt.date == d]
-                    for _, row in tarefas_d.iterrows():
+                with st.expander(f"📅 {d.strftime('%d/%m/%Y')} ({label_dia}) - {len(tarefas_d)} tarefas", expanded=(i<3)):
+                    for row in tarefas_d:
                         render_cartao_tarefa_futura_completo(row, "futuro")
+            if dias_restantes:
+                st.caption(f"E mais {dias_restantes} dias com revisões...")
 
     # --- 3. SEMANA ---
     with tab_semana:
@@ -103,18 +119,13 @@ def render_agenda(conn_ignored):
         
         c2.markdown(f"<div style='text-align:center; font-weight:bold; font-size:1.1em'>{start_week.strftime('%d/%m')} - {end_week.strftime('%d/%m')}</div>", unsafe_allow_html=True)
         
-        # Filtra dataframe para a semana inteira de uma vez (muito mais rápido que filtrar dia a dia dentro do loop)
-        # Convertendo start_week e end_week para datetime64 para comparação eficiente
-        mask_week = (df['data_agendada'].dt.date >= start_week) & (df['data_agendada'].dt.date <= end_week)
-        df_week = df[mask_week]
+        # Uma faixa indexada para a semana inteira, já separada por dia
+        semana = get_agenda_janela(u, start_week, end_week)
         
         cols = st.columns(7)
-        days_names = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
-        
-        for i, d_name in enumerate(days_names):
+        for i, d_name in enumerate(DIAS_SEMANA):
             d_date = start_week + timedelta(days=i)
-            # Filtro rápido local
-            tasks = df_week[df_week['data_agendada'].dt.date == d_date]
+            tasks = semana.get(d_date, [])
             
             with cols[i]:
                 bg_head = "#ffebee" if d_date == hoje else "#f0f2f6"
@@ -127,10 +138,10 @@ def render_agenda(conn_ignored):
                         unsafe_allow_html=True
                     )
                     
-                    if tasks.empty:
+                    if not tasks:
                         st.caption("-")
                     else:
-                        for _, t in tasks.iterrows():
+                        for t in tasks:
                             cor_status = "red" if t['status'] == 'Pendente' and d_date < hoje else "blue"
                             if t['status'] == 'Concluido': cor_status = "green"
                             
@@ -170,17 +181,13 @@ def render_agenda(conn_ignored):
         
         cal = calendar.monthcalendar(y_target, m_target)
         
-        # Filtro otimizado para o mês inteiro
+        # Uma faixa indexada para o mês inteiro, já separada por dia
         start_month = date(y_target, m_target, 1)
-        # Hack simples para pegar o último dia do mês
-        if m_target == 12: end_month = date(y_target + 1, 1, 1) - timedelta(days=1)
-        else: end_month = date(y_target, m_target + 1, 1) - timedelta(days=1)
-        
-        mask_month = (df['data_agendada'].dt.date >= start_month) & (df['data_agendada'].dt.date <= end_month)
-        df_month = df[mask_month]
+        end_month = date(y_target, m_target, calendar.monthrange(y_target, m_target)[1])
+        mes = get_agenda_janela(u, start_month, end_month)
         
         cols_h = st.columns(7)
-        for i, d in enumerate(["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]): cols_h[i].markdown(f"**{d}**")
+        for i, d in enumerate(DIAS_SEMANA): cols_h[i].markdown(f"**{d}**")
         
         for week in cal:
             c_days = st.columns(7)
@@ -190,49 +197,120 @@ def render_agenda(conn_ignored):
                         st.write("")
                     else:
                         dt_val = date(y_target, m_target, d)
-                        # Filtro local no subset do mês
-                        ts = df_month[df_month['data_agendada'].dt.date == dt_val]
+                        ts = mes.get(dt_val, [])
                         
                         with st.container(border=True):
                             color_d = ":red" if dt_val == hoje else ""
                             st.markdown(f"{color_d}[**{d}**]")
                                 
-                            if not ts.empty:
-                                p = len(ts[ts['status']=='Pendente'])
-                                ok = len(ts[ts['status']=='Concluido'])
+                            if ts:
+                                p = sum(1 for t in ts if t['status'] == 'Pendente')
+                                ok = sum(1 for t in ts if t['status'] == 'Concluido')
                                 if p > 0: st.markdown(f":red[● {p}]")
                                 if ok > 0: st.markdown(f":green[● {ok}]")
                                 
                                 # Popover leve apenas com lista
                                 with st.popover("Ver"):
-                                    for _, t in ts.iterrows():
+                                    for t in ts:
                                         icon = "⏳" if t['status'] == 'Pendente' else "✅"
                                         st.caption(f"{icon} {t['assunto_nome']}")
 
     # --- 5. LISTA ---
     with tab_lista:
         filtro = st.radio("Filtro:", ["Pendentes", "Concluídas", "Todas"], horizontal=True)
-        df_v = df.copy()
-        if filtro == "Pendentes": df_v = df_v[df_v['status']=='Pendente']
-        elif filtro == "Concluídas": df_v = df_v[df_v['status']=='Concluido']
+        status = {"Pendentes": "Pendente", "Concluídas": "Concluido"}.get(filtro)
+        limite = None if status == "Pendente" else LIMITE_LISTA
+        df_v = listar_revisoes(u, status, limite)
+        if limite and len(df_v) >= limite:
+            st.caption(f"Mostrando as {limite} revisões mais recentes.")
+        df_v['data_agendada'] = pd.to_datetime(df_v['data_agendada'].str[:10])
+        df_v.insert(0, "sel", False)
         
-        st.dataframe(
-            df_v[['data_agendada', 'assunto_nome', 'grande_area', 'tipo', 'status']].sort_values('data_agendada'),
+        # Só a coluna de seleção é editável; a chave muda com o data_nonce e a seleção zera após cada ação
+        editado = st.data_editor(
+            df_v[['sel', 'id', 'data_agendada', 'assunto_nome', 'grande_area', 'tipo', 'status']],
             column_config={
+                "sel": st.column_config.CheckboxColumn("☑", width="small"),
+                "id": None,
                 "data_agendada": st.column_config.DateColumn("Data", format="DD/MM/YYYY"),
                 "status": st.column_config.TextColumn("Estado"),
             },
+            disabled=['id', 'data_agendada', 'assunto_nome', 'grande_area', 'tipo', 'status'],
+            key=f"agenda_lista_{st.session_state.data_nonce}",
             use_container_width=True,
             hide_index=True
         )
+        render_acoes_em_lote(u, editado.loc[editado['sel'], 'id'].tolist(), "lote_lista")
 
 # --- COMPONENTES ---
 
+def _selecionar(chave, ids):
+    st.session_state[chave] = ids
+
+def _executar_lote(acao, u, ids, chave_sel, *args):
+    n = acao(u, ids, *args)
+    if chave_sel:
+        st.session_state.pop(chave_sel, None)
+    st.toast(f"{n} revisão(ões) atualizada(s)!", icon="✅")
+
+def render_acoes_em_lote(u, ids, prefixo, chave_sel=None):
+    """Barra de ações para as revisões selecionadas. Os botões usam on_click: o lote vai ao
+    banco antes do rerun que o próprio clique dispara, sem st.rerun() extra."""
+    c_nota, c_ok, c_dias, c_adiar, c_del = st.columns([1.4, 1.3, 0.8, 1, 1])
+    desempenho = c_nota.selectbox("Desempenho", DESEMPENHOS, index=2, key=f"{prefixo}_nota", label_visibility="collapsed")
+    c_ok.button(f"✅ Concluir ({len(ids)})", key=f"{prefixo}_ok", disabled=not ids, use_container_width=True,
+                on_click=_executar_lote, args=(concluir_revisoes, u, ids, chave_sel, desempenho))
+    dias = c_dias.number_input("Dias", 1, 60, value=1, key=f"{prefixo}_dias", label_visibility="collapsed")
+    c_adiar.button(f"⏩ Adiar {dias}d", key=f"{prefixo}_adiar", disabled=not ids, use_container_width=True,
+                   on_click=_executar_lote, args=(adiar_revisoes, u, ids, chave_sel, dias))
+    c_del.button("🗑️ Excluir", key=f"{prefixo}_del", disabled=not ids, use_container_width=True,
+                 on_click=_executar_lote, args=(excluir_revisoes, u, ids, chave_sel))
+
+def _mapa_calor(carga, hoje):
+    """Carga diária em grade semana × dia da semana (estilo calendário de contribuições)."""
+    vazio = hoje.weekday()
+    z = np.concatenate([np.full(vazio, np.nan), carga.astype(float)])
+    z = np.pad(z, (0, -len(z) % 7), constant_values=np.nan).reshape(-1, 7).T
+    inicio = hoje - timedelta(days=vazio)
+    datas = np.array([(inicio + timedelta(days=i)).strftime("%d/%m/%Y") for i in range(z.size)]).reshape(-1, 7).T
+    fig = go.Figure(go.Heatmap(
+        z=z, x=[inicio + timedelta(weeks=i) for i in range(z.shape[1])], y=DIAS_SEMANA, customdata=datas,
+        colorscale="Reds", xgap=2, ygap=2, hovertemplate="%{customdata}: %{z} revisões<extra></extra>"))
+    fig.update_layout(height=220, margin=dict(l=0, r=0, t=10, b=0), yaxis_autorange="reversed", template="plotly_white")
+    return fig
+
+def render_previsao(u, hoje):
+    # Projeção a partir dos cartões SM-2 (supondo nota "Bom" em cada revisão) e balanceamento
+    cartoes = get_cartoes_srs(u)
+    if cartoes.empty:
+        return
+    proximas = cartoes['proxima'].str[:10].to_numpy()
+    carga = prever_carga(proximas, cartoes['intervalo'], cartoes['facilidade'], cartoes['repeticoes'], hoje)
+    
+    with st.expander(f"📈 Carga prevista ({HORIZONTE} dias)", expanded=False):
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Pico", int(carga.max()))
+        c2.metric("Média (30 dias)", f"{carga[:30].mean():.1f}")
+        if "agenda_limite_dia" not in st.session_state:  # padrão: 1,5× a média do próximo mês
+            st.session_state.agenda_limite_dia = max(1, int(np.ceil(carga[1:31].mean() * 1.5)))
+        limite = c3.number_input("Máx. por dia", 1, 500, key="agenda_limite_dia")
+        st.plotly_chart(_mapa_calor(carga, hoje), use_container_width=True)
+        
+        acima = int((carga[1:] > limite).sum())
+        st.caption(f"{acima} dia(s) acima de {limite} revisões. O balanceamento move cada revisão no máximo "
+                   f"15% do intervalo dela (até 7 dias), nunca para hoje ou antes.")
+        if st.button("⚖️ Balancear", disabled=acima == 0, key="agenda_balancear"):
+            novos = balancear(proximas, cartoes['intervalo'], hoje, limite)
+            mudou = novos != dias_ate(proximas, hoje)
+            n = reagendar_cartoes(u, {a: hoje + timedelta(days=int(d)) for a, d in zip(cartoes['assunto_nome'][mudou], novos[mudou])})
+            st.toast(f"{n} revisões redistribuídas!", icon="⚖️")
+            st.rerun()
+
 def render_cartao_tarefa(row, key_suffix, hoje):
     with st.container(border=True):
         c1, c2, c3 = st.columns([0.6, 0.3, 0.1])
         with c1:
-            prefix = "🔴 " if row['data_agendada'].date() < hoje else ""
+            prefix = "🔴 " if row['data_agendada'] < hoje else ""
             st.markdown(f"**{prefix}{row['assunto_nome']}**")
             st.caption(f"{row['grande_area']} • {row['tipo']}")
         with c2:
@@ -1,5 +1,7 @@
 # app.py
 import streamlit as st
+import os
+import importlib
 import traceback
 import time
 import extra_streamlit_components as stx
@@ -21,6 +23,7 @@ st.markdown("""
     [data-testid="stSidebarNav"] {display: none;}
     .stTabs [data-baseweb="tab-list"] { justify-content: center; gap: 20px; border-bottom: 2px solid #f0f2f6; }
     .stTabs [data-baseweb="tab"] { font-size: 16px; font-weight: 600; }
+    .st-key-nav_secao [role="radiogroup"] { justify-content: center; gap: 12px; font-weight: 600; }
     .login-header { text-align: center; margin-bottom: 2rem; }
     .stButton>button { border-radius: 8px; font-weight: 600; }
     .logout-btn { margin-top: 20px; }
@@ -43,6 +46,7 @@ def fazer_logout_definitivo():
     st.session_state.logado = False
     st.session_state.username = "guest"
     st.session_state.quer_sair = False
+    st.session_state.pop("_pomodoro", None)  # um timer em curso não passa para o próximo login
     # Limpa chaves de widgets para evitar AttributeError no próximo login
     for key in list(st.session_state.keys()):
         if key.endswith("_slider") or key.startswith("txt_"):
@@ -71,6 +75,53 @@ def fazer_login(u, nome_real):
     time.sleep(0.5)
     st.rerun()
 
+# --- NAVEGAÇÃO POR SEÇÃO ---
+# Só a seção escolhida executa. Ela roda num st.fragment: widgets dela reexecutam apenas
+# a seção, sem sidebar nem as demais telas. MEDPLANNER_NAV=abas volta às nove st.tabs.
+NAVEGACAO = os.environ.get("MEDPLANNER_NAV", "secao")
+
+# nome -> (rótulo, módulo, função de render, prefixos de chaves de widget a preservar)
+SECOES = {
+    "dashboard": ("📊 DASHBOARD", "dashboard", "render_dashboard", ()),
+    "mentor": ("🤖 MENTOR IA", "mentor", "render_mentor", ()),
+    "questoes": ("🏦 QUESTÕES", "banco_questoes", "render_banco_questoes", ()),
+    "erros": ("🧠 ERROS", "caderno_erros", "render_caderno_erros", ("txt_erro_",)),
+    "simulado": ("⏱️ SIMULADO", "simulado", "render_simulado_real", ("sim_",)),
+    "agenda": ("📅 AGENDA", "agenda", "render_agenda", ()),
+    "videoteca": ("📚 VIDEOTECA", "videoteca", "render_videoteca", ()),
+    "cronograma": ("🗂️ CRONOGRAMA", "cronograma", "render_cronograma", ("cronograma_",)),
+    "perfil": ("👤 PERFIL", "perfil", "render_perfil", ()),
+}
+
+def _fragmento(fn):
+    return st.fragment(fn) if hasattr(st, "fragment") else fn  # streamlit < 1.37: rerun inteiro
+
+def _preservar_estado(prefixos):
+    """O streamlit descarta o valor de widgets que não foram desenhados no rerun; reatribuir
+    a chave mantém texto do caderno e gabarito do simulado até o usuário voltar à seção."""
+    if not prefixos:
+        return
+    for k in list(st.session_state.keys()):
+        if isinstance(k, str) and k.startswith(tuple(prefixos)):
+            st.session_state[k] = st.session_state[k]
+
+def _executar_secao(nome):
+    _, modulo, funcao, _ = SECOES[nome]
+    getattr(importlib.import_module(modulo), funcao)(None)
+
+@_fragmento
+def render_secao(nome):
+    # Escrita feita dentro da seção (ex.: checkbox do cronograma): a sidebar mostra XP e
+    # progresso, então o rerun volta a ser do app inteiro
+    if st.session_state.get("_nonce_app", st.session_state.data_nonce) != st.session_state.data_nonce:
+        st.rerun()
+    try:
+        _executar_secao(nome)
+    except Exception:
+        st.error("Erro ao carregar os módulos do sistema.")
+        with st.expander("Detalhes técnicos do erro"):
+            st.code(traceback.format_exc())
+
 # --- INTERFACES ---
 
 def tela_login():
@@ -118,16 +169,14 @@ def app_principal():
         # Lazy Imports: Só carregamos os módulos quando o usuário está logado
         # Isso previne que erros em módulos que o usuário não está vendo travem o login.
         from sidebar_v2 import render_sidebar
-        from dashboard import render_dashboard
-        from cronograma import render_cronograma
-        from agenda import render_agenda
-        from mentor import render_mentor
-        from simulado import render_simulado_real
-        from caderno_erros import render_caderno_erros
-        from videoteca import render_videoteca
-        from perfil import render_perfil
-        from banco_questoes import render_banco_questoes
-
+        from pomodoro import render_pomodoro
+        from database import iniciar_rerun, estatisticas_memo
+
+        iniciar_rerun()
+        # Cliques do cronograma ainda no buffer vão ao banco antes que sidebar e telas leiam
+        if st.session_state.get("cron_pendentes"):
+            from cronograma import salvar_pendentes
+            salvar_pendentes(st.session_state.username)
         render_sidebar(cookie_manager)
         
         # Verificação dupla após sidebar (caso o botão sair tenha sido clicado lá)
@@ -137,36 +186,33 @@ def app_principal():
 
         st.markdown("<h2 style='text-align:center;'>🩺 MEDPLANNER PRO</h2>", unsafe_allow_html=True)
 
-        # Pomodoro
+        # Pomodoro: contagem no navegador, sem rerun por segundo
         with st.expander("⏲️ Foco Pomodoro", expanded=False):
-            c1, c2, c3 = st.columns([1, 2, 1])
-            with c2:
-                mode = st.radio("Modo:", ["Estudo (25m)", "Pausa (5m)"], horizontal=True)
-                if st.button("🚀 Iniciar", key="pom_start"):
-                    st.session_state._pom_rem = 25*60 if "Estudo" in mode else 5*60
-                    st.rerun()
-            if st.session_state.get("_pom_rem", 0) > 0:
-                m, s = divmod(st.session_state["_pom_rem"], 60)
-                st.markdown(f"<h1 style='text-align:center;'>{m:02d}:{s:02d}</h1>", unsafe_allow_html=True)
-                st.session_state["_pom_rem"] = max(0, st.session_state["_pom_rem"]-1)
-                time.sleep(1)
-                st.rerun()
-
-        # Abas
-        abas = st.tabs([
-            "📊 DASHBOARD", "🤖 MENTOR IA", "🏦 QUESTÕES", "🧠 ERROS", "⏱️ SIMULADO", 
-            "📅 AGENDA", "📚 VIDEOTECA", "🗂️ CRONOGRAMA", "👤 PERFIL"
-        ])
-        
-        with abas[0]: render_dashboard(None)
-        with abas[1]: render_mentor(None)
-        with abas[2]: render_banco_questoes(None)
-        with abas[3]: render_caderno_erros(None)
-        with abas[4]: render_simulado_real(None)
-        with abas[5]: render_agenda(None)
-        with abas[6]: render_videoteca(None)
-        with abas[7]: render_cronograma(None)
-        with abas[8]: render_perfil(None)
+            render_pomodoro(st.session_state.username)
+
+        if NAVEGACAO == "abas":
+            # Modo antigo (comparação): as nove abas executam a cada rerun
+            abas = st.tabs([rotulo for rotulo, _, _, _ in SECOES.values()])
+            for aba, nome in zip(abas, SECOES):
+                with aba: _executar_secao(nome)
+        else:
+            nomes = list(SECOES)
+            if st.session_state.get("nav_secao") not in SECOES:
+                st.session_state.nav_secao = nomes[0]
+            ativa = st.radio("Seção", nomes, key="nav_secao", horizontal=True,
+                             format_func=lambda n: SECOES[n][0], label_visibility="collapsed")
+            _preservar_estado([p for n in nomes if n != ativa for p in SECOES[n][3]])
+            st.session_state._nonce_app = st.session_state.data_nonce
+            render_secao(ativa)
+
+        # Diagnóstico: ?debug=1 na URL mostra o aproveitamento do memo de leituras
+        if st.query_params.get("debug"):
+            memo = estatisticas_memo()
+            st.caption(f"🔎 Memo do rerun: {memo['hits']} hits / {memo['misses']} misses · {memo['por_funcao']}")
+        # ?admin=1: consultas por tempo total e por rerun (só para MEDPLANNER_ADMINS)
+        if st.query_params.get("admin"):
+            from admin import render_admin
+            render_admin(None)
 
     except Exception as e:
         if st.session_state.quer_sair:
@@ -1,456 +1,485 @@
 # Lista Mestra de Aulas - MedCof Extensivo 2026
-# Formato: (Nome da Aula, Grande Área, Prioridade)
+# Formato: BLOCOS = [(Bloco, [(Nome da Aula, Grande Área, Prioridade), ...]), ...]
 # Prioridades: Diamante, Vermelho, Amarelo, Verde
+# Consulta no app: catalogo.py (índice imutável por nome/id); DADOS_LIMPOS é a lista plana.
 
-DADOS_LIMPOS = [
-    # --- BLOCO 1 ---
-    ("Avaliação Global do Hemograma", "Clínica Médica", "Amarelo"),
-    ("Anemias Hipoproliferativas I", "Clínica Médica", "Diamante"),
-    ("Anemias Hipoproliferativas II", "Clínica Médica", "Amarelo"),
-    ("Modificações do Organismo Materno", "Ginecologia e Obstetrícia", "Verde"),
-    ("Assistência ao Pré-Natal", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Ultrassonografia em Obstetrícia", "Ginecologia e Obstetrícia", "Verde"),
-    ("Aleitamento Materno", "Pediatria", "Diamante"),
-    ("Alimentação Infantil", "Pediatria", "Diamante"),
-    
-    # --- BLOCO 2 ---
-    ("Desenvolvimento Infantil", "Pediatria", "Vermelho"),
-    ("Alterações no Neurodesenvolvimento - TEA e TDAH", "Pediatria", "Verde"),
-    ("Níveis de Prevenção", "Preventiva", "Vermelho"),
-    ("Indicadores de Saúde", "Preventiva", "Vermelho"),
-    ("Introdução ao Trauma e Atendimento Inicial", "Cirurgia", "Diamante"),
-    ("Trauma: Vias aéreas", "Cirurgia", "Vermelho"),
-    ("Choque e Ressuscitação Hemostática", "Cirurgia", "Vermelho"),
-    ("Neurovascular I: AIT e AVCI", "Clínica Médica", "Diamante"),
-    ("Neurovascular II: HSA e AVCh", "Clínica Médica", "Amarelo"),
-    ("Anatomia Pélvica Feminina", "Ginecologia e Obstetrícia", "Verde"),
-    ("Embriologia do Sistema Genital Feminino", "Ginecologia e Obstetrícia", "Verde"),
-    ("Malformações Mullerianas", "Ginecologia e Obstetrícia", "Verde"),
+BLOCOS = [
+    ("BLOCO 1", [
+        ("Avaliação Global do Hemograma", "Clínica Médica", "Amarelo"),
+        ("Anemias Hipoproliferativas I", "Clínica Médica", "Diamante"),
+        ("Anemias Hipoproliferativas II", "Clínica Médica", "Amarelo"),
+        ("Modificações do Organismo Materno", "Ginecologia e Obstetrícia", "Verde"),
+        ("Assistência ao Pré-Natal", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Ultrassonografia em Obstetrícia", "Ginecologia e Obstetrícia", "Verde"),
+        ("Aleitamento Materno", "Pediatria", "Diamante"),
+        ("Alimentação Infantil", "Pediatria", "Diamante"),
+    ]),
 
-    # --- BLOCO 3 ---
-    ("Febre sem Sinais Localizatórios", "Pediatria", "Diamante"),
-    ("Síndrome Nefrítica e Nefrótica", "Pediatria", "Vermelho"),
-    ("Doença Renal Crônica e LRA em Pediatria", "Pediatria", "Verde"),
-    ("Testes Diagnósticos", "Preventiva", "Diamante"),
-    ("Assistência ao Pré-Natal na APS", "Preventiva", "Diamante"),
-    ("Trauma: Medidas Auxiliares e FAST", "Cirurgia", "Amarelo"),
-    ("Trauma: Populações especiais", "Cirurgia", "Diamante"),
-    ("Trauma de Tórax", "Cirurgia", "Diamante"),
-    ("Sífilis", "Clínica Médica", "Vermelho"),
+    ("BLOCO 2", [
+        ("Desenvolvimento Infantil", "Pediatria", "Vermelho"),
+        ("Alterações no Neurodesenvolvimento - TEA e TDAH", "Pediatria", "Verde"),
+        ("Níveis de Prevenção", "Preventiva", "Vermelho"),
+        ("Indicadores de Saúde", "Preventiva", "Vermelho"),
+        ("Introdução ao Trauma e Atendimento Inicial", "Cirurgia", "Diamante"),
+        ("Trauma: Vias aéreas", "Cirurgia", "Vermelho"),
+        ("Choque e Ressuscitação Hemostática", "Cirurgia", "Vermelho"),
+        ("Neurovascular I: AIT e AVCI", "Clínica Médica", "Diamante"),
+        ("Neurovascular II: HSA e AVCh", "Clínica Médica", "Amarelo"),
+        ("Anatomia Pélvica Feminina", "Ginecologia e Obstetrícia", "Verde"),
+        ("Embriologia do Sistema Genital Feminino", "Ginecologia e Obstetrícia", "Verde"),
+        ("Malformações Mullerianas", "Ginecologia e Obstetrícia", "Verde"),
+    ]),
 
-    # --- BLOCO 4 ---
-    ("Dispepsia, DRGE e Barret", "Clínica Médica", "Diamante"),
-    ("Úlcera péptica e H. pylori", "Clínica Médica", "Diamante"),
-    ("Corrimentos Vaginais", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Doença Inflamatória Pélvica Aguda", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Úlceras Genitais", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Alergia Alimentar, Refluxo e Constipação (Ped)", "Pediatria", "Vermelho"),
-    ("Diarreia Crônica (Ped)", "Pediatria", "Verde"),
-    ("Violência Contra a Criança e o Adolescente", "Pediatria", "Amarelo"),
-    ("Determinação Social do Processo Saúde-Doença", "Preventiva", "Verde"),
-    ("Trauma Abdominal", "Cirurgia", "Diamante"),
-    ("Trauma Urológico", "Cirurgia", "Amarelo"),
-    ("Artrite Reumatoide", "Clínica Médica", "Amarelo"),
+    ("BLOCO 3", [
+        ("Febre sem Sinais Localizatórios", "Pediatria", "Diamante"),
+        ("Síndrome Nefrítica e Nefrótica", "Pediatria", "Vermelho"),
+        ("Doença Renal Crônica e LRA em Pediatria", "Pediatria", "Verde"),
+        ("Testes Diagnósticos", "Preventiva", "Diamante"),
+        ("Assistência ao Pré-Natal na APS", "Preventiva", "Diamante"),
+        ("Trauma: Medidas Auxiliares e FAST", "Cirurgia", "Amarelo"),
+        ("Trauma: Populações especiais", "Cirurgia", "Diamante"),
+        ("Trauma de Tórax", "Cirurgia", "Diamante"),
+        ("Sífilis", "Clínica Médica", "Vermelho"),
+    ]),
 
-    # --- BLOCO 5 ---
-    ("Espondiloartrites", "Clínica Médica", "Verde"),
-    ("Artrites Microcristalinas (Gota e CPPD)", "Clínica Médica", "Amarelo"),
-    ("Osteoartrite e Fibromialgia", "Clínica Médica", "Verde"),
-    ("Assistência ao Parto", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Sofrimento Fetal Agudo", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Crescimento e Baixa Estatura", "Pediatria", "Vermelho"),
-    ("Obesidade e Síndrome Metabólica (Ped)", "Pediatria", "Verde"),
-    ("Puberdade", "Pediatria", "Vermelho"),
-    ("Desnutrição e Vitaminas", "Pediatria", "Amarelo"),
-    ("Redes de Atenção à Saúde", "Preventiva", "Amarelo"),
-    ("Atenção Primária à Saúde", "Preventiva", "Diamante"),
-    ("Trauma de Pelve", "Cirurgia", "Amarelo"),
-    ("Trauma Cranioencefálico", "Cirurgia", "Vermelho"),
-    ("Trauma Raquimedular", "Cirurgia", "Verde"),
-    ("Trauma Musculoesquelético", "Cirurgia", "Amarelo"),
-    ("Trauma de Pescoço", "Cirurgia", "Verde"),
+    ("BLOCO 4", [
+        ("Dispepsia, DRGE e Barret", "Clínica Médica", "Diamante"),
+        ("Úlcera péptica e H. pylori", "Clínica Médica", "Diamante"),
+        ("Corrimentos Vaginais", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Doença Inflamatória Pélvica Aguda", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Úlceras Genitais", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Alergia Alimentar, Refluxo e Constipação (Ped)", "Pediatria", "Vermelho"),
+        ("Diarreia Crônica (Ped)", "Pediatria", "Verde"),
+        ("Violência Contra a Criança e o Adolescente", "Pediatria", "Amarelo"),
+        ("Determinação Social do Processo Saúde-Doença", "Preventiva", "Verde"),
+        ("Trauma Abdominal", "Cirurgia", "Diamante"),
+        ("Trauma Urológico", "Cirurgia", "Amarelo"),
+        ("Artrite Reumatoide", "Clínica Médica", "Amarelo"),
+    ]),
 
-    # --- BLOCO 6 ---
-    ("Dor Torácica Coronariana", "Clínica Médica", "Diamante"),
-    ("Dor Torácica Não Coronariana", "Clínica Médica", "Vermelho"),
-    ("Fisiologia Menstrual", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Amenorreia Primária", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Esteroidogênese", "Ginecologia e Obstetrícia", "Verde"),
-    ("Politrauma e Afogamento (Ped)", "Pediatria", "Amarelo"),
-    ("Queimaduras (Ped)", "Pediatria", "Amarelo"),
-    ("TCE e Hipertensão Intracraniana (Ped)", "Pediatria", "Amarelo"),
-    ("Diarreia Aguda (Ped)", "Pediatria", "Vermelho"),
-    ("Classificação dos Estudos Epidemiológicos", "Preventiva", "Vermelho"),
-    ("Associação x Causalidade", "Preventiva", "Amarelo"),
-    ("Rastreamentos", "Preventiva", "Diamante"),
-    ("Trauma: Encerramento", "Cirurgia", "Verde"),
-    ("Queimaduras (Cirurgia)", "Cirurgia", "Diamante"),
-    ("Escroto Agudo", "Cirurgia", "Vermelho"),
-    ("Priapismo", "Cirurgia", "Verde"),
+    ("BLOCO 5", [
+        ("Espondiloartrites", "Clínica Médica", "Verde"),
+        ("Artrites Microcristalinas (Gota e CPPD)", "Clínica Médica", "Amarelo"),
+        ("Osteoartrite e Fibromialgia", "Clínica Médica", "Verde"),
+        ("Assistência ao Parto", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Sofrimento Fetal Agudo", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Crescimento e Baixa Estatura", "Pediatria", "Vermelho"),
+        ("Obesidade e Síndrome Metabólica (Ped)", "Pediatria", "Verde"),
+        ("Puberdade", "Pediatria", "Vermelho"),
+        ("Desnutrição e Vitaminas", "Pediatria", "Amarelo"),
+        ("Redes de Atenção à Saúde", "Preventiva", "Amarelo"),
+        ("Atenção Primária à Saúde", "Preventiva", "Diamante"),
+        ("Trauma de Pelve", "Cirurgia", "Amarelo"),
+        ("Trauma Cranioencefálico", "Cirurgia", "Vermelho"),
+        ("Trauma Raquimedular", "Cirurgia", "Verde"),
+        ("Trauma Musculoesquelético", "Cirurgia", "Amarelo"),
+        ("Trauma de Pescoço", "Cirurgia", "Verde"),
+    ]),
 
-    # --- BLOCO 7 ---
-    ("Gasometria Arterial", "Clínica Médica", "Vermelho"),
-    ("Distúrbios do Sódio", "Clínica Médica", "Diamante"),
-    ("Distúrbios do Potássio", "Clínica Médica", "Diamante"),
-    ("Reações Alérgicas", "Clínica Médica", "Verde"),
-    ("Amenorreia Secundária", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Hiperprolactinemia", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("SOP (Síndrome dos Ovários Policísticos)", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Infecções de Vias Aéreas Superiores (IVAS)", "Pediatria", "Diamante"),
-    ("Autoinflamatórias (Ped)", "Pediatria", "Verde"),
-    ("Pneumonias (Ped)", "Pediatria", "Diamante"),
-    ("Bronquiolite e Coqueluche", "Pediatria", "Diamante"),
-    ("COVID (Ped)", "Pediatria", "Amarelo"),
-    ("Estudos Transversais", "Preventiva", "Diamante"),
-    ("Estudos Longitudinais: Coorte e Caso-Controle", "Preventiva", "Diamante"),
-    ("Abdome Agudo: Introdução", "Cirurgia", "Vermelho"),
-    ("Apendicite Aguda", "Cirurgia", "Diamante"),
-    ("Cicatrização e Lesões por Pressão", "Cirurgia", "Verde"),
-    ("Fios de Sutura e Anestésicos Locais", "Cirurgia", "Amarelo"),
-    ("Antibióticos", "Clínica Médica", "Verde"),
-    ("Anemias Hemolíticas", "Clínica Médica", "Vermelho"),
+    ("BLOCO 6", [
+        ("Dor Torácica Coronariana", "Clínica Médica", "Diamante"),
+        ("Dor Torácica Não Coronariana", "Clínica Médica", "Vermelho"),
+        ("Fisiologia Menstrual", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Amenorreia Primária", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Esteroidogênese", "Ginecologia e Obstetrícia", "Verde"),
+        ("Politrauma e Afogamento (Ped)", "Pediatria", "Amarelo"),
+        ("Queimaduras (Ped)", "Pediatria", "Amarelo"),
+        ("TCE e Hipertensão Intracraniana (Ped)", "Pediatria", "Amarelo"),
+        ("Diarreia Aguda (Ped)", "Pediatria", "Vermelho"),
+        ("Classificação dos Estudos Epidemiológicos", "Preventiva", "Vermelho"),
+        ("Associação x Causalidade", "Preventiva", "Amarelo"),
+        ("Rastreamentos", "Preventiva", "Diamante"),
+        ("Trauma: Encerramento", "Cirurgia", "Verde"),
+        ("Queimaduras (Cirurgia)", "Cirurgia", "Diamante"),
+        ("Escroto Agudo", "Cirurgia", "Vermelho"),
+        ("Priapismo", "Cirurgia", "Verde"),
+    ]),
 
-    # --- BLOCO 8 ---
-    ("Oncologia: emergências e cuidados paliativos", "Clínica Médica", "Vermelho"),
-    ("Infecções e Gravidez", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Rotura Prematura de Membranas Ovulares", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Violência Sexual", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Interrupção Legal da Gestação", "Ginecologia e Obstetrícia", "Verde"),
-    ("Reanimação Neonatal", "Pediatria", "Diamante"),
-    ("Infecções Congênitas", "Pediatria", "Diamante"),
-    ("Icterícia e Colestase Neonatal", "Pediatria", "Diamante"),
-    ("História e Princípios do SUS", "Preventiva", "Diamante"),
-    ("Cardiologia na APS", "Preventiva", "Amarelo"),
-    ("Urgências da Vesícula Biliar", "Cirurgia", "Diamante"),
-    ("Câncer de Esôfago", "Cirurgia", "Vermelho"),
-    ("Cefaleias", "Clínica Médica", "Vermelho"),
+    ("BLOCO 7", [
+        ("Gasometria Arterial", "Clínica Médica", "Vermelho"),
+        ("Distúrbios do Sódio", "Clínica Médica", "Diamante"),
+        ("Distúrbios do Potássio", "Clínica Médica", "Diamante"),
+        ("Reações Alérgicas", "Clínica Médica", "Verde"),
+        ("Amenorreia Secundária", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Hiperprolactinemia", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("SOP (Síndrome dos Ovários Policísticos)", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Infecções de Vias Aéreas Superiores (IVAS)", "Pediatria", "Diamante"),
+        ("Autoinflamatórias (Ped)", "Pediatria", "Verde"),
+        ("Pneumonias (Ped)", "Pediatria", "Diamante"),
+        ("Bronquiolite e Coqueluche", "Pediatria", "Diamante"),
+        ("COVID (Ped)", "Pediatria", "Amarelo"),
+        ("Estudos Transversais", "Preventiva", "Diamante"),
+        ("Estudos Longitudinais: Coorte e Caso-Controle", "Preventiva", "Diamante"),
+        ("Abdome Agudo: Introdução", "Cirurgia", "Vermelho"),
+        ("Apendicite Aguda", "Cirurgia", "Diamante"),
+        ("Cicatrização e Lesões por Pressão", "Cirurgia", "Verde"),
+        ("Fios de Sutura e Anestésicos Locais", "Cirurgia", "Amarelo"),
+        ("Antibióticos", "Clínica Médica", "Verde"),
+        ("Anemias Hemolíticas", "Clínica Médica", "Vermelho"),
+    ]),
 
-    # --- BLOCO 9 ---
-    ("Avaliação Geriátrica Ampla", "Clínica Médica", "Amarelo"),
-    ("Grandes Síndromes Geriátricas", "Clínica Médica", "Vermelho"),
-    ("Avaliação de enzimas hepáticas", "Clínica Médica", "Verde"),
-    ("Doenças hepáticas: CBP, CEP, HAI, Wilson", "Clínica Médica", "Verde"),
-    ("Abortamento", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Gestação Ectópica", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Doença Trofoblástica Gestacional", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Dermatite Atópica (Ped)", "Pediatria", "Verde"),
-    ("Dermatoses e Infecções de Partes Moles (Ped)", "Pediatria", "Vermelho"),
-    ("Legislação do SUS I: Leis Orgânicas", "Preventiva", "Diamante"),
-    ("Pancreatite Aguda", "Cirurgia", "Diamante"),
-    ("Diverticulite Aguda", "Cirurgia", "Diamante"),
-    ("Abscesso Hepático", "Cirurgia", "Verde"),
-    ("Disfagia e Acalasia", "Cirurgia", "Amarelo"),
-    ("Hernias de Hiato", "Cirurgia", "Vermelho"),
+    ("BLOCO 8", [
+        ("Oncologia: emergências e cuidados paliativos", "Clínica Médica", "Vermelho"),
+        ("Infecções e Gravidez", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Rotura Prematura de Membranas Ovulares", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Violência Sexual", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Interrupção Legal da Gestação", "Ginecologia e Obstetrícia", "Verde"),
+        ("Reanimação Neonatal", "Pediatria", "Diamante"),
+        ("Infecções Congênitas", "Pediatria", "Diamante"),
+        ("Icterícia e Colestase Neonatal", "Pediatria", "Diamante"),
+        ("História e Princípios do SUS", "Preventiva", "Diamante"),
+        ("Cardiologia na APS", "Preventiva", "Amarelo"),
+        ("Urgências da Vesícula Biliar", "Cirurgia", "Diamante"),
+        ("Câncer de Esôfago", "Cirurgia", "Vermelho"),
+        ("Cefaleias", "Clínica Médica", "Vermelho"),
+    ]),
 
-    # --- BLOCO 10 ---
-    ("Coagulação e Hemostasia", "Clínica Médica", "Verde"),
-    ("Hemoterapia", "Clínica Médica", "Verde"),
-    ("Cirrose Hepática I e II", "Clínica Médica", "Diamante"),
-    ("Pneumonia Adquirida na Comunidade", "Clínica Médica", "Diamante"),
-    ("Derrame Pleural", "Clínica Médica", "Vermelho"),
-    ("Placenta Prévia", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Descolamento Prematuro de Placenta", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Sangramentos da Segunda Metade da Gestação", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Anemia Falciforme (Ped)", "Pediatria", "Vermelho"),
-    ("Anemia Ferropriva e Talassemia (Ped)", "Pediatria", "Vermelho"),
-    ("Distúrbios Hemorrágicos (Ped)", "Pediatria", "Verde"),
-    ("Genética (Ped)", "Pediatria", "Verde"),
-    ("Legislação do SUS II: NOBS, NOAS", "Preventiva", "Vermelho"),
-    ("Tabagismo", "Preventiva", "Amarelo"),
-    ("Abdome Agudo Obstrutivo", "Cirurgia", "Diamante"),
-    ("Abdome Agudo Perfurativo, Vascular e Hemorrágico", "Cirurgia", "Vermelho"),
-    ("Câncer de Estômago", "Cirurgia", "Vermelho"),
-    ("HAS: Ambulatorial e Emergências", "Clínica Médica", "Diamante"),
-    ("Insuficiência Cardíaca", "Clínica Médica", "Diamante"),
-    ("Espirometria e Asma", "Clínica Médica", "Diamante"),
-    ("DPOC", "Clínica Médica", "Diamante"),
-    ("BLS e ACLS", "Clínica Médica", "Diamante"),
-    ("Síndromes Hipertensivas na Gestação", "Ginecologia e Obstetrícia", "Diamante"),
-    
-    # --- BLOCO 11 ---
-    ("Sangramento Uterino Anormal", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Suporte Avançado de Vida em Pediatria (PALS)", "Pediatria", "Amarelo"),
-    ("Cardiopatias Congênitas", "Pediatria", "Vermelho"),
-    ("HAS na Pediatria", "Pediatria", "Verde"),
-    ("Miocardite, Síncope, IC (Ped)", "Pediatria", "Verde"),
-    ("Medidas de Associação", "Preventiva", "Diamante"),
-    ("Legislação do SUS 3: Decreto 7508/11", "Preventiva", "Diamante"),
-    ("Rede de Atenção Psicossocial (RAPS)", "Preventiva", "Amarelo"),
-    ("Anatomia da Parede Abdominal e Hérnia Inguinal", "Cirurgia", "Diamante"),
-    ("Hernioplastia Inguinal", "Cirurgia", "Diamante"),
-    ("Outras Neoplasias Gástricas", "Cirurgia", "Verde"),
-    ("Enxertos e Retalhos", "Cirurgia", "Verde"),
-    ("Diabetes: Diagnóstico e Metas", "Clínica Médica", "Diamante"),
-    ("Diabetes: Tratamento", "Clínica Médica", "Diamante"),
-    ("Emergências Hiperglicêmicas (CAD e EHH)", "Clínica Médica", "Diamante"),
-    ("Diabetes na Gestação", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Infertilidade", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Endometriose", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Arboviroses (Ped)", "Pediatria", "Vermelho"),
-    ("Doenças Exantemáticas", "Pediatria", "Diamante"),
-    ("Cetoacidose Diabética (Ped)", "Pediatria", "Diamante"),
-    ("Financiamento do SUS", "Preventiva", "Amarelo"),
-    ("Ensaios Clínicos", "Preventiva", "Diamante"),
-    ("Ética em Pesquisa Clínica", "Preventiva", "Vermelho"),
-    
-    # --- BLOCO 12 ---
-    ("Síndrome Compartimental Intra-Abdominal", "Cirurgia", "Verde"),
-    ("Hérnias Incisionais", "Cirurgia", "Amarelo"),
-    ("Outras Hérnias", "Cirurgia", "Vermelho"),
-    ("Urgências endoscópicas", "Cirurgia", "Amarelo"),
-    ("Síndrome Metabólica e Obesidade", "Clínica Médica", "Amarelo"),
-    ("Dislipidemias", "Clínica Médica", "Vermelho"),
-    ("Doença Hepática Esteatótica Metabólica", "Clínica Médica", "Amarelo"),
-    ("Incontinência Urinária", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Prolapso Genital", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Triagens Neonatais", "Pediatria", "Vermelho"),
-    ("Distúrbios Metabólicos Neonatais", "Pediatria", "Vermelho"),
-    ("Peçonhentos, Raiva e Tétano (Ped)", "Pediatria", "Amarelo"),
-    ("Ingestão de Corpo Estranho e BRUE", "Pediatria", "Vermelho"),
-    ("Significância Estatística: Valor-p e IC", "Preventiva", "Diamante"),
-    ("Revisão Sistemática e Metanálise", "Preventiva", "Vermelho"),
-    ("Medicina Baseada em Evidências", "Preventiva", "Diamante"),
-    ("Pré-Operatório", "Cirurgia", "Diamante"),
-    ("Uro-Oncologia", "Cirurgia", "Amarelo"),
-    ("Cirurgia Bariátrica", "Cirurgia", "Diamante"),
-    
-    # --- BLOCO 13 ---
-    ("Vasculites", "Clínica Médica", "Vermelho"),
-    ("Tuberculose: clínica e diagnóstico", "Clínica Médica", "Diamante"),
-    ("Tuberculose: tratamento", "Clínica Médica", "Diamante"),
-    ("Avaliação de Vitalidade Fetal", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Restrição de Crescimento Intrauterino", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Sofrimento Fetal Crônico", "Ginecologia e Obstetrícia", "Verde"),
-    ("Gemelaridade", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Convulsão na Emergência e Convulsão Febril", "Pediatria", "Vermelho"),
-    ("Tuberculose (Ped)", "Pediatria", "Vermelho"),
-    ("Diabetes no SUS", "Preventiva", "Verde"),
-    ("Estratégia da Saúde da Família", "Preventiva", "Diamante"),
-    ("REMIT e pós-operatório", "Cirurgia", "Diamante"),
-    ("Complicações pós-operatórias gerais", "Cirurgia", "Diamante"),
-    ("Fraturas de face", "Cirurgia", "Verde"),
-    ("Hiperplasia prostática benigna", "Cirurgia", "Vermelho"),
+    ("BLOCO 9", [
+        ("Avaliação Geriátrica Ampla", "Clínica Médica", "Amarelo"),
+        ("Grandes Síndromes Geriátricas", "Clínica Médica", "Vermelho"),
+        ("Avaliação de enzimas hepáticas", "Clínica Médica", "Verde"),
+        ("Doenças hepáticas: CBP, CEP, HAI, Wilson", "Clínica Médica", "Verde"),
+        ("Abortamento", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Gestação Ectópica", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Doença Trofoblástica Gestacional", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Dermatite Atópica (Ped)", "Pediatria", "Verde"),
+        ("Dermatoses e Infecções de Partes Moles (Ped)", "Pediatria", "Vermelho"),
+        ("Legislação do SUS I: Leis Orgânicas", "Preventiva", "Diamante"),
+        ("Pancreatite Aguda", "Cirurgia", "Diamante"),
+        ("Diverticulite Aguda", "Cirurgia", "Diamante"),
+        ("Abscesso Hepático", "Cirurgia", "Verde"),
+        ("Disfagia e Acalasia", "Cirurgia", "Amarelo"),
+        ("Hernias de Hiato", "Cirurgia", "Vermelho"),
+    ]),
 
-    # --- BLOCO 14 ---
-    ("Meningites & Encefalites", "Clínica Médica", "Diamante"),
-    ("Doenças Neuromusculares e Parkinson", "Clínica Médica", "Amarelo"),
-    ("Taquiarritmias", "Clínica Médica", "Vermelho"),
-    ("Bradiarritimias", "Clínica Médica", "Vermelho"),
-    ("Síncope", "Clínica Médica", "Amarelo"),
-    ("Doenças Valvares", "Clínica Médica", "Vermelho"),
-    ("Cardiopatias na Gravidez", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Anticoncepção", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Kawasaki, Vasculite por IgA e Febre Reumática", "Pediatria", "Diamante"),
-    ("Artrite Idiopática Juvenil", "Pediatria", "Amarelo"),
-    ("Meningite e Encefalite (Ped)", "Pediatria", "Diamante"),
-    ("Financiamento da APS", "Preventiva", "Vermelho"),
-    ("Síndrome Depressiva", "Clínica Médica", "Diamante"),
-    ("Síndrome Maníaca", "Clínica Médica", "Vermelho"),
-    ("Câncer colorretal e Síndromes associadas", "Cirurgia", "Diamante"),
-    ("Doenças Orificiais e CEC de Canal Anal", "Cirurgia", "Diamante"),
-    ("Doenças da Vesícula Biliar", "Cirurgia", "Diamante"),
+    ("BLOCO 10", [
+        ("Coagulação e Hemostasia", "Clínica Médica", "Verde"),
+        ("Hemoterapia", "Clínica Médica", "Verde"),
+        ("Cirrose Hepática I e II", "Clínica Médica", "Diamante"),
+        ("Pneumonia Adquirida na Comunidade", "Clínica Médica", "Diamante"),
+        ("Derrame Pleural", "Clínica Médica", "Vermelho"),
+        ("Placenta Prévia", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Descolamento Prematuro de Placenta", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Sangramentos da Segunda Metade da Gestação", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Anemia Falciforme (Ped)", "Pediatria", "Vermelho"),
+        ("Anemia Ferropriva e Talassemia (Ped)", "Pediatria", "Vermelho"),
+        ("Distúrbios Hemorrágicos (Ped)", "Pediatria", "Verde"),
+        ("Genética (Ped)", "Pediatria", "Verde"),
+        ("Legislação do SUS II: NOBS, NOAS", "Preventiva", "Vermelho"),
+        ("Tabagismo", "Preventiva", "Amarelo"),
+        ("Abdome Agudo Obstrutivo", "Cirurgia", "Diamante"),
+        ("Abdome Agudo Perfurativo, Vascular e Hemorrágico", "Cirurgia", "Vermelho"),
+        ("Câncer de Estômago", "Cirurgia", "Vermelho"),
+        ("HAS: Ambulatorial e Emergências", "Clínica Médica", "Diamante"),
+        ("Insuficiência Cardíaca", "Clínica Médica", "Diamante"),
+        ("Espirometria e Asma", "Clínica Médica", "Diamante"),
+        ("DPOC", "Clínica Médica", "Diamante"),
+        ("BLS e ACLS", "Clínica Médica", "Diamante"),
+        ("Síndromes Hipertensivas na Gestação", "Ginecologia e Obstetrícia", "Diamante"),
+    ]),
 
-    # --- BLOCO 15 ---
-    ("Via aérea, intubação e VNI", "Clínica Médica", "Vermelho"),
-    ("Síndrome do Desconforto Respiratório Agudo (SDRA)", "Clínica Médica", "Vermelho"),
-    ("Ventilação Mecânica", "Clínica Médica", "Amarelo"),
-    ("Infecções Nosocomiais", "Clínica Médica", "Verde"),
-    ("Choque", "Clínica Médica", "Diamante"),
-    ("Drogas Vasoativas e Sedoanalgesia", "Clínica Médica", "Vermelho"),
-    ("Vacinação (Adulto/Geral)", "Preventiva", "Diamante"), 
-    ("Propedêutica Mamária", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Principais Sintomas em Mastologia", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Classificação das Lesões Benignas da Mama", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Vacinação (Ped)", "Pediatria", "Diamante"),
-    ("HIV (Ped)", "Pediatria", "Vermelho"),
-    ("Ortopedia Pediátrica", "Pediatria", "Amarelo"),
-    ("Osteomielite e Artrite Séptica (Ped)", "Pediatria", "Amarelo"),
-    ("Ferramentas da APS/ESF", "Preventiva", "Diamante"),
-    ("Síndrome Ansiosa", "Clínica Médica", "Amarelo"),
-    ("Fígado para perdidos (Anatomia Cirúrgica)", "Cirurgia", "Verde"),
-    ("Nódulos hepáticos benignos", "Cirurgia", "Verde"),
-    ("Ferimento descolante", "Cirurgia", "Verde"),
+    ("BLOCO 11", [
+        ("Sangramento Uterino Anormal", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Suporte Avançado de Vida em Pediatria (PALS)", "Pediatria", "Amarelo"),
+        ("Cardiopatias Congênitas", "Pediatria", "Vermelho"),
+        ("HAS na Pediatria", "Pediatria", "Verde"),
+        ("Miocardite, Síncope, IC (Ped)", "Pediatria", "Verde"),
+        ("Medidas de Associação", "Preventiva", "Diamante"),
+        ("Legislação do SUS 3: Decreto 7508/11", "Preventiva", "Diamante"),
+        ("Rede de Atenção Psicossocial (RAPS)", "Preventiva", "Amarelo"),
+        ("Anatomia da Parede Abdominal e Hérnia Inguinal", "Cirurgia", "Diamante"),
+        ("Hernioplastia Inguinal", "Cirurgia", "Diamante"),
+        ("Outras Neoplasias Gástricas", "Cirurgia", "Verde"),
+        ("Enxertos e Retalhos", "Cirurgia", "Verde"),
+        ("Diabetes: Diagnóstico e Metas", "Clínica Médica", "Diamante"),
+        ("Diabetes: Tratamento", "Clínica Médica", "Diamante"),
+        ("Emergências Hiperglicêmicas (CAD e EHH)", "Clínica Médica", "Diamante"),
+        ("Diabetes na Gestação", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Infertilidade", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Endometriose", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Arboviroses (Ped)", "Pediatria", "Vermelho"),
+        ("Doenças Exantemáticas", "Pediatria", "Diamante"),
+        ("Cetoacidose Diabética (Ped)", "Pediatria", "Diamante"),
+        ("Financiamento do SUS", "Preventiva", "Amarelo"),
+        ("Ensaios Clínicos", "Preventiva", "Diamante"),
+        ("Ética em Pesquisa Clínica", "Preventiva", "Vermelho"),
+    ]),
 
-    # --- BLOCO 16 ---
-    ("Injúria Renal (LRA)", "Clínica Médica", "Diamante"),
-    ("Diarreia Agudas e Colite Pseudomembranosa", "Clínica Médica", "Diamante"),
-    ("Diarreias Crônicas", "Clínica Médica", "Vermelho"),
-    ("Doença Inflamatória Intestinal (DII)", "Clínica Médica", "Amarelo"),
-    ("Doenças Negligenciadas", "Clínica Médica", "Amarelo"),
-    ("Trabalho de Parto Prematuro", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Colo Curto e Incompetência Istmocervical", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Hiperplasia Adrenal Congênita (HAC)", "Pediatria", "Amarelo"),
-    ("Hipotireoidismo (Ped)", "Pediatria", "Amarelo"),
-    ("Diferenças no Desenvolvimento Sexual (DDS)", "Pediatria", "Verde"),
-    ("Nutrologia em Pediatria", "Pediatria", "Verde"),
-    ("Telessaúde e Publicidade Médica", "Preventiva", "Verde"),
-    ("Método Clínico Centrado na Pessoa e Comunicação", "Preventiva", "Diamante"),
-    ("Litíase Renal", "Cirurgia", "Diamante"),
-    ("Carcinoma Hepatocelular", "Cirurgia", "Amarelo"),
-    ("Aneurisma de Aorta", "Cirurgia", "Vermelho"),
+    ("BLOCO 12", [
+        ("Síndrome Compartimental Intra-Abdominal", "Cirurgia", "Verde"),
+        ("Hérnias Incisionais", "Cirurgia", "Amarelo"),
+        ("Outras Hérnias", "Cirurgia", "Vermelho"),
+        ("Urgências endoscópicas", "Cirurgia", "Amarelo"),
+        ("Síndrome Metabólica e Obesidade", "Clínica Médica", "Amarelo"),
+        ("Dislipidemias", "Clínica Médica", "Vermelho"),
+        ("Doença Hepática Esteatótica Metabólica", "Clínica Médica", "Amarelo"),
+        ("Incontinência Urinária", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Prolapso Genital", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Triagens Neonatais", "Pediatria", "Vermelho"),
+        ("Distúrbios Metabólicos Neonatais", "Pediatria", "Vermelho"),
+        ("Peçonhentos, Raiva e Tétano (Ped)", "Pediatria", "Amarelo"),
+        ("Ingestão de Corpo Estranho e BRUE", "Pediatria", "Vermelho"),
+        ("Significância Estatística: Valor-p e IC", "Preventiva", "Diamante"),
+        ("Revisão Sistemática e Metanálise", "Preventiva", "Vermelho"),
+        ("Medicina Baseada em Evidências", "Preventiva", "Diamante"),
+        ("Pré-Operatório", "Cirurgia", "Diamante"),
+        ("Uro-Oncologia", "Cirurgia", "Amarelo"),
+        ("Cirurgia Bariátrica", "Cirurgia", "Diamante"),
+    ]),
 
-    # --- BLOCO 17 ---
-    ("Lúpus Eritematoso Sistêmico", "Clínica Médica", "Vermelho"),
-    ("Osteoporose", "Clínica Médica", "Diamante"),
-    ("Esclerose Sistêmica", "Clínica Médica", "Verde"),
-    ("Doença de Sjögren", "Clínica Médica", "Verde"),
-    ("Miopatias Autoimunes Sistêmicas", "Clínica Médica", "Verde"),
-    ("Glomerulopatias", "Clínica Médica", "Diamante"),
-    ("Intoxicações Exógenas", "Clínica Médica", "Diamante"),
-    ("Hemorragia Pós-Parto", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Puerpério", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Asma (Ped)", "Pediatria", "Diamante"),
-    ("Fibrose Cística e Diferenciais", "Pediatria", "Vermelho"),
-    ("Imunodeficiências para o Pediatra", "Pediatria", "Verde"),
-    ("Vigilância em Saúde", "Preventiva", "Diamante"),
-    ("Registro de Saúde Orientado por Problemas (ReSOAP)", "Preventiva", "Amarelo"),
-    ("Metástases hepáticas de câncer colorretal", "Cirurgia", "Verde"),
-    ("Adenocarcinoma de pâncreas e tumores periampulares", "Cirurgia", "Vermelho"),
-    ("Quiz: Fígado e Vias Biliares", "Cirurgia", "Verde"),
+    ("BLOCO 13", [
+        ("Vasculites", "Clínica Médica", "Vermelho"),
+        ("Tuberculose: clínica e diagnóstico", "Clínica Médica", "Diamante"),
+        ("Tuberculose: tratamento", "Clínica Médica", "Diamante"),
+        ("Avaliação de Vitalidade Fetal", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Restrição de Crescimento Intrauterino", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Sofrimento Fetal Crônico", "Ginecologia e Obstetrícia", "Verde"),
+        ("Gemelaridade", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Convulsão na Emergência e Convulsão Febril", "Pediatria", "Vermelho"),
+        ("Tuberculose (Ped)", "Pediatria", "Vermelho"),
+        ("Diabetes no SUS", "Preventiva", "Verde"),
+        ("Estratégia da Saúde da Família", "Preventiva", "Diamante"),
+        ("REMIT e pós-operatório", "Cirurgia", "Diamante"),
+        ("Complicações pós-operatórias gerais", "Cirurgia", "Diamante"),
+        ("Fraturas de face", "Cirurgia", "Verde"),
+        ("Hiperplasia prostática benigna", "Cirurgia", "Vermelho"),
+    ]),
 
-    # --- BLOCO 18 ---
-    ("HIV e Doenças Oportunistas", "Clínica Médica", "Diamante"),
-    ("Fisiologia da Tireoide e Hipotireoidismo", "Clínica Médica", "Diamante"),
-    ("Hipertireoidismo e Tireotoxicose", "Clínica Médica", "Diamante"),
-    ("Epilepsia", "Clínica Médica", "Amarelo"),
-    ("Esclerose Múltipla e Neuromielite Óptica", "Clínica Médica", "Verde"),
-    ("Câncer de Colo de Útero: Rastreamento", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Câncer de Colo de Útero: Diagnóstico e Tratamento", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Doenças da Vulva e da Vagina", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Sepse Neonatal", "Pediatria", "Vermelho"),
-    ("Desconforto Respiratório Neonatal", "Pediatria", "Diamante"),
-    ("Outras Doenças Neonatais", "Pediatria", "Amarelo"),
-    ("Nutrição do Pré-Termo", "Pediatria", "Verde"),
-    ("Processo Epidêmico", "Preventiva", "Vermelho"),
-    ("Abordagem Familiar e Comunitária", "Preventiva", "Diamante"),
-    ("Síndrome de Fournier", "Cirurgia", "Verde"),
-    ("Ortopedia Geral", "Cirurgia", "Verde"),
-    ("Trombose Venosa Profunda (TVP)", "Cirurgia", "Amarelo"),
-    ("Pneumotórax (Cirúrgico)", "Cirurgia", "Verde"),
+    ("BLOCO 14", [
+        ("Meningites & Encefalites", "Clínica Médica", "Diamante"),
+        ("Doenças Neuromusculares e Parkinson", "Clínica Médica", "Amarelo"),
+        ("Taquiarritmias", "Clínica Médica", "Vermelho"),
+        ("Bradiarritimias", "Clínica Médica", "Vermelho"),
+        ("Síncope", "Clínica Médica", "Amarelo"),
+        ("Doenças Valvares", "Clínica Médica", "Vermelho"),
+        ("Cardiopatias na Gravidez", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Anticoncepção", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Kawasaki, Vasculite por IgA e Febre Reumática", "Pediatria", "Diamante"),
+        ("Artrite Idiopática Juvenil", "Pediatria", "Amarelo"),
+        ("Meningite e Encefalite (Ped)", "Pediatria", "Diamante"),
+        ("Financiamento da APS", "Preventiva", "Vermelho"),
+        ("Síndrome Depressiva", "Clínica Médica", "Diamante"),
+        ("Síndrome Maníaca", "Clínica Médica", "Vermelho"),
+        ("Câncer colorretal e Síndromes associadas", "Cirurgia", "Diamante"),
+        ("Doenças Orificiais e CEC de Canal Anal", "Cirurgia", "Diamante"),
+        ("Doenças da Vesícula Biliar", "Cirurgia", "Diamante"),
+    ]),
 
-    # --- BLOCO 19 ---
-    ("Tromboembolismo Pulmonar (TEP)", "Clínica Médica", "Diamante"),
-    ("Distúrbios do Sono", "Clínica Médica", "Verde"),
-    ("Doença Pulmonar Intersticial (DPI)", "Clínica Médica", "Amarelo"),
-    ("Nódulo Pulmonar", "Clínica Médica", "Amarelo"),
-    ("Adrenal", "Clínica Médica", "Verde"),
-    ("Síndrome de Cushing", "Clínica Médica", "Verde"),
-    ("Disfagia, Esofagite Eosinofilica e Acalasias", "Clínica Médica", "Verde"),
-    ("Câncer de Mama: Rastreamento", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Câncer de Mama: Fatores de Risco e CDIS", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Câncer de Mama: Doença Invasiva", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Parasitoses Intestinais (Ped)", "Pediatria", "Diamante"),
-    ("Neoplasias Pediátricas", "Pediatria", "Amarelo"),
-    ("Acidente de Trabalho", "Preventiva", "Diamante"),
-    ("Síndrome Psicótica", "Clínica Médica", "Vermelho"),
-    ("Psicofarmacologia", "Clínica Médica", "Amarelo"),
-    ("Oncocirurgia Geral", "Cirurgia", "Verde"),
-    ("Isquemia de Membros Inferiores", "Cirurgia", "Diamante"),
+    ("BLOCO 15", [
+        ("Via aérea, intubação e VNI", "Clínica Médica", "Vermelho"),
+        ("Síndrome do Desconforto Respiratório Agudo (SDRA)", "Clínica Médica", "Vermelho"),
+        ("Ventilação Mecânica", "Clínica Médica", "Amarelo"),
+        ("Infecções Nosocomiais", "Clínica Médica", "Verde"),
+        ("Choque", "Clínica Médica", "Diamante"),
+        ("Drogas Vasoativas e Sedoanalgesia", "Clínica Médica", "Vermelho"),
+        ("Vacinação (Adulto/Geral)", "Preventiva", "Diamante"), 
+        ("Propedêutica Mamária", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Principais Sintomas em Mastologia", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Classificação das Lesões Benignas da Mama", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Vacinação (Ped)", "Pediatria", "Diamante"),
+        ("HIV (Ped)", "Pediatria", "Vermelho"),
+        ("Ortopedia Pediátrica", "Pediatria", "Amarelo"),
+        ("Osteomielite e Artrite Séptica (Ped)", "Pediatria", "Amarelo"),
+        ("Ferramentas da APS/ESF", "Preventiva", "Diamante"),
+        ("Síndrome Ansiosa", "Clínica Médica", "Amarelo"),
+        ("Fígado para perdidos (Anatomia Cirúrgica)", "Cirurgia", "Verde"),
+        ("Nódulos hepáticos benignos", "Cirurgia", "Verde"),
+        ("Ferimento descolante", "Cirurgia", "Verde"),
+    ]),
 
-    # --- BLOCO 20 ---
-    ("Infecção do Trato Urinário (ITU)", "Clínica Médica", "Diamante"),
-    ("Distúrbios Hidroeletrolíticos (Ca, P, Mg)", "Clínica Médica", "Vermelho"),
-    ("Doença Renal Crônica", "Clínica Médica", "Diamante"),
-    ("Síndrome Climatérica", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Terapia Hormonal", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Tumores Anexiais", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Câncer de Ovário", "Ginecologia e Obstetrícia", "Diamante"),
-    ("ITU na Pediatria", "Pediatria", "Diamante"),
-    ("Sedoanalgesia e Intubação (Ped)", "Pediatria", "Verde"),
-    ("Sepse Pediátrica", "Pediatria", "Vermelho"),
-    ("Choque e Drogas Vasoativas (Ped)", "Pediatria", "Verde"),
-    ("Pneumoconioses", "Preventiva", "Amarelo"),
-    ("Tuberculose e Hanseníase na APS", "Preventiva", "Amarelo"),
-    ("Saúde Socioecológica e Global", "Preventiva", "Verde"),
-    ("Cirurgia: Resumão/Encerramento", "Cirurgia", "Diamante"),
-    ("Neoplasias Císticas Pancreáticas", "Cirurgia", "Amarelo"),
-    ("Pancreatite Crônica", "Cirurgia", "Verde"),
-    ("Trauma Vascular", "Cirurgia", "Diamante"),
-    ("Estenose Carotídea", "Cirurgia", "Verde"),
-    ("Câncer de Pulmão (Cirúrgico)", "Cirurgia", "Amarelo"),
+    ("BLOCO 16", [
+        ("Injúria Renal (LRA)", "Clínica Médica", "Diamante"),
+        ("Diarreia Agudas e Colite Pseudomembranosa", "Clínica Médica", "Diamante"),
+        ("Diarreias Crônicas", "Clínica Médica", "Vermelho"),
+        ("Doença Inflamatória Intestinal (DII)", "Clínica Médica", "Amarelo"),
+        ("Doenças Negligenciadas", "Clínica Médica", "Amarelo"),
+        ("Trabalho de Parto Prematuro", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Colo Curto e Incompetência Istmocervical", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Hiperplasia Adrenal Congênita (HAC)", "Pediatria", "Amarelo"),
+        ("Hipotireoidismo (Ped)", "Pediatria", "Amarelo"),
+        ("Diferenças no Desenvolvimento Sexual (DDS)", "Pediatria", "Verde"),
+        ("Nutrologia em Pediatria", "Pediatria", "Verde"),
+        ("Telessaúde e Publicidade Médica", "Preventiva", "Verde"),
+        ("Método Clínico Centrado na Pessoa e Comunicação", "Preventiva", "Diamante"),
+        ("Litíase Renal", "Cirurgia", "Diamante"),
+        ("Carcinoma Hepatocelular", "Cirurgia", "Amarelo"),
+        ("Aneurisma de Aorta", "Cirurgia", "Vermelho"),
+    ]),
 
-    # --- BLOCO 21 ---
-    ("Depressão e Delirium no Idoso", "Clínica Médica", "Amarelo"),
-    ("Insuficiência Cognitiva: Demências", "Clínica Médica", "Diamante"),
-    ("Hiperplasia Endometrial", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Câncer de Endométrio", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Intercorrências Clínicas na Gestação", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Cirurgia Pediátrica no PS", "Pediatria", "Vermelho"),
-    ("Uropediatria e Hérnias", "Pediatria", "Amarelo"),
-    ("Malformações Congênitas", "Pediatria", "Verde"),
-    ("Declaração de Óbito, Atestados e Laudos", "Preventiva", "Diamante"),
-    ("Atenção à Saúde de Populações Específicas", "Preventiva", "Verde"),
-    ("Videolaparoscopia e Eletrocirurgia", "Cirurgia", "Verde"),
-    ("Tumores Neuroendócrinos (Pâncreas/Vias Biliares)", "Cirurgia", "Verde"),
-    ("Nutrição Perioperatória", "Cirurgia", "Verde"),
-    ("Diagnósticos Diferenciais das Massas Cervicais", "Cirurgia", "Amarelo"),
-    ("Insuficiência Venosa Crônica", "Cirurgia", "Amarelo"),
-    ("Síndromes Compressivas Vasculares", "Cirurgia", "Verde"),
+    ("BLOCO 17", [
+        ("Lúpus Eritematoso Sistêmico", "Clínica Médica", "Vermelho"),
+        ("Osteoporose", "Clínica Médica", "Diamante"),
+        ("Esclerose Sistêmica", "Clínica Médica", "Verde"),
+        ("Doença de Sjögren", "Clínica Médica", "Verde"),
+        ("Miopatias Autoimunes Sistêmicas", "Clínica Médica", "Verde"),
+        ("Glomerulopatias", "Clínica Médica", "Diamante"),
+        ("Intoxicações Exógenas", "Clínica Médica", "Diamante"),
+        ("Hemorragia Pós-Parto", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Puerpério", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Asma (Ped)", "Pediatria", "Diamante"),
+        ("Fibrose Cística e Diferenciais", "Pediatria", "Vermelho"),
+        ("Imunodeficiências para o Pediatra", "Pediatria", "Verde"),
+        ("Vigilância em Saúde", "Preventiva", "Diamante"),
+        ("Registro de Saúde Orientado por Problemas (ReSOAP)", "Preventiva", "Amarelo"),
+        ("Metástases hepáticas de câncer colorretal", "Cirurgia", "Verde"),
+        ("Adenocarcinoma de pâncreas e tumores periampulares", "Cirurgia", "Vermelho"),
+        ("Quiz: Fígado e Vias Biliares", "Cirurgia", "Verde"),
+    ]),
 
-    # --- BLOCO 22 ---
-    ("Doenças Virais e Pandêmicas", "Clínica Médica", "Verde"),
-    ("Arboviroses (Adulto)", "Clínica Médica", "Diamante"),
-    ("Icterícias Febris e Febre Maculosa", "Clínica Médica", "Amarelo"),
-    ("Hepatites Virais", "Clínica Médica", "Amarelo"),
-    ("Técnicas de Reprodução Assistida", "Ginecologia e Obstetrícia", "Verde"),
-    ("Cuidado à Saúde LGBTQIAPN+", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Medicina do Adolescente", "Pediatria", "Vermelho"),
-    ("Ética em Pediatria", "Pediatria", "Verde"),
-    ("Ética Médica", "Preventiva", "Diamante"),
-    ("Intoxicações, PAIRO e Burnout", "Preventiva", "Vermelho"),
-    ("Dermatologia na APS", "Preventiva", "Verde"),
-    ("Tumores do Intestino Delgado", "Cirurgia", "Verde"),
-    ("Doenças Cirúrgicas do Baço", "Cirurgia", "Verde"),
-    ("CEC de Cabeça e Pescoço", "Cirurgia", "Verde"),
-    ("Doenças Traqueais", "Cirurgia", "Verde"),
-    ("Bronquiectasias e Hemoptise (Cirurgia)", "Cirurgia", "Verde"),
+    ("BLOCO 18", [
+        ("HIV e Doenças Oportunistas", "Clínica Médica", "Diamante"),
+        ("Fisiologia da Tireoide e Hipotireoidismo", "Clínica Médica", "Diamante"),
+        ("Hipertireoidismo e Tireotoxicose", "Clínica Médica", "Diamante"),
+        ("Epilepsia", "Clínica Médica", "Amarelo"),
+        ("Esclerose Múltipla e Neuromielite Óptica", "Clínica Médica", "Verde"),
+        ("Câncer de Colo de Útero: Rastreamento", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Câncer de Colo de Útero: Diagnóstico e Tratamento", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Doenças da Vulva e da Vagina", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Sepse Neonatal", "Pediatria", "Vermelho"),
+        ("Desconforto Respiratório Neonatal", "Pediatria", "Diamante"),
+        ("Outras Doenças Neonatais", "Pediatria", "Amarelo"),
+        ("Nutrição do Pré-Termo", "Pediatria", "Verde"),
+        ("Processo Epidêmico", "Preventiva", "Vermelho"),
+        ("Abordagem Familiar e Comunitária", "Preventiva", "Diamante"),
+        ("Síndrome de Fournier", "Cirurgia", "Verde"),
+        ("Ortopedia Geral", "Cirurgia", "Verde"),
+        ("Trombose Venosa Profunda (TVP)", "Cirurgia", "Amarelo"),
+        ("Pneumotórax (Cirúrgico)", "Cirurgia", "Verde"),
+    ]),
 
-    # --- BLOCO 23 ---
-    ("Hiperaldosteronismo Primário", "Clínica Médica", "Verde"),
-    ("Feocromocitoma", "Clínica Médica", "Verde"),
-    ("Prolactinomas", "Clínica Médica", "Verde"),
-    ("Oncohematologia", "Clínica Médica", "Vermelho"),
-    ("Cirurgia Ginecológica: Princípios e Complicações", "Ginecologia e Obstetrícia", "Verde"),
-    ("Transtornos Psiquiátricos na Gestação/Pós-parto", "Ginecologia e Obstetrícia", "Verde"),
-    ("Emergências Psiquiátricas", "Clínica Médica", "Diamante"),
-    ("Violências e Vulnerabilidade", "Preventiva", "Amarelo"),
-    ("Saúde Privada, Suplementar e Judicialização", "Preventiva", "Verde"),
-    ("Psiquiatria da Infância e Adolescência", "Pediatria", "Verde"),
-    ("Epilepsias na Infância", "Pediatria", "Verde"),
-    ("Cisto Pilonidal", "Cirurgia", "Verde"),
-    ("Anomalias Congênitas em Cabeça e Pescoço", "Cirurgia", "Verde"),
-    ("Mediastino", "Cirurgia", "Verde"),
+    ("BLOCO 19", [
+        ("Tromboembolismo Pulmonar (TEP)", "Clínica Médica", "Diamante"),
+        ("Distúrbios do Sono", "Clínica Médica", "Verde"),
+        ("Doença Pulmonar Intersticial (DPI)", "Clínica Médica", "Amarelo"),
+        ("Nódulo Pulmonar", "Clínica Médica", "Amarelo"),
+        ("Adrenal", "Clínica Médica", "Verde"),
+        ("Síndrome de Cushing", "Clínica Médica", "Verde"),
+        ("Disfagia, Esofagite Eosinofilica e Acalasias", "Clínica Médica", "Verde"),
+        ("Câncer de Mama: Rastreamento", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Câncer de Mama: Fatores de Risco e CDIS", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Câncer de Mama: Doença Invasiva", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Parasitoses Intestinais (Ped)", "Pediatria", "Diamante"),
+        ("Neoplasias Pediátricas", "Pediatria", "Amarelo"),
+        ("Acidente de Trabalho", "Preventiva", "Diamante"),
+        ("Síndrome Psicótica", "Clínica Médica", "Vermelho"),
+        ("Psicofarmacologia", "Clínica Médica", "Amarelo"),
+        ("Oncocirurgia Geral", "Cirurgia", "Verde"),
+        ("Isquemia de Membros Inferiores", "Cirurgia", "Diamante"),
+    ]),
 
-    # --- BLOCO 24 ---
-    ("Dermatologia", "Clínica Médica", "Amarelo"),
-    ("Medicina Fetal (G.O)", "Ginecologia e Obstetrícia", "Vermelho"),
-    ("Otites, Perda Auditiva, Rinossinusites (Ped)", "Pediatria", "Amarelo"),
-    ("Rinites e Afecções da Laringe e Faringe (Ped)", "Pediatria", "Amarelo"),
-    ("Transtornos Alimentares e de Personalidade", "Clínica Médica", "Vermelho"),
-    ("Endoscopia", "Cirurgia", "Verde"),
-    ("Cabeça e Pescoço: Tireóide e Paratireóide", "Cirurgia", "Vermelho"),
+    ("BLOCO 20", [
+        ("Infecção do Trato Urinário (ITU)", "Clínica Médica", "Diamante"),
+        ("Distúrbios Hidroeletrolíticos (Ca, P, Mg)", "Clínica Médica", "Vermelho"),
+        ("Doença Renal Crônica", "Clínica Médica", "Diamante"),
+        ("Síndrome Climatérica", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Terapia Hormonal", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Tumores Anexiais", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Câncer de Ovário", "Ginecologia e Obstetrícia", "Diamante"),
+        ("ITU na Pediatria", "Pediatria", "Diamante"),
+        ("Sedoanalgesia e Intubação (Ped)", "Pediatria", "Verde"),
+        ("Sepse Pediátrica", "Pediatria", "Vermelho"),
+        ("Choque e Drogas Vasoativas (Ped)", "Pediatria", "Verde"),
+        ("Pneumoconioses", "Preventiva", "Amarelo"),
+        ("Tuberculose e Hanseníase na APS", "Preventiva", "Amarelo"),
+        ("Saúde Socioecológica e Global", "Preventiva", "Verde"),
+        ("Cirurgia: Resumão/Encerramento", "Cirurgia", "Diamante"),
+        ("Neoplasias Císticas Pancreáticas", "Cirurgia", "Amarelo"),
+        ("Pancreatite Crônica", "Cirurgia", "Verde"),
+        ("Trauma Vascular", "Cirurgia", "Diamante"),
+        ("Estenose Carotídea", "Cirurgia", "Verde"),
+        ("Câncer de Pulmão (Cirúrgico)", "Cirurgia", "Amarelo"),
+    ]),
 
-    # --- BLOCO 25 ---
-    ("Neurocirurgia", "Cirurgia", "Verde"),
-    ("Otologia I", "Cirurgia", "Amarelo"),
-    ("Otologia II", "Cirurgia", "Verde"),
-    ("Oftalmologia para o Generalista I", "Cirurgia", "Verde"),
-    ("Trombofilias na Gestação e Puerpério", "Ginecologia e Obstetrícia", "Amarelo"),
-    ("Doença Hemolítica Perinatal", "Ginecologia e Obstetrícia", "Diamante"),
-    ("Oftalmopediatria", "Pediatria", "Verde"),
-    ("Saúde do Trabalhador", "Preventiva", "Diamante"),
-    ("Anestesiologia", "Cirurgia", "Amarelo"),
+    ("BLOCO 21", [
+        ("Depressão e Delirium no Idoso", "Clínica Médica", "Amarelo"),
+        ("Insuficiência Cognitiva: Demências", "Clínica Médica", "Diamante"),
+        ("Hiperplasia Endometrial", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Câncer de Endométrio", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Intercorrências Clínicas na Gestação", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Cirurgia Pediátrica no PS", "Pediatria", "Vermelho"),
+        ("Uropediatria e Hérnias", "Pediatria", "Amarelo"),
+        ("Malformações Congênitas", "Pediatria", "Verde"),
+        ("Declaração de Óbito, Atestados e Laudos", "Preventiva", "Diamante"),
+        ("Atenção à Saúde de Populações Específicas", "Preventiva", "Verde"),
+        ("Videolaparoscopia e Eletrocirurgia", "Cirurgia", "Verde"),
+        ("Tumores Neuroendócrinos (Pâncreas/Vias Biliares)", "Cirurgia", "Verde"),
+        ("Nutrição Perioperatória", "Cirurgia", "Verde"),
+        ("Diagnósticos Diferenciais das Massas Cervicais", "Cirurgia", "Amarelo"),
+        ("Insuficiência Venosa Crônica", "Cirurgia", "Amarelo"),
+        ("Síndromes Compressivas Vasculares", "Cirurgia", "Verde"),
+    ]),
 
-    # --- BLOCO 26 (Reta Final) ---
-    ("Rinologia", "Cirurgia", "Amarelo"),
-    ("Bucofaringolaringologia I", "Cirurgia", "Verde"),
-    ("Bucofaringolaringologia II", "Cirurgia", "Verde"),
-    ("Oftalmologia para o Generalista II", "Cirurgia", "Verde"),
-    ("Outras Urgências Ginecológicas", "Ginecologia e Obstetrícia", "Verde"),
-    ("Malformações do Sistema Nervoso", "Pediatria", "Verde"),
-    ("Doenças Neuromusculares na Infância", "Pediatria", "Verde"),
-    ("Transtornos Relacionados a Substâncias (Álcool)", "Clínica Médica", "Diamante"),
-    ("Preventiva: Reta Final", "Preventiva", "Amarelo"),
-    ("Cirurgia Cardíaca", "Cirurgia", "Verde"),
-    ("Tromboelastograma", "Cirurgia", "Verde"),
-]
\ No newline at end of file
+    ("BLOCO 22", [
+        ("Doenças Virais e Pandêmicas", "Clínica Médica", "Verde"),
+        ("Arboviroses (Adulto)", "Clínica Médica", "Diamante"),
+        ("Icterícias Febris e Febre Maculosa", "Clínica Médica", "Amarelo"),
+        ("Hepatites Virais", "Clínica Médica", "Amarelo"),
+        ("Técnicas de Reprodução Assistida", "Ginecologia e Obstetrícia", "Verde"),
+        ("Cuidado à Saúde LGBTQIAPN+", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Medicina do Adolescente", "Pediatria", "Vermelho"),
+        ("Ética em Pediatria", "Pediatria", "Verde"),
+        ("Ética Médica", "Preventiva", "Diamante"),
+        ("Intoxicações, PAIRO e Burnout", "Preventiva", "Vermelho"),
+        ("Dermatologia na APS", "Preventiva", "Verde"),
+        ("Tumores do Intestino Delgado", "Cirurgia", "Verde"),
+        ("Doenças Cirúrgicas do Baço", "Cirurgia", "Verde"),
+        ("CEC de Cabeça e Pescoço", "Cirurgia", "Verde"),
+        ("Doenças Traqueais", "Cirurgia", "Verde"),
+        ("Bronquiectasias e Hemoptise (Cirurgia)", "Cirurgia", "Verde"),
+    ]),
+
+    ("BLOCO 23", [
+        ("Hiperaldosteronismo Primário", "Clínica Médica", "Verde"),
+        ("Feocromocitoma", "Clínica Médica", "Verde"),
+        ("Prolactinomas", "Clínica Médica", "Verde"),
+        ("Oncohematologia", "Clínica Médica", "Vermelho"),
+        ("Cirurgia Ginecológica: Princípios e Complicações", "Ginecologia e Obstetrícia", "Verde"),
+        ("Transtornos Psiquiátricos na Gestação/Pós-parto", "Ginecologia e Obstetrícia", "Verde"),
+        ("Emergências Psiquiátricas", "Clínica Médica", "Diamante"),
+        ("Violências e Vulnerabilidade", "Preventiva", "Amarelo"),
+        ("Saúde Privada, Suplementar e Judicialização", "Preventiva", "Verde"),
+        ("Psiquiatria da Infância e Adolescência", "Pediatria", "Verde"),
+        ("Epilepsias na Infância", "Pediatria", "Verde"),
+        ("Cisto Pilonidal", "Cirurgia", "Verde"),
+        ("Anomalias Congênitas em Cabeça e Pescoço", "Cirurgia", "Verde"),
+        ("Mediastino", "Cirurgia", "Verde"),
+    ]),
+
+    ("BLOCO 24", [
+        ("Dermatologia", "Clínica Médica", "Amarelo"),
+        ("Medicina Fetal (G.O)", "Ginecologia e Obstetrícia", "Vermelho"),
+        ("Otites, Perda Auditiva, Rinossinusites (Ped)", "Pediatria", "Amarelo"),
+        ("Rinites e Afecções da Laringe e Faringe (Ped)", "Pediatria", "Amarelo"),
+        ("Transtornos Alimentares e de Personalidade", "Clínica Médica", "Vermelho"),
+        ("Endoscopia", "Cirurgia", "Verde"),
+        ("Cabeça e Pescoço: Tireóide e Paratireóide", "Cirurgia", "Vermelho"),
+    ]),
+
+    ("BLOCO 25", [
+        ("Neurocirurgia", "Cirurgia", "Verde"),
+        ("Otologia I", "Cirurgia", "Amarelo"),
+        ("Otologia II", "Cirurgia", "Verde"),
+        ("Oftalmologia para o Generalista I", "Cirurgia", "Verde"),
+        ("Trombofilias na Gestação e Puerpério", "Ginecologia e Obstetrícia", "Amarelo"),
+        ("Doença Hemolítica Perinatal", "Ginecologia e Obstetrícia", "Diamante"),
+        ("Oftalmopediatria", "Pediatria", "Verde"),
+        ("Saúde do Trabalhador", "Preventiva", "Diamante"),
+        ("Anestesiologia", "Cirurgia", "Amarelo"),
+    ]),
+
+    ("BLOCO 26 (Reta Final)", [
+        ("Rinologia", "Cirurgia", "Amarelo"),
+        ("Bucofaringolaringologia I", "Cirurgia", "Verde"),
+        ("Bucofaringolaringologia II", "Cirurgia", "Verde"),
+        ("Oftalmologia para o Generalista II", "Cirurgia", "Verde"),
+        ("Outras Urgências Ginecológicas", "Ginecologia e Obstetrícia", "Verde"),
+        ("Malformações do Sistema Nervoso", "Pediatria", "Verde"),
+        ("Doenças Neuromusculares na Infância", "Pediatria", "Verde"),
+        ("Transtornos Relacionados a Substâncias (Álcool)", "Clínica Médica", "Diamante"),
+        ("Preventiva: Reta Final", "Preventiva", "Amarelo"),
+        ("Cirurgia Cardíaca", "Cirurgia", "Verde"),
+        ("Tromboelastograma", "Cirurgia", "Verde"),
+    ]),
+]
+
+DADOS_LIMPOS = [aula for _, aulas in BLOCOS for aula in aulas]
@@ -0,0 +1,156 @@
+# backup.py
+# Exportação/importação completa dos dados de um usuário.
+# Arquivo .zip com um membro por tabela (Parquet ou Arrow IPC via pyarrow; CSV como fallback)
+# e um manifest.json. Tudo é lido/gravado em blocos: a memória não cresce com o histórico.
+import io
+import json
+import zipfile
+from datetime import datetime
+import pandas as pd
+from database import _leitura, _escrita, _apos_commit, trigger_refresh, versao_schema, colunas_tabela
+
+# pyarrow é opcional (vem junto com o streamlit, mas não é garantido)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+TAMANHO_BLOCO = 20000
+FORMATOS = ("parquet", "arrow", "csv")
+
+# tabela -> coluna do usuário. IDs autoincrementais não são exportados: na importação
+# as linhas ganham IDs novos, o que permite migrar entre instâncias sem colisão.
+TABELAS_USUARIO = {
+    "usuarios": "username",
+    "perfil_gamer": "usuario_id",
+    "historico": "usuario_id",
+    "revisoes": "usuario_id",
+    "cronograma_progresso": "usuario_id",
+    "resumos": "usuario_id",
+    "sessoes_foco": "usuario_id",
+    "plano_estudo": "usuario_id",
+    "cartoes_srs": "usuario_id",
+}
+COLUNAS_IGNORADAS = {"id"}
+EXTENSOES = {"parquet": "parquet", "arrow": "arrows", "csv": "csv"}
+
+def _colunas(conn, tabela):
+    """[(nome, tipo declarado)] sem as colunas de ID."""
+    return [(nome, tipo) for nome, tipo in colunas_tabela(conn, tabela) if nome not in COLUNAS_IGNORADAS]
+
+def _schema_arrow(colunas):
+    def tipo(decl):
+        if "INT" in decl: return pa.int64()
+        if "REAL" in decl or "FLOA" in decl or "DOUB" in decl: return pa.float64()
+        return pa.string()
+    return pa.schema([(nome, tipo(decl)) for nome, decl in colunas])
+
+def _blocos(conn, tabela, coluna_u, u, colunas):
+    nomes = ", ".join(c for c, _ in colunas)
+    return pd.read_sql_query(f"SELECT {nomes} FROM {tabela} WHERE {coluna_u}=?", conn, params=(u,), chunksize=TAMANHO_BLOCO)
+
+def _exportar_tabela(zf, conn, tabela, coluna_u, u, formato):
+    colunas = _colunas(conn, tabela)
+    nome = f"{tabela}.{EXTENSOES[formato]}"
+    linhas = 0
+    if formato == "csv":
+        zf_info = zipfile.ZipInfo(nome, date_time=datetime.now().timetuple()[:6])
+        zf_info.compress_type = zipfile.ZIP_DEFLATED
+        with zf.open(zf_info, "w") as bruto, io.TextIOWrapper(bruto, encoding="utf-8", newline="") as f:
+            f.write(",".join(c for c, _ in colunas) + "\n")
+            for bloco in _blocos(conn, tabela, coluna_u, u, colunas):
+                bloco.to_csv(f, header=False, index=False)
+                linhas += len(bloco)
+        return nome, linhas
+
+    schema = _schema_arrow(colunas)
+    # Parquet/Arrow já são comprimidos: membro sem compressão (e com seek barato na leitura)
+    with zf.open(zipfile.ZipInfo(nome, date_time=datetime.now().timetuple()[:6]), "w") as f:
+        writer = pq.ParquetWriter(f, schema, compression="zstd") if formato == "parquet" else pa.ipc.new_stream(f, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+        try:
+            for bloco in _blocos(conn, tabela, coluna_u, u, colunas):
+                writer.write_table(pa.Table.from_pandas(bloco, schema=schema, preserve_index=False))
+                linhas += len(bloco)
+            if linhas == 0 and formato == "parquet":
+                writer.write_table(schema.empty_table())
+        finally:
+            writer.close()
+    return nome, linhas
+
+def exportar_usuario(u, destino=None, formato=None):
+    """
+    Exporta todas as tabelas do usuário para um .zip.
+    destino: caminho ou arquivo binário; se omitido, devolve os bytes (ex.: st.download_button).
+    formato: 'parquet' (padrão com pyarrow), 'arrow' ou 'csv' (padrão sem pyarrow).
+    """
+    formato = formato or ("parquet" if PYARROW_AVAILABLE else "csv")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    if formato != "csv" and not PYARROW_AVAILABLE:
+        formato = "csv"
+
+    saida = destino if destino is not None else io.BytesIO()
+    manifesto = {"usuario": u, "formato": formato, "exportado_em": datetime.now().isoformat(timespec="seconds"), "tabelas": {}}
+    with _leitura() as conn, zipfile.ZipFile(saida, "w", zipfile.ZIP_STORED) as zf:
+        manifesto["schema"] = versao_schema(conn)
+        for tabela, coluna_u in TABELAS_USUARIO.items():
+            nome, linhas = _exportar_tabela(zf, conn, tabela, coluna_u, u, formato)
+            manifesto["tabelas"][tabela] = {"arquivo": nome, "linhas": linhas}
+        zf.writestr("manifest.json", json.dumps(manifesto, ensure_ascii=False, indent=2))
+    return saida.getvalue() if destino is None else manifesto
+
+def _ler_blocos(zf, info, formato):
+    """Gera listas de dicts por bloco, sem carregar o membro inteiro."""
+    with zf.open(info["arquivo"]) as f:
+        if formato == "csv":
+            for bloco in pd.read_csv(f, chunksize=TAMANHO_BLOCO, dtype=object, keep_default_na=False, na_values=[""]):
+                yield bloco.astype(object).where(bloco.notna(), None).to_dict("records")
+        elif formato == "parquet":
+            for lote in pq.ParquetFile(f).iter_batches(batch_size=TAMANHO_BLOCO):
+                yield lote.to_pylist()
+        else:
+            for lote in pa.ipc.open_stream(f):
+                yield lote.to_pylist()
+
+def importar_usuario(origem, u_destino=None, substituir=True, incluir_conta=True):
+    """
+    Restaura (ou migra) um usuário a partir de um arquivo de exportar_usuario.
+    origem: caminho, arquivo binário ou bytes. u_destino: novo username (padrão: o original).
+    substituir: apaga os dados atuais do usuário de destino antes de inserir.
+    incluir_conta: restaura também a linha de usuarios (nome, hash da senha, e-mail).
+    Tudo acontece numa transação; o rollup diário acompanha via triggers.
+    """
+    if isinstance(origem, (bytes, bytearray)):
+        origem = io.BytesIO(origem)
+    with zipfile.ZipFile(origem) as zf:
+        manifesto = json.loads(zf.read("manifest.json"))
+        formato = manifesto["formato"]
+        if formato != "csv" and not PYARROW_AVAILABLE:
+            raise RuntimeError("Backup em Parquet/Arrow requer pyarrow instalado.")
+        u = u_destino or manifesto["usuario"]
+        contagem = {}
+        with _escrita() as conn:
+            if substituir:
+                for tabela, coluna_u in TABELAS_USUARIO.items():
+                    if tabela != "usuarios":
+                        conn.execute(f"DELETE FROM {tabela} WHERE {coluna_u}=?", (u,))
+            for tabela, coluna_u in TABELAS_USUARIO.items():
+                info = manifesto["tabelas"].get(tabela)
+                if not info or (tabela == "usuarios" and not incluir_conta): continue
+                destino = {c for c, _ in _colunas(conn, tabela)}
+                contagem[tabela] = 0
+                sql = None
+                for registros in _ler_blocos(zf, info, formato):
+                    if not registros: continue
+                    if sql is None:
+                        cols = [c for c in registros[0] if c in destino]
+                        verbo = "INSERT OR REPLACE" if tabela in ("usuarios", "perfil_gamer", "cronograma_progresso", "resumos", "plano_estudo", "cartoes_srs") else "INSERT"
+                        sql = f"{verbo} INTO {tabela} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})"
+                        if tabela == "revisoes":  # pendente repetida (backup antigo ou já existente): fica a do banco
+                            sql += " ON CONFLICT DO NOTHING"
+                    conn.executemany(sql, ([u if c == coluna_u else r.get(c) for c in cols] for r in registros))
+                    contagem[tabela] += len(registros)
+            _apos_commit(trigger_refresh)
+    return contagem
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from importador import importar_estudos
 
 def render_banco_questoes(conn_ignored):
     st.header("🏦 Banco de Questões - Hardworq")
@@ -11,4 +12,16 @@ def render_banco_questoes(conn_ignored):
 
     # Renderiza o site dentro do Streamlit
     # height=1000 garante uma boa área vertical para resolver questões sem scroll duplo excessivo
-    components.iframe(url_externa, height=1000, scrolling=True)
\ No newline at end of file
+    components.iframe(url_externa, height=1000, scrolling=True)
+
+    # Importação em massa (ex.: exportação da plataforma ou planilha própria)
+    with st.expander("📥 Importar resultados em lote (CSV / JSON)"):
+        st.caption("Colunas: assunto, acertos, total, data (AAAA-MM-DD ou DD/MM/AAAA), tipo (Pre-Aula/Pos-Aula).")
+        arq = st.file_uploader("Arquivo", type=["csv", "json", "jsonl"], key="imp_lote_arquivo")
+        if arq is not None and st.button("Importar", type="primary", key="imp_lote_btn"):
+            with st.spinner("Importando..."):
+                resumo = importar_estudos(st.session_state.username, arq)
+            st.success(f"✅ {resumo['importados']} registros importados!")
+            if resumo['ignorados']:
+                st.warning(f"{resumo['ignorados']} linhas ignoradas.")
+                for e in resumo['erros']: st.caption(e)
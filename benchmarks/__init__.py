@@ -0,0 +1,4 @@
+# Benchmarks do MedPlanner. Rodar da raiz do projeto, ex.:
+#   python -m benchmarks.bench_conexoes --sessoes 64
+# Checagens com código de saída (planos de consulta, regressões, orçamentos de tempo):
+#   python -m benchmarks.checagens [--com-tempo]
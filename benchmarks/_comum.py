@@ -0,0 +1,36 @@
+# Utilitários compartilhados pelos benchmarks (banco temporário, silêncio do streamlit)
+import os
+import sys
+import tempfile
+import time
+import statistics
+
+def preparar_banco(nome="bench"):
+    """Aponta o database.py para um arquivo temporário. Chamar ANTES de importar database."""
+    pasta = tempfile.mkdtemp(prefix="medplanner_")
+    caminho = os.path.join(pasta, f"{nome}.db")
+    os.environ["MEDPLANNER_DB"] = caminho
+    os.environ.pop("MEDPLANNER_DB_URL", None)  # os benchmarks medem o SQLite local
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from streamlit import logger
+        logger.set_log_level("error")
+    except Exception:
+        pass
+    return caminho
+
+def percentis(amostras):
+    if not amostras:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordenadas = sorted(amostras)
+    def p(q): return ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))]
+    return {"p50": p(0.50), "p95": p(0.95), "p99": p(0.99), "max": ordenadas[-1], "media": statistics.fmean(ordenadas)}
+
+class Cronometro:
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+    def __exit__(self, *exc):
+        self.segundos = time.perf_counter() - self.t0
@@ -0,0 +1,50 @@
+# Exportação + importação de um usuário com muito histórico, nos três formatos.
+#   python -m benchmarks.bench_backup --linhas 100000
+import argparse
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+
+from benchmarks._comum import preparar_banco, Cronometro
+
+preparar_banco("backup")
+import database  # noqa: E402
+import aulas_medcof  # noqa: E402
+import backup  # noqa: E402
+
+def popular(u, n, seed=3):
+    rnd = random.Random(seed)
+    temas = [a[0] for a in aulas_medcof.DADOS_LIMPOS]
+    inicio = date.today() - timedelta(days=3 * 365)
+    regs = []
+    for _ in range(n):
+        tot = rnd.randint(5, 30)
+        regs.append((rnd.choice(temas), rnd.randint(0, tot), tot, (inicio + timedelta(days=rnd.randrange(3 * 365))).isoformat(), rnd.choice(("Pre-Aula", "Pos-Aula"))))
+    database.registrar_estudos_em_lote(u, regs)
+    for t in temas[:50]:
+        database.registrar_estudo(u, t, 5, 10, srs=True)
+    database.salvar_caderno_erros(u, "Cirurgia", "Trauma: ABCDE " * 200)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--linhas", type=int, default=100_000)
+    args = ap.parse_args()
+    popular("origem", args.linhas)
+    pasta = tempfile.mkdtemp()
+    ref = database.get_cronograma_status("origem")
+    formatos = backup.FORMATOS if backup.PYARROW_AVAILABLE else ("csv",)
+    for formato in formatos:
+        caminho = os.path.join(pasta, f"origem_{formato}.zip")
+        with Cronometro() as te:
+            manifesto = backup.exportar_usuario("origem", caminho, formato)
+        destino = f"copia_{formato}"
+        with Cronometro() as ti:
+            contagem = backup.importar_usuario(caminho, destino)
+        assert contagem["historico"] == manifesto["tabelas"]["historico"]["linhas"]
+        assert database.get_cronograma_status(destino) == ref
+        print(f"{formato:8s} export {te.segundos:5.2f}s | import {ti.segundos:5.2f}s | "
+              f"{os.path.getsize(caminho) / 1e6:5.1f} MB | historico={contagem['historico']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# Vazão de leitura com N sessões concorrentes enquanto um escritor registra estudos.
+# Compara o pool WAL (database.get_pool) com a conexão única antiga (journal DELETE).
+import argparse
+import sqlite3
+import threading
+import time
+
+from benchmarks._comum import preparar_banco, percentis
+
+CAMINHO = preparar_banco("conexoes")
+import database  # noqa: E402
+
+def popular(n_usuarios, linhas_por_usuario):
+    database._ensure_local_db()
+    hoje = time.strftime("%Y-%m-%d")
+    with database._escrita() as conn:
+        conn.executemany(
+            "INSERT INTO historico (usuario_id, assunto_nome, area_manual, data_estudo, acertos, total, tipo_estudo) VALUES (?,?,?,?,?,?,?)",
+            ((f"u{i % n_usuarios}", "Sífilis", "Clínica Médica", hoje, 7, 10, "Pos-Aula") for i in range(n_usuarios * linhas_por_usuario)),
+        )
+        conn.executemany("INSERT OR IGNORE INTO perfil_gamer (usuario_id, xp, titulo, meta_diaria) VALUES (?, 0, 'Interno', 50)",
+                         ((f"u{i}",) for i in range(n_usuarios)))
+
+def _carga(ler, escrever, sessoes, segundos, escritas_por_s):
+    parar = threading.Event()
+    leituras, escritas, erros, latencias = [0], [0], [0], []
+    trava = threading.Lock()
+
+    def leitor(i):
+        u = f"u{i}"
+        local_n, local_lat = 0, []
+        while not parar.is_set():
+            t0 = time.perf_counter()
+            try:
+                ler(u)
+                local_n += 1
+                local_lat.append(time.perf_counter() - t0)
+            except sqlite3.OperationalError:
+                with trava: erros[0] += 1
+        with trava:
+            leituras[0] += local_n
+            latencias.extend(local_lat)
+
+    def escritor():
+        # Ritmo fixo de escrita para os dois modos verem o mesmo volume de dados
+        intervalo = 1.0 / escritas_por_s
+        proxima = time.perf_counter()
+        while not parar.is_set():
+            try:
+                escrever(f"u{escritas[0] % sessoes}")
+                escritas[0] += 1
+            except sqlite3.OperationalError:
+                with trava: erros[0] += 1
+            proxima += intervalo
+            parar.wait(max(0.0, proxima - time.perf_counter()))
+
+    threads = [threading.Thread(target=leitor, args=(i,)) for i in range(sessoes)]
+    threads.append(threading.Thread(target=escritor))
+    for t in threads: t.start()
+    time.sleep(segundos)
+    parar.set()
+    for t in threads: t.join()
+    return {"leituras_por_s": round(leituras[0] / segundos, 1), "escritas": escritas[0], "erros_lock": erros[0],
+            "latencia_ms": {k: round(v * 1000, 3) for k, v in percentis(latencias).items()}}
+
+SQL_HOJE = "SELECT SUM(total) FROM historico WHERE usuario_id=? AND data_estudo=?"
+SQL_PERFIL = "SELECT xp, meta_diaria FROM perfil_gamer WHERE usuario_id=?"
+SQL_INSERT = "INSERT INTO historico (usuario_id, assunto_nome, area_manual, data_estudo, acertos, total, tipo_estudo) VALUES (?,?,?,?,?,?,?)"
+SQL_XP = "UPDATE perfil_gamer SET xp = xp + 4 WHERE usuario_id=?"
+
+# Mesmas consultas nos dois modos: só a camada de conexão muda.
+def modo_pool(sessoes, segundos, escritas_por_s):
+    hoje = time.strftime("%Y-%m-%d")
+    def ler(u):
+        with database._leitura() as conn:
+            conn.execute(SQL_PERFIL, (u,)).fetchone()
+            conn.execute(SQL_HOJE, (u, hoje)).fetchone()
+    def escrever(u):
+        with database._escrita() as conn:
+            conn.execute(SQL_INSERT, (u, "Sífilis", "Clínica Médica", hoje, 1, 2, "Pos-Aula"))
+            conn.execute(SQL_XP, (u,))
+    return _carga(ler, escrever, sessoes, segundos, escritas_por_s)
+
+def modo_legado(sessoes, segundos, escritas_por_s):
+    # Reproduz o comportamento anterior: uma conexão compartilhada, journal DELETE, sem lock
+    conn = sqlite3.connect(CAMINHO, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    hoje = time.strftime("%Y-%m-%d")
+    def ler(u):
+        conn.execute(SQL_PERFIL, (u,)).fetchone()
+        conn.execute(SQL_HOJE, (u, hoje)).fetchone()
+    def escrever(u):
+        conn.execute(SQL_INSERT, (u, "Sífilis", "Clínica Médica", hoje, 1, 2, "Pos-Aula"))
+        conn.execute(SQL_XP, (u,))
+        conn.commit()
+    try:
+        return _carga(ler, escrever, sessoes, segundos, escritas_por_s)
+    finally:
+        conn.close()
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessoes", type=int, default=64)
+    ap.add_argument("--segundos", type=float, default=5.0)
+    ap.add_argument("--linhas", type=int, default=200, help="linhas de histórico por usuário")
+    ap.add_argument("--escritas-por-s", type=float, default=50.0)
+    args = ap.parse_args()
+
+    popular(args.sessoes, args.linhas)
+    print(f"Banco: {CAMINHO} | sessões: {args.sessoes}")
+    pool = modo_pool(args.sessoes, args.segundos, args.escritas_por_s)
+    database.get_pool().fechar()
+    legado = modo_legado(args.sessoes, args.segundos, args.escritas_por_s)
+    print("pool WAL   :", pool)
+    print("legado     :", legado)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Eventos de estudo por segundo num banco em ARQUIVO (não use tmpfs se quiser ver o custo do fsync).
+# Conta também quantos COMMITs cada evento emite.
+#   python -m benchmarks.bench_eventos --eventos 2000 --dir .
+import argparse
+import os
+import random
+import tempfile
+
+from benchmarks._comum import Cronometro, preparar_banco
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--eventos", type=int, default=2000)
+    ap.add_argument("--dir", default=None, help="pasta do banco (padrão: temporária)")
+    ap.add_argument("--srs", action="store_true", help="agenda revisão em cada evento")
+    args = ap.parse_args()
+
+    preparar_banco("eventos")
+    pasta = tempfile.mkdtemp(prefix="medplanner_", dir=args.dir)
+    os.environ["MEDPLANNER_DB"] = os.path.join(pasta, "eventos.db")
+    import database
+    import aulas_medcof
+
+    pool = database.get_pool()
+    commits = [0]
+    pool.escritor.set_trace_callback(lambda sql: commits.__setitem__(0, commits[0] + (sql.strip().upper() == "COMMIT")))
+
+    rnd = random.Random(7)
+    temas = [a[0] for a in aulas_medcof.DADOS_LIMPOS]
+    with Cronometro() as t:
+        for i in range(args.eventos):
+            tot = rnd.randint(5, 30)
+            database.registrar_estudo(f"u{i % 50}", rnd.choice(temas), rnd.randint(0, tot), tot,
+                                      tipo_estudo=rnd.choice(("Pre-Aula", "Pos-Aula")), srs=args.srs)
+    with database._leitura() as conn:
+        n_hist = conn.execute("SELECT COUNT(*) FROM historico").fetchone()[0]
+    print(f"{args.eventos} eventos em {t.segundos:.2f}s -> {args.eventos / t.segundos:,.0f} eventos/s")
+    print(f"linhas em historico: {n_hist} | COMMITs observados: {commits[0]} ({commits[0] / args.eventos:.2f} por evento)")
+    print(f"banco: {os.environ['MEDPLANNER_DB']}")
+
+if __name__ == "__main__":
+    main()
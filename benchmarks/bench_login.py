@@ -0,0 +1,79 @@
+# Logins concorrentes (pico das 7h): latência p50/p95 e vazão de verificar_login, mais a
+# latência de uma leitura "de rerun" feita por outra sessão durante o pico.
+# Compara o caminho atual (pool limitado de bcrypt) com o antigo (checkpw na thread do script).
+#   python -m benchmarks.bench_login --sessoes 32 --rounds 12 --workers 4
+import argparse
+import os
+import threading
+import time
+
+from benchmarks._comum import preparar_banco, percentis
+
+def _carga(login, ler, usuarios, sessoes, segundos):
+    parar, trava = threading.Event(), threading.Lock()
+    lat_login, lat_rerun, falhas = [], [], [0]
+
+    def sessao(i):
+        local = []
+        while not parar.is_set():
+            u = usuarios[(i + len(local)) % len(usuarios)]
+            t0 = time.perf_counter()
+            ok, _ = login(u, "senha123")
+            local.append(time.perf_counter() - t0)
+            if not ok:
+                with trava: falhas[0] += 1
+        with trava: lat_login.extend(local)
+
+    def rerun():
+        # Uma sessão já logada que continua navegando durante o pico
+        while not parar.is_set():
+            t0 = time.perf_counter()
+            ler(usuarios[0])
+            lat_rerun.append(time.perf_counter() - t0)
+            parar.wait(0.02)
+
+    threads = [threading.Thread(target=sessao, args=(i,)) for i in range(sessoes)] + [threading.Thread(target=rerun)]
+    for t in threads: t.start()
+    time.sleep(segundos)
+    parar.set()
+    for t in threads: t.join()
+    ms = lambda p: {k: round(v * 1000, 1) for k, v in p.items() if k in ("p50", "p95", "p99")}
+    return {"logins_por_s": round(len(lat_login) / segundos, 1), "falhas": falhas[0],
+            "login_ms": ms(percentis(lat_login)), "rerun_ms": ms(percentis(lat_rerun))}
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessoes", type=int, default=32)
+    ap.add_argument("--usuarios", type=int, default=20)
+    ap.add_argument("--segundos", type=float, default=5.0)
+    ap.add_argument("--rounds", type=int, default=12, help="custo do bcrypt")
+    ap.add_argument("--workers", type=int, default=None, help="threads do pool de senhas (padrão: núcleos)")
+    args = ap.parse_args()
+
+    preparar_banco("login")
+    os.environ["MEDPLANNER_BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.workers:
+        os.environ["MEDPLANNER_SENHA_WORKERS"] = str(args.workers)
+    import bcrypt
+    import database
+
+    usuarios = [f"aluno{i}" for i in range(args.usuarios)]
+    for u in usuarios:
+        database.criar_usuario(u, "senha123", u.title())
+
+    def login_antigo(u, p):
+        # Comportamento anterior: bootstrap + checkpw direto na thread que chamou
+        database._ensure_local_db()
+        with database._leitura() as conn:
+            row = conn.execute("SELECT password_hash, nome FROM usuarios WHERE username=?", (u,)).fetchone()
+        return (True, row['nome']) if row and bcrypt.checkpw(p.encode(), row['password_hash'].encode()) else (False, "Erro")
+
+    def ler(u):
+        database.get_status_gamer(u)
+
+    print(f"bcrypt custo {args.rounds} | workers {database.SENHA_WORKERS} | {args.sessoes} sessões | {os.cpu_count()} CPUs")
+    print("pool      :", _carga(database.verificar_login, ler, usuarios, args.sessoes, args.segundos))
+    print("na thread :", _carga(login_antigo, ler, usuarios, args.sessoes, args.segundos))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Ingestão de um semestre de registros: laço de registrar_estudo vs registrar_estudos_em_lote
+# vs importador CSV em streaming.
+#   python -m benchmarks.bench_lote --dias 180 --por-dia 40
+import argparse
+import csv
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+
+from benchmarks._comum import preparar_banco, Cronometro
+
+preparar_banco("lote")
+import database  # noqa: E402
+import aulas_medcof  # noqa: E402
+from importador import importar_estudos  # noqa: E402
+
+def gerar(dias, por_dia, seed=42):
+    rnd = random.Random(seed)
+    temas = [a[0] for a in aulas_medcof.DADOS_LIMPOS]
+    inicio = date.today() - timedelta(days=dias)
+    for d in range(dias):
+        dia = (inicio + timedelta(days=d)).isoformat()
+        for _ in range(por_dia):
+            tot = rnd.randint(5, 30)
+            yield (rnd.choice(temas), rnd.randint(0, tot), tot, dia, rnd.choice(("Pre-Aula", "Pos-Aula")))
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dias", type=int, default=180)
+    ap.add_argument("--por-dia", type=int, default=40)
+    ap.add_argument("--amostra-unitaria", type=int, default=500, help="registros medidos no laço antigo")
+    args = ap.parse_args()
+    registros = list(gerar(args.dias, args.por_dia))
+    n = len(registros)
+    database.get_pool()
+
+    with Cronometro() as t:
+        for a, ac, tt, dt, tipo in registros[:args.amostra_unitaria]:
+            database.registrar_estudo("laco", a, ac, tt, data_p=date.fromisoformat(dt), tipo_estudo=tipo)
+    por_reg = t.segundos / args.amostra_unitaria
+    print(f"registrar_estudo (laço): {por_reg*1000:.2f} ms/registro -> estimado {por_reg*n:.1f}s para {n}")
+
+    with Cronometro() as t:
+        database.registrar_estudos_em_lote("lote", registros)
+    print(f"registrar_estudos_em_lote: {t.segundos:.2f}s para {n} ({n/t.segundos:,.0f} reg/s)")
+
+    caminho = os.path.join(tempfile.mkdtemp(), "semestre.csv")
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["assunto", "acertos", "total", "data", "tipo"])
+        w.writerows(registros)
+    with Cronometro() as t:
+        resumo = importar_estudos("csv", caminho)
+    print(f"importar_estudos (CSV): {t.segundos:.2f}s -> {resumo['importados']} importados, {resumo['ignorados']} ignorados")
+
+    # Sanidade: lote e CSV devem produzir o mesmo estado
+    assert database.get_cronograma_status("lote") == database.get_cronograma_status("csv")
+    assert database.get_status_gamer("lote")[0]["xp_atual"] == database.get_status_gamer("csv")[0]["xp_atual"]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Custo de um rerun do app por seção: nove st.tabs executando sempre (MEDPLANNER_NAV=abas)
+# contra só a seção escolhida (padrão). Um aluno sintético com anos de histórico, via AppTest.
+#   python -m benchmarks.bench_navegacao --reruns 15 --anos 2
+# O AppTest reexecuta o script inteiro mesmo para widgets dentro de st.fragment: os números
+# do modo seção incluem a sidebar, ou seja, são o teto do que um clique custa no navegador.
+# No fim, o cronograma é medido em cada visão (Lista, Cards e Grade).
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks._comum import preparar_banco, percentis
+from benchmarks.carga_sessoes import CookiesSemNavegador
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+
+def _logar(modo, u, senha, timeout):
+    from streamlit.testing.v1 import AppTest
+    os.environ["MEDPLANNER_NAV"] = modo
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.run()
+    at.text_input(key="l_user").input(u)
+    at.text_input(key="l_pass").input(senha)
+    next(b for b in at.button if b.label == "Acessar").click()
+    at.run()
+    return at
+
+def _medir(at, secao, reruns):
+    nav = [r for r in at.radio if r.key == "nav_secao"]
+    if nav:
+        nav[0].set_value(secao)
+        at.run()
+    amostras = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        amostras.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(f"{secao}: {at.exception[0].value}")
+    return amostras
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reruns", type=int, default=10, help="reruns medidos por seção")
+    ap.add_argument("--anos", type=float, default=2, help="histórico do aluno sintético")
+    ap.add_argument("--por-semana", type=float, default=10)
+    ap.add_argument("--timeout", type=float, default=120.0)
+    args = ap.parse_args()
+
+    preparar_banco("navegacao")
+    os.chdir(RAIZ)
+    import extra_streamlit_components
+    extra_streamlit_components.CookieManager = CookiesSemNavegador
+    from benchmarks import gerador
+    contagem = gerador.gerar(1, args.anos, args.por_semana)
+    u = gerador.nome_usuario(0)
+    secoes = _secoes()
+
+    resultados = {}
+    for modo in ("abas", "secao"):
+        at = _logar(modo, u, gerador.SENHA, args.timeout)
+        _medir(at, secoes[0], 1)  # aquecimento: imports e caches do processo
+        resultados[modo] = {s: _medir(at, s, args.reruns) for s in secoes}
+
+    # Cronograma em cada visão (lista com ~6 widgets por aula, cards, grade num data_editor)
+    at = _logar("secao", u, gerador.SENHA, args.timeout)
+    visoes = {}
+    for visao in ("Lista", "Blocos", "Grade"):
+        at.session_state["cronograma_view_mode"] = visao
+        visoes[visao] = _medir(at, "cronograma", args.reruns)
+
+    print(f"aluno {u}: {contagem['historico']} estudos, {contagem['revisoes']} revisões | {args.reruns} reruns por seção")
+    print(f"{'seção':12} {'abas p50':>10} {'seção p50':>10} {'seção p95':>10} {'ganho':>7}")
+    for s in secoes:
+        a = statistics.median(resultados["abas"][s]) * 1000
+        p = percentis(resultados["secao"][s])
+        print(f"{s:12} {a:>10.1f} {p['p50'] * 1000:>10.1f} {p['p95'] * 1000:>10.1f} {a / (p['p50'] * 1000):>6.1f}x")
+
+    print(f"\n{'cronograma':12} {'p50':>10} {'p95':>10}")
+    for visao, amostras in visoes.items():
+        p = percentis(amostras)
+        print(f"{visao:12} {p['p50'] * 1000:>10.1f} {p['p95'] * 1000:>10.1f}")
+
+def _secoes():
+    """Nomes de app.SECOES sem executar o app (importar app.py roda o script do streamlit)."""
+    import ast
+    with open(APP, encoding="utf-8") as f:
+        arvore = ast.parse(f.read())
+    for no in arvore.body:
+        if isinstance(no, ast.Assign) and any(getattr(t, "id", None) == "SECOES" for t in no.targets):
+            return [ast.literal_eval(k) for k in no.value.keys]
+    raise RuntimeError("app.SECOES não encontrado")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Replanejamento do cronograma até a prova: plano de um ano inteiro para o currículo todo,
+# refeito a cada rerun. Orçamento: p95 abaixo de --limite-ms (sai com código 1 se estourar).
+#   python -m benchmarks.bench_planejador --reps 200 --dias 365
+# Cenários: plano do zero; depois de marcar aulas (replaneja); dia perdido (hoje avança);
+# nada mudou (caminho rápido do replanejar, que devolve o plano anterior).
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+
+from benchmarks._comum import preparar_banco, percentis, Cronometro
+
+preparar_banco("planejador")
+from catalogo import catalogo  # noqa: E402
+from planejador import planejar, replanejar  # noqa: E402
+
+def _amostras(fn, reps):
+    fn()  # aquecimento
+    tempos = []
+    for _ in range(reps):
+        with Cronometro() as c:
+            fn()
+        tempos.append(c.segundos)
+    return tempos
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reps", type=int, default=200)
+    ap.add_argument("--dias", type=int, default=365, help="dias entre hoje e a prova")
+    ap.add_argument("--limite-ms", type=float, default=50.0)
+    args = ap.parse_args()
+
+    rnd = random.Random(42)
+    aulas = [a.nome for a in catalogo().aulas]
+    custos = {a: rnd.choice((15, 20, 25, 30, 40)) + 10 for a in aulas}  # faixa das metas pré + pós
+    hoje = date(2026, 1, 5)
+    prova = hoje + timedelta(days=args.dias)
+    folga = (6,)
+    feitas = set(rnd.sample(aulas, len(aulas) // 4))
+    anterior = planejar(aulas, custos, feitas, 50, hoje, prova, folga)
+
+    def marcar():
+        feitas.symmetric_difference_update({rnd.choice(aulas)})
+        return replanejar(anterior, aulas, custos, feitas, 50, hoje, prova, folga)
+    atrasos = iter(range(1, 10 ** 9))
+    cenarios = {
+        "do zero": lambda: planejar(aulas, custos, feitas, 50, hoje, prova, folga),
+        "marcar aula": marcar,
+        "dia perdido": lambda: replanejar(anterior, aulas, custos, feitas, 50, hoje + timedelta(next(atrasos) % 30), prova, folga),
+        "sem mudança": lambda: replanejar(anterior, aulas, custos, anterior.chave[2], 50, hoje, prova, folga),
+    }
+
+    print(f"{len(aulas)} aulas, {len(anterior.dias)} dias de estudo, {args.reps} repetições")
+    print(f"{'cenário':14} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    estourou = False
+    for nome, fn in cenarios.items():
+        p = percentis(_amostras(fn, args.reps))
+        estourou |= p["p95"] * 1000 > args.limite_ms
+        print(f"{nome:14} {p['p50'] * 1000:>8.2f} {p['p95'] * 1000:>8.2f} {p['max'] * 1000:>8.2f}")
+    if estourou:
+        print(f"FALHA: p95 acima de {args.limite_ms} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
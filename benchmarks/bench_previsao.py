@@ -0,0 +1,51 @@
+# Previsão de carga (365 dias) e balanceamento da agenda sobre baralhos sintéticos de cartões
+# SM-2. Só NumPy, sem banco: mede o que a aba "Futuro" calcula a cada rerun.
+#   python -m benchmarks.bench_previsao --tamanhos 1000 5000 20000 --reps 50
+import argparse
+import random
+from datetime import date, timedelta
+
+import numpy as np
+
+from benchmarks._comum import percentis, Cronometro
+from previsao import prever_carga, balancear
+
+def baralho(n, hoje, rnd):
+    """Vencimentos concentrados nas próximas semanas, como num backlog real (com picos)."""
+    proximas = np.array([(hoje + timedelta(days=int(rnd.expovariate(1 / 20)) - 5)).isoformat() for _ in range(n)])
+    intervalos = np.array([rnd.choice((1, 7, 15, 39, 105, 280)) for _ in range(n)])
+    facilidades = np.array([round(rnd.uniform(1.3, 2.8), 2) for _ in range(n)])
+    repeticoes = np.array([rnd.randint(0, 6) for _ in range(n)])
+    return proximas, intervalos, facilidades, repeticoes
+
+def _amostras(fn, reps):
+    fn()  # aquecimento
+    tempos = []
+    for _ in range(reps):
+        with Cronometro() as c:
+            fn()
+        tempos.append(c.segundos)
+    return tempos
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 5000, 20000])
+    ap.add_argument("--reps", type=int, default=50)
+    args = ap.parse_args()
+
+    rnd = random.Random(42)
+    hoje = date(2026, 1, 15)
+    print(f"{'cartões':>8} {'previsão p50':>13} {'p95':>7} {'balanço p50':>12} {'p95':>7} {'pico antes':>11} {'depois':>7}   (ms)")
+    for n in args.tamanhos:
+        proximas, intervalos, facilidades, repeticoes = baralho(n, hoje, rnd)
+        carga = prever_carga(proximas, intervalos, facilidades, repeticoes, hoje)
+        limite = max(1, int(np.ceil(carga[1:31].mean() * 1.5)))
+        prev = percentis(_amostras(lambda: prever_carga(proximas, intervalos, facilidades, repeticoes, hoje), args.reps))
+        bal = percentis(_amostras(lambda: balancear(proximas, intervalos, hoje, limite), args.reps))
+        # Pico só dos vencimentos atuais (o que o balanceamento mexe), sem hoje/atrasadas
+        antes = np.bincount(np.maximum((proximas.astype("datetime64[D]") - np.datetime64(hoje)).astype(int), 0))[1:].max()
+        depois = np.bincount(np.maximum(balancear(proximas, intervalos, hoje, limite), 0))[1:].max()
+        print(f"{n:>8} {prev['p50'] * 1000:>13.2f} {prev['p95'] * 1000:>7.2f} {bal['p50'] * 1000:>12.2f} {bal['p95'] * 1000:>7.2f} {antes:>11} {depois:>7}")
+
+if __name__ == "__main__":
+    main()
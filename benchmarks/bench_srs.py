@@ -0,0 +1,62 @@
+# Fila SM-2 do dia contra o tamanho do baralho: a consulta é uma faixa em
+# idx_cartoes_srs_usuario_proxima com LIMIT, então deve ficar plana de 1k a 100k cartões.
+# Também mede uma nota em lote (--lote cartões numa transação) em cada tamanho.
+#   python -m benchmarks.bench_srs --tamanhos 1000 10000 100000 --reps 200
+# Sai com código 1 se o p95 da fila no maior baralho passar de --tolerancia × o do menor.
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+
+from benchmarks._comum import preparar_banco, percentis, Cronometro
+
+preparar_banco("srs")
+import database  # noqa: E402
+
+def povoar(u, n, hoje, rnd):
+    """n cartões com vencimentos espalhados num ano para trás e um para frente."""
+    linhas = [(u, f"Assunto {i:06d}", round(rnd.uniform(1.3, 2.8), 2), rnd.choice((1, 7, 15, 39, 105)), rnd.randint(0, 6), rnd.randint(0, 3),
+               None, (hoje + timedelta(days=rnd.randint(-365, 365))).isoformat()) for i in range(n)]
+    with database._escrita() as conn:
+        conn.executemany(database.SQL_UPSERT_CARTAO, linhas)
+        conn.execute("ANALYZE")
+
+def _amostras(fn, reps):
+    fn()  # aquecimento
+    tempos = []
+    for _ in range(reps):
+        with Cronometro() as c:
+            fn()
+        tempos.append(c.segundos)
+    return tempos
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--reps", type=int, default=200)
+    ap.add_argument("--lote", type=int, default=500, help="cartões por nota em lote")
+    ap.add_argument("--tolerancia", type=float, default=3.0)
+    args = ap.parse_args()
+
+    rnd = random.Random(42)
+    hoje = date(2026, 1, 15)
+    print(f"{'cartões':>8} {'fila p50':>9} {'fila p95':>9} {'lote p50':>9}   (ms; fila = 200 vencidos; lote = {args.lote} notas)")
+    fila_p95 = {}
+    for n in args.tamanhos:
+        u = f"srs{n}"
+        povoar(u, n, hoje, rnd)
+        fila = percentis(_amostras(lambda: database.get_fila_srs(u, hoje), args.reps))
+        assuntos = [f"Assunto {i:06d}" for i in range(n)]
+        lote = percentis(_amostras(lambda: database.avaliar_cartoes(u, {a: rnd.randint(1, 5) for a in rnd.sample(assuntos, min(args.lote, n))}, hoje),
+                                   max(5, args.reps // 20)))
+        fila_p95[n] = fila["p95"]
+        print(f"{n:>8} {fila['p50'] * 1000:>9.2f} {fila['p95'] * 1000:>9.2f} {lote['p50'] * 1000:>9.2f}")
+
+    menor, maior = fila_p95[min(fila_p95)], fila_p95[max(fila_p95)]
+    print(f"fila: p95 no maior baralho = {maior / menor:.2f}x o do menor")
+    if maior > menor * args.tolerancia:
+        print(f"FALHA: a fila cresce com o baralho (tolerância {args.tolerancia}x)")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# Simulador de carga: N sessões do app.py rodando ao mesmo tempo via streamlit AppTest.
+# Cada sessão faz login, registra estudo pela sidebar, abre a agenda e marca aulas do
+# cronograma. Relata percentis de latência por rerun, esperas no banco e memória, em JSON.
+#   python -m benchmarks.carga_sessoes --sessoes 10 --saida carga_v1.json
+#   python -m benchmarks.carga_sessoes --sessoes 100 --comparar carga_v1.json
+# Rode na raiz do repositório. --pg aponta para um PostgreSQL em vez do SQLite temporário.
+# MEDPLANNER_NAV=abas mede o modo antigo, com as nove abas executando a cada rerun.
+import argparse
+import json
+import os
+import pickle
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+from benchmarks._comum import preparar_banco, percentis
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+SENHA = "senha-carga"
+
+class CookiesSemNavegador:
+    """Sem navegador não há componente de cookie: cada sessão simulada é um browser novo."""
+    def __init__(self, key=None): pass
+    def get(self, cookie=None): return None
+    def set(self, *args, **kwargs): pass
+    def delete(self, *args, **kwargs): pass
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _tamanho_estado_kb(at):
+    total = 0
+    for _, valor in at.session_state.items():  # só o que for serializável
+        try: total += len(pickle.dumps(valor))
+        except Exception: pass
+    return total / 1024
+
+class Coletor:
+    def __init__(self):
+        self.trava = threading.Lock()
+        self.latencias, self.erros = {}, {}
+
+    def falha(self, etapa):
+        with self.trava:
+            self.erros[etapa] = self.erros.get(etapa, 0) + 1
+
+    def medir(self, etapa, at):
+        t0 = time.perf_counter()
+        try:
+            at.run()
+            falhou = bool(at.exception) or any("Erro" in e.value for e in at.error)
+        except Exception:
+            falhou = True
+        dt = time.perf_counter() - t0
+        with self.trava:
+            self.latencias.setdefault(etapa, []).append(dt)
+            self.erros[etapa] = self.erros.get(etapa, 0) + falhou
+        return not falhou
+
+def _botao(at, rotulo):
+    return next(b for b in at.button if b.label == rotulo)
+
+def abrir_secao(at, nome):
+    """Escolhe a seção na navegação; no modo MEDPLANNER_NAV=abas é só mais um rerun."""
+    nav = [r for r in at.radio if r.key == "nav_secao"]
+    if nav:
+        nav[0].set_value(nome)
+    return at
+
+def sessao(i, u, args, coletor, temas, estados):
+    try:
+        _roteiro(i, u, args, coletor, temas, estados)
+    except Exception:
+        coletor.falha("sessao")  # widget não encontrado, timeout do AppTest...
+
+def _roteiro(i, u, args, coletor, temas, estados):
+    from streamlit.testing.v1 import AppTest
+    rnd = random.Random(i)
+    at = AppTest.from_file(APP, default_timeout=args.timeout)
+    coletor.medir("abertura", at)
+
+    at.text_input(key="l_user").input(u)
+    at.text_input(key="l_pass").input(SENHA)
+    _botao(at, "Acessar").click()
+    if not coletor.medir("login", at):
+        return
+
+    for _ in range(args.repeticoes):
+        at.sidebar.selectbox[0].select(rnd.choice(temas))
+        tot = rnd.randint(5, 30)
+        at.number_input(key="sb_tot").set_value(tot)
+        at.number_input(key="sb_ac").set_value(rnd.randint(0, tot))
+        at.button(key="btn_sb").click()
+        coletor.medir("registro_sidebar", at)
+
+        coletor.medir("agenda", abrir_secao(at, "agenda"))
+
+        coletor.medir("cronograma", abrir_secao(at, "cronograma"))
+        caixas = [c for c in at.checkbox if c.key and c.key.startswith(("chk_", "cb_blk_"))]
+        if caixas:
+            caixa = rnd.choice(caixas)
+            caixa.set_value(not caixa.value)
+            coletor.medir("cronograma_checkbox", at)
+        time.sleep(args.pensar)
+    estados.append(_tamanho_estado_kb(at))
+
+def _resumo_etapa(amostras, erros):
+    p = percentis(amostras)
+    return {"n": len(amostras), "erros": erros, **{f"{k}_ms": round(v * 1000, 1) for k, v in p.items()}}
+
+def _commit_atual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+def comparar(atual, base):
+    print(f"\n{'etapa':22} {'p95 base':>10} {'p95 atual':>10} {'variação':>9}")
+    for etapa, r in atual["etapas"].items():
+        b = base.get("etapas", {}).get(etapa)
+        if not b: continue
+        delta = (r["p95_ms"] - b["p95_ms"]) / b["p95_ms"] * 100 if b["p95_ms"] else 0.0
+        print(f"{etapa:22} {b['p95_ms']:>10.1f} {r['p95_ms']:>10.1f} {delta:>+8.1f}%")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessoes", type=int, default=10, help="sessões simultâneas (ex.: 10/100/500)")
+    ap.add_argument("--repeticoes", type=int, default=3, help="ciclos registro/agenda/cronograma por sessão")
+    ap.add_argument("--rampa", type=float, default=0.0, help="segundos para espalhar o início das sessões")
+    ap.add_argument("--pensar", type=float, default=0.0, help="pausa entre ciclos (tempo do usuário)")
+    ap.add_argument("--rounds", type=int, default=10, help="custo do bcrypt das contas de teste")
+    ap.add_argument("--timeout", type=float, default=120.0, help="limite por rerun (s)")
+    ap.add_argument("--pg", default=None, help="URL PostgreSQL (padrão: SQLite temporário)")
+    ap.add_argument("--saida", default=None, help="arquivo JSON do relatório")
+    ap.add_argument("--comparar", default=None, help="relatório anterior para comparar p95")
+    args = ap.parse_args()
+
+    caminho = preparar_banco("carga")
+    os.environ["MEDPLANNER_BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.pg:
+        os.environ["MEDPLANNER_DB_URL"] = args.pg
+    os.chdir(RAIZ)
+    import extra_streamlit_components
+    extra_streamlit_components.CookieManager = CookiesSemNavegador
+    import database
+    import aulas_medcof
+
+    usuarios = [f"carga{i:04d}_{datetime.now():%H%M%S}" for i in range(args.sessoes)]
+    for u in usuarios:
+        database.criar_usuario(u, SENHA, u.title())
+    temas = sorted({a[0] for a in aulas_medcof.DADOS_LIMPOS})
+    # Aquecimento fora da medição: imports dos módulos e caches globais do processo
+    aquecimento = f"aquecimento_{datetime.now():%H%M%S}"
+    database.criar_usuario(aquecimento, SENHA, "Aquecimento")
+    sessao(-1, aquecimento, argparse.Namespace(**{**vars(args), "repeticoes": 1, "pensar": 0}), Coletor(), temas, [])
+    banco_antes = database.estatisticas_banco()
+    rss_antes = _rss_mb()
+
+    coletor, estados = Coletor(), []
+    threads = [threading.Thread(target=sessao, args=(i, u, args, coletor, temas, estados), daemon=True) for i, u in enumerate(usuarios)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+        if args.rampa: time.sleep(args.rampa / len(threads))
+    rss_pico = rss_antes
+    while any(t.is_alive() for t in threads):
+        rss_pico = max(rss_pico, _rss_mb())
+        time.sleep(0.2)
+    duracao = time.perf_counter() - t0
+
+    banco_depois = database.estatisticas_banco()
+    reruns = sum(len(v) for v in coletor.latencias.values())
+    estados.sort()
+    relatorio = {
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit_atual(),
+        "config": {**vars(args), "backend": database.get_pool().dialeto, "banco": args.pg and "postgres" or caminho, "cpus": os.cpu_count()},
+        "duracao_s": round(duracao, 2),
+        "reruns": reruns,
+        "reruns_por_s": round(reruns / duracao, 2) if duracao else 0.0,
+        "etapas": {k: _resumo_etapa(v, coletor.erros.get(k, 0)) for k, v in coletor.latencias.items()},
+        "banco": {k: round(banco_depois[k] - banco_antes.get(k, 0), 4) for k in banco_depois},
+        "memoria": {
+            "rss_inicial_mb": round(rss_antes, 1), "rss_pico_mb": round(rss_pico, 1),
+            "por_sessao_kb": round((rss_pico - rss_antes) * 1024 / max(1, args.sessoes), 1),
+            "estado_sessao_kb_p50": round(estados[len(estados) // 2], 1) if estados else None,
+        },
+    }
+    texto = json.dumps(relatorio, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    print(texto)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            comparar(relatorio, json.load(f))
+    return 1 if any(coletor.erros.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
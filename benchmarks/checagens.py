@@ -0,0 +1,35 @@
+# Roda as checagens que passam/falham (código de saída 1) e falha se qualquer uma falhar:
+# é o que vai no CI ou antes de um merge. Cada uma num processo próprio, porque
+# preparar_banco() aponta o database.py para um banco temporário na importação.
+#   python -m benchmarks.checagens                # planos de consulta + regressões (segundos)
+#   python -m benchmarks.checagens --com-tempo    # + orçamentos de tempo (dependem da máquina)
+import argparse
+import subprocess
+import sys
+
+# (módulo, argumentos)
+CORRETUDE = [
+    ("benchmarks.planos_consulta", []),  # EXPLAIN QUERY PLAN das consultas quentes: nada de full scan
+    ("benchmarks.regressao_srs", []),
+]
+TEMPO = [
+    ("benchmarks.bench_planejador", ["--reps", "50"]),
+    ("benchmarks.bench_srs", ["--reps", "50"]),
+    ("benchmarks.suite_database", []),
+]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--com-tempo", action="store_true", help="inclui os benchmarks com orçamento de tempo")
+    args = ap.parse_args()
+
+    falhas = []
+    for modulo, extra in CORRETUDE + (TEMPO if args.com_tempo else []):
+        print(f"=== {modulo} {' '.join(extra)}", flush=True)
+        if subprocess.run([sys.executable, "-m", modulo, *extra]).returncode != 0:
+            falhas.append(modulo)
+    print(f"FALHA: {', '.join(falhas)}" if falhas else "✅ todas as checagens passaram")
+    return 1 if falhas else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# Gerador determinístico de dados sintéticos: usuários com anos de histórico espalhados
+# pelos temas reais de aulas_medcof.DADOS_LIMPOS, backlog de revisões, cronograma e XP.
+# Mesma semente + mesmos parâmetros + mesma data final = mesmo banco.
+#   python -m benchmarks.gerador --usuarios 10000 --anos 3 --db /tmp/grande.db
+import argparse
+import os
+import random
+import bcrypt
+from datetime import date, timedelta
+
+from benchmarks._comum import Cronometro, preparar_banco
+
+# Alunos estudam mais os temas de maior prioridade
+PESO_PRIORIDADE = {"Diamante": 4, "Vermelho": 3, "Amarelo": 2, "Verde": 1}
+BLOCO = 50000
+SENHA = "senha123"
+
+# Tamanhos nomeados usados pela suíte: (usuários, anos, sessões de estudo por semana)
+TAMANHOS = {
+    "p": (100, 1, 3),
+    "m": (1000, 2, 3),
+    "g": (10000, 3, 3),
+}
+
+def _temas():
+    import aulas_medcof
+    temas = [(a, area) for a, area, _ in aulas_medcof.DADOS_LIMPOS]
+    pesos = [PESO_PRIORIDADE.get(p, 1) for _, _, p in aulas_medcof.DADOS_LIMPOS]
+    return temas, pesos
+
+def nome_usuario(i):
+    return f"aluno{i:05d}"
+
+def _linhas_usuario(rnd, u, temas, pesos, ate, anos, por_semana):
+    """Gera (historico, revisoes) de um usuário."""
+    # Intensidade varia muito entre alunos: uns poucos concentram boa parte do volume
+    ritmo = por_semana * rnd.lognormvariate(0, 0.6)
+    inicio = ate - timedelta(days=int(365 * anos * rnd.uniform(0.3, 1.0)))
+    dias = (ate - inicio).days
+    n = max(1, int(dias / 7 * ritmo))
+    habilidade = rnd.uniform(0.45, 0.85)
+    historico, revisoes = [], []
+    escolhidos = rnd.choices(temas, weights=pesos, k=n)
+    for aula, area in escolhidos:
+        dia = inicio + timedelta(days=rnd.randrange(dias + 1))
+        tipo = rnd.choices(("Pos-Aula", "Pre-Aula", "Simulado"), weights=(6, 3, 1))[0]
+        total = rnd.choice((10, 10, 15, 20, 20, 30, 50)) if tipo != "Simulado" else 50
+        acertos = sum(rnd.random() < habilidade for _ in range(total))
+        historico.append((u, aula if tipo != "Simulado" else f"Simulado - {area}", area, dia.isoformat(), acertos, total, tipo))
+        if tipo == "Pos-Aula" and rnd.random() < 0.35:
+            agendada = dia + timedelta(days=rnd.choice((1, 7, 7, 15, 30)))
+            # Revisões antigas quase sempre foram feitas; as recentes formam o backlog
+            status = "Concluido" if agendada < ate - timedelta(days=14) and rnd.random() < 0.85 else "Pendente"
+            revisoes.append((u, aula, area, agendada.isoformat(), "SRS", status))
+    return historico, revisoes
+
+def gerar(usuarios, anos, por_semana, semente=42, ate=None, inicio_usuario=0):
+    """Popula o banco do database.py atual. Retorna contagens por tabela."""
+    import database
+    ate = ate or date.today()
+    temas, pesos = _temas()
+    contagem = {"usuarios": 0, "historico": 0, "revisoes": 0}
+    sql_hist = "INSERT INTO historico (usuario_id, assunto_nome, area_manual, data_estudo, acertos, total, tipo_estudo) VALUES (?,?,?,?,?,?,?)"
+    # Uma pendente por assunto (índice único parcial): sorteios repetidos ficam com a primeira
+    sql_rev = "INSERT INTO revisoes (usuario_id, assunto_nome, grande_area, data_agendada, tipo, status) VALUES (?,?,?,?,?,?) ON CONFLICT DO NOTHING"
+    # Um hash de custo 4 para todos: a suíte mede o banco, não o bcrypt
+    hash_fixo = bcrypt.hashpw(SENHA.encode(), bcrypt.gensalt(4)).decode()
+    hist, revs, contas = [], [], []
+
+    def descarregar(conn):
+        conn.executemany(sql_hist, hist); conn.executemany(sql_rev, revs)
+        conn.executemany("INSERT OR IGNORE INTO usuarios (username, nome, password_hash) VALUES (?,?,?)", contas)
+        contagem["historico"] += len(hist); contagem["revisoes"] += len(revs); contagem["usuarios"] += len(contas)
+        hist.clear(); revs.clear(); contas.clear()
+
+    with database._escrita() as conn:
+        for i in range(inicio_usuario, inicio_usuario + usuarios):
+            u = nome_usuario(i)
+            rnd = random.Random(f"{semente}:{u}")  # cada usuário independe dos outros
+            h, r = _linhas_usuario(rnd, u, temas, pesos, ate, anos, por_semana)
+            hist.extend(h); revs.extend(r); contas.append((u, f"Aluno {i}", hash_fixo))
+            if len(hist) >= BLOCO:
+                descarregar(conn)
+        descarregar(conn)
+        # Cronograma e XP derivados do histórico, como o app teria acumulado
+        conn.execute("""INSERT OR REPLACE INTO cronograma_progresso (usuario_id, aula, feito, acertos_pre, total_pre, acertos_pos, total_pos)
+            SELECT usuario_id, assunto_nome,
+                   MAX(CASE WHEN tipo_estudo = 'Pos-Aula' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN tipo_estudo = 'Pre-Aula' THEN acertos ELSE 0 END), SUM(CASE WHEN tipo_estudo = 'Pre-Aula' THEN total ELSE 0 END),
+                   SUM(CASE WHEN tipo_estudo = 'Pos-Aula' THEN acertos ELSE 0 END), SUM(CASE WHEN tipo_estudo = 'Pos-Aula' THEN total ELSE 0 END)
+            FROM historico WHERE tipo_estudo IN ('Pre-Aula', 'Pos-Aula') GROUP BY usuario_id, assunto_nome""")
+        conn.execute("""INSERT OR REPLACE INTO perfil_gamer (usuario_id, xp, titulo, meta_diaria)
+            SELECT usuario_id, SUM(total) * 2, 'Interno', 50 FROM historico GROUP BY usuario_id""")
+        conn.execute("ANALYZE")
+    return contagem
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tamanho", choices=sorted(TAMANHOS), default=None, help="atalho para usuários/anos/ritmo")
+    ap.add_argument("--usuarios", type=int, default=1000)
+    ap.add_argument("--anos", type=float, default=2)
+    ap.add_argument("--por-semana", type=float, default=3)
+    ap.add_argument("--semente", type=int, default=42)
+    ap.add_argument("--db", default=None, help="arquivo SQLite de destino (padrão: temporário)")
+    args = ap.parse_args()
+    if args.tamanho:
+        args.usuarios, args.anos, args.por_semana = TAMANHOS[args.tamanho]
+
+    caminho = preparar_banco("sintetico")
+    if args.db:
+        caminho = os.environ["MEDPLANNER_DB"] = args.db
+    with Cronometro() as t:
+        contagem = gerar(args.usuarios, args.anos, args.por_semana, args.semente)
+    print(f"{contagem} em {t.segundos:.1f}s -> {caminho}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Roda o mesmo roteiro de funções do database.py no SQLite e no PostgreSQL, compara os
+# resultados e mede a latência de leitura com N sessões concorrentes em cada backend.
+#   python -m benchmarks.paridade_backends --pg postgresql://postgres@localhost/medplanner
+# Sem --pg (nem MEDPLANNER_DB_URL) roda só o SQLite.
+import argparse
+import os
+import threading
+import time
+from datetime import datetime
+
+from benchmarks._comum import preparar_banco, percentis
+
+URL_PG = os.environ.get("MEDPLANNER_DB_URL")
+preparar_banco("paridade")
+import database  # noqa: E402
+import backup  # noqa: E402
+
+def usar_backend(url):
+    try:
+        database.get_pool().fechar()
+    except Exception:
+        pass
+    database.get_pool.clear()
+    database.DB_URL = url
+    return database.get_pool()
+
+def roteiro(u):
+    """Sequência de operações do app; devolve o que cada uma observou."""
+    r = {}
+    r["criar"] = database.criar_usuario(u, "senha", "Ana")
+    r["login"] = database.verificar_login(u, "senha")
+    r["login_errado"] = database.verificar_login(u, "outra")
+    for i in range(5):
+        database.registrar_estudo(u, "Sífilis", 6 + i, 10, srs=(i == 0), tipo_estudo=("Pre-Aula" if i % 2 else "Pos-Aula"))
+    r["lote"] = database.registrar_estudos_em_lote(u, [("Sífilis", 3, 5, None, "Pos-Aula"), {"assunto": "Asma", "acertos": 8, "total": 10, "data": "2026-01-02"}])
+    database.registrar_simulado(u, {"Cirurgia": {"acertos": 30, "total": 50}, "Pediatria": {"acertos": 0, "total": 0}})
+    database.salvar_caderno_erros(u, "Cirurgia", "100% revisado?")
+    database.salvar_caderno_erros(u, "Cirurgia", "Apendicite: 50% dos erros")
+    r["caderno"] = database.get_caderno_erros(u, "Cirurgia")
+    database.salvar_cronograma_status(u, {"Asma": {"feito": True, "acertos_pos": 1, "total_pos": 2}})
+    database.marcar_aula_feita(u, "Asma", False)
+    r["cronograma"] = database.get_cronograma_status(u)
+    database.update_meta_diaria(u, 80)
+    r["gamer"] = database.get_status_gamer(u)[0]
+    r["hoje"] = database.get_progresso_hoje(u)
+    revs = database.listar_revisoes_completas(u)
+    r["revisoes"] = len(revs)
+    database.reagendar_inteligente(int(revs["id"].iloc[0]), "Bom")
+    r["revisoes_pendentes"] = int((database.listar_revisoes_completas(u)["status"] == "Pendente").sum())
+    with database._leitura() as conn:
+        r["rollup"] = [tuple(x) for x in conn.execute("SELECT dia, area, tipo_estudo, acertos, total FROM historico_diario WHERE usuario_id=? ORDER BY 1, 2, 3", (u,)).fetchall()]
+    dados = backup.exportar_usuario(u, formato="csv")
+    r["restauro"] = backup.importar_usuario(dados, u_destino=u + "_copia")
+    r["copia_gamer"] = database.get_status_gamer(u + "_copia")[0]
+    database.resetar_conta_usuario(u)
+    r["apos_reset"] = (database.get_progresso_hoje(u), database.get_status_gamer(u)[0]["xp_atual"])
+    return r
+
+def carga_leitura(u, sessoes, segundos):
+    parar, latencias, trava = threading.Event(), [], threading.Lock()
+    def leitor():
+        local = []
+        while not parar.is_set():
+            t0 = time.perf_counter()
+            database.get_status_gamer(u)
+            database.get_cronograma_status(u)
+            local.append(time.perf_counter() - t0)
+        with trava: latencias.extend(local)
+    threads = [threading.Thread(target=leitor) for _ in range(sessoes)]
+    for t in threads: t.start()
+    time.sleep(segundos)
+    parar.set()
+    for t in threads: t.join()
+    return {"leituras_por_s": round(len(latencias) / segundos, 1), "latencia_ms": {k: round(v * 1000, 3) for k, v in percentis(latencias).items()}}
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pg", default=URL_PG, help="URL do PostgreSQL (padrão: MEDPLANNER_DB_URL)")
+    ap.add_argument("--sessoes", type=int, default=16)
+    ap.add_argument("--segundos", type=float, default=3.0)
+    args = ap.parse_args()
+
+    backends = [("sqlite", database.DB_NAME)] + ([("postgres", args.pg)] if args.pg else [])
+    u = f"paridade_{datetime.now():%H%M%S}"  # nome novo a cada execução: o banco PG pode ser reaproveitado
+    resultados = {}
+    for nome, url in backends:
+        backend = usar_backend(url)
+        resultados[nome] = roteiro(u)
+        database.registrar_estudo(u, "Sífilis", 7, 10)
+        with database._leitura() as conn:
+            versao = database.versao_schema(conn)
+        print(f"{nome:9}: schema v{versao} | leitura {carga_leitura(u, args.sessoes, args.segundos)}")
+        backend.fechar()
+    if len(resultados) == 2:
+        diferencas = [k for k in resultados["sqlite"] if resultados["sqlite"][k] != resultados["postgres"][k]]
+        for k in diferencas:
+            print(f"DIFERENÇA {k}: sqlite={resultados['sqlite'][k]!r} postgres={resultados['postgres'][k]!r}")
+        print("✅ resultados idênticos" if not diferencas else f"❌ {len(diferencas)} diferença(s)")
+        return 1 if diferencas else 0
+    print(resultados["sqlite"])
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+# Confere via EXPLAIN QUERY PLAN que as consultas quentes do database.py usam os índices
+# criados pelas migrações. Sai com código 1 se alguma cair em full scan.
+#   python -m benchmarks.planos_consulta
+import sys
+
+from benchmarks._comum import preparar_banco
+
+preparar_banco("planos")
+import database  # noqa: E402
+
+# (descrição, SQL, parâmetros, índice esperado)
+CONSULTAS_QUENTES = [
+    ("progresso de hoje", "SELECT SUM(total) FROM historico WHERE usuario_id=? AND data_estudo=?", ("u", "2026-01-01"), "idx_historico_usuario_data"),
+    ("rollup de hoje", "SELECT SUM(total) FROM historico_diario WHERE usuario_id=? AND dia=?", ("u", "2026-01-01"), "PRIMARY KEY"),
+    ("histórico do usuário", "SELECT * FROM historico WHERE usuario_id=?", ("u",), "idx_historico_usuario_"),
+    ("desempenho por área", "SELECT SUM(acertos), SUM(total) FROM historico WHERE usuario_id=? AND area_manual=?", ("u", "Cirurgia"), "idx_historico_usuario_area"),
+    ("revisões do usuário", "SELECT * FROM revisoes WHERE usuario_id=?", ("u",), "idx_revisoes_usuario_"),
+    ("fila de pendentes", "SELECT * FROM revisoes WHERE usuario_id=? AND status='Pendente' AND data_agendada <= ? ORDER BY data_agendada", ("u", "2026-01-01"), "idx_revisoes_usuario_status_data"),
+    ("agenda: semana/mês", "SELECT id, status FROM revisoes WHERE usuario_id=? AND data_agendada >= ? AND data_agendada < ? ORDER BY data_agendada, id", ("u", "2026-01-05", "2026-01-12"), "idx_revisoes_usuario_data"),
+    ("pendente dos cartões vencidos", "SELECT id FROM revisoes WHERE usuario_id=? AND status='Pendente' AND assunto_nome IN (?, ?)", ("u", "Asma", "Sífilis"), "idx_revisoes_pendente_unica"),
+    ("fila SM-2 do dia", "SELECT assunto_nome FROM cartoes_srs WHERE usuario_id=? AND proxima <= ? ORDER BY proxima LIMIT 200", ("u", "2026-01-01"), "idx_cartoes_srs_usuario_proxima"),
+    ("agenda: dias futuros", "SELECT DISTINCT substr(data_agendada, 1, 10) FROM revisoes WHERE usuario_id=? AND status='Pendente' AND data_agendada >= ? ORDER BY 1", ("u", "2026-01-02"), "idx_revisoes_usuario_status_data"),
+]
+
+def plano(conn, sql, params):
+    return [r["detail"] for r in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+def main():
+    falhas = 0
+    with database._leitura() as conn:
+        for descricao, sql, params, indice in CONSULTAS_QUENTES:
+            passos = plano(conn, sql, params)
+            ok = any(indice in d for d in passos) and not any(d.startswith("SCAN") for d in passos)
+            falhas += not ok
+            print(f"{'OK ' if ok else 'FALHA'} {descricao}: {' | '.join(passos)}")
+        print(f"schema v{database.versao_schema(conn)}")
+    return 1 if falhas else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
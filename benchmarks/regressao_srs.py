@@ -0,0 +1,55 @@
+# Confere as regras do cartão SM-2 que já quebraram: registrar o mesmo estudo duas vezes no
+# dia não pode dar nota de novo ao cartão (só a agenda dá nota), e "Ruim" é lapso sem mexer na
+# facilidade. O "Agendar" do cronograma só agenda, sem gravar historico; excluir a pendente
+# apaga o cartão.
+# Sai com código 1 se alguma falhar.
+#   python -m benchmarks.regressao_srs
+import sys
+
+from benchmarks._comum import preparar_banco
+
+preparar_banco("regressao_srs")
+import database  # noqa: E402
+import repeticao  # noqa: E402
+
+def _cartao(u, assunto):
+    with database._leitura() as conn:
+        return database._cartoes(conn, u, [assunto])[assunto]
+
+def _pendentes(u, assunto):
+    with database._leitura() as conn:
+        return conn.execute("SELECT id, tipo FROM revisoes WHERE usuario_id=? AND assunto_nome=? AND status='Pendente'", (u, assunto)).fetchall()
+
+def main():
+    checagens = []
+    u, assunto = "ana", "Sífilis"
+    for _ in range(2):
+        database.registrar_estudo(u, assunto, 9, 10, area_f="Preventiva", srs=True)
+    cartao, pendentes = _cartao(u, assunto), _pendentes(u, assunto)
+    checagens.append(("estudo repetido no dia não avança o cartão", (cartao.repeticoes, cartao.intervalo) == (1, 7)))
+    checagens.append(("uma pendente só, de 1 Semana", [r['tipo'] for r in pendentes] == ["1 Semana"]))
+
+    database.concluir_revisoes(u, [pendentes[0]['id']], "Ruim")
+    depois = _cartao(u, assunto)
+    checagens.append(("Ruim é lapso", (depois.repeticoes, depois.intervalo) == (0, repeticao.INTERVALO_LAPSO)))
+    checagens.append(("lapso mantém a facilidade", depois.facilidade == cartao.facilidade))
+
+    with database._leitura() as conn:
+        estudos = conn.execute("SELECT COUNT(*) FROM historico WHERE usuario_id=?", (u,)).fetchone()[0]
+    database.agendar_revisao(u, "Asma", 7, 10, area_f="Clínica Médica")
+    with database._leitura() as conn:
+        depois_agendar = conn.execute("SELECT COUNT(*) FROM historico WHERE usuario_id=?", (u,)).fetchone()[0]
+    checagens.append(("agendar não grava historico", depois_agendar == estudos))
+    checagens.append(("agendar cria o cartão e a pendente", [r['tipo'] for r in _pendentes(u, "Asma")] == ["1 Semana"]))
+
+    database.excluir_revisoes(u, [r['id'] for r in _pendentes(u, "Asma")])
+    with database._leitura() as conn:
+        sobrou = conn.execute("SELECT COUNT(*) FROM cartoes_srs WHERE usuario_id=? AND assunto_nome='Asma'", (u,)).fetchone()[0]
+    checagens.append(("excluir a pendente leva o cartão junto", sobrou == 0))
+
+    for descricao, ok in checagens:
+        print(f"{'OK ' if ok else 'FALHA'} {descricao}")
+    return 0 if all(ok for _, ok in checagens) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
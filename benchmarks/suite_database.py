@@ -0,0 +1,248 @@
+# Suíte de microbenchmarks do database.py sobre dados sintéticos (benchmarks/gerador.py).
+# Cronometra cada função pública em vários tamanhos de banco e compara as medianas com
+# benchmarks/baseline_database.json: piorou além do limiar -> código de saída 1.
+#   python -m benchmarks.suite_database                    # p,m contra o baseline
+#   python -m benchmarks.suite_database --tamanhos p,m,g --gravar-baseline
+# O baseline depende da máquina: grave-o no mesmo hardware em que a suíte vai rodar.
+import argparse
+import gc
+import inspect
+import itertools
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from benchmarks._comum import preparar_banco
+from benchmarks import gerador
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_database.json")
+
+# Públicas que não fazem sentido cronometrar isoladamente (infra, stubs, aliases de import)
+IGNORADAS = {
+    "get_pool", "get_db_connection", "get_db", "get_supabase", "trigger_refresh", "iniciar_rerun",
+    "estatisticas_memo", "estatisticas_banco", "memo_rerun", "aplicar_migracoes", "versao_schema",
+    "colunas_tabela", "listar_conteudo_videoteca", "pesquisar_global", "get_script_run_ctx", "criar_backend",
+}
+
+class Contexto:
+    """Usuários de amostra (leves e pesados) e IDs de revisão a consumir pelas escritas."""
+
+    def __init__(self, database, usuarios):
+        self.db = database
+        with database._leitura() as conn:
+            por_volume = [r[0] for r in conn.execute("SELECT usuario_id FROM historico_diario GROUP BY usuario_id ORDER BY SUM(total) DESC").fetchall()]
+        # Metade dos mais pesados + metade espalhada: as medianas refletem os dois perfis
+        passo = max(1, len(por_volume) // 10)
+        amostra = por_volume[:10] + por_volume[::passo][:10]
+        self._usuarios = itertools.cycle(amostra)
+        self._descartaveis = itertools.cycle(por_volume[len(por_volume) // 2:])  # para resetar_conta_usuario
+        self._ids = iter(())
+        self._n = itertools.count()
+        self.temas = [a for a, _ in gerador._temas()[0]]
+
+    def u(self): return next(self._usuarios)
+    def descartavel(self): return next(self._descartaveis)
+    def revisao(self):
+        rid = next(self._ids, None)
+        if rid is None:
+            # Acabaram: busca as pendentes de novo (reagendar_inteligente cria novas)
+            with self.db._leitura() as conn:
+                self._ids = iter([r[0] for r in conn.execute("SELECT id FROM revisoes WHERE status='Pendente' ORDER BY id").fetchall()])
+            rid = next(self._ids)
+        return rid
+    def lote_revisoes(self, n=10):
+        """(usuário, ids pendentes dele) para as ações em lote da agenda."""
+        u = self.u()
+        with self.db._leitura() as conn:
+            ids = [r[0] for r in conn.execute("SELECT id FROM revisoes WHERE usuario_id=? AND status='Pendente' ORDER BY id LIMIT ?", (u, n)).fetchall()]
+        return u, ids
+    def n(self): return next(self._n)
+    def tema(self): return self.temas[self.n() % len(self.temas)]
+
+def casos(db, ctx):
+    """{função pública: chamada representativa}."""
+    simulado = {"Cirurgia": {"acertos": 30, "total": 50}, "Pediatria": {"acertos": 12, "total": 20}}
+    lote = [(t, 7, 10, "2026-01-15", "Pos-Aula") for t in ctx.temas[:50]]
+    foco_inicio = datetime(2026, 1, 15, 8, 0)
+    curriculo = pd.DataFrame(db.catalogo().registros())
+    desempenho = pd.DataFrame({"Aula": ctx.temas[:200], "acertos": 70, "total": 100, "ultimo": "2026-01-15"})
+    return {
+        # Leituras
+        "get_caderno_erros": lambda: db.get_caderno_erros(ctx.u(), "Cirurgia"),
+        "get_resumo": lambda: db.get_resumo(ctx.u(), "Cirurgia"),
+        "get_cronograma_status": lambda: db.get_cronograma_status(ctx.u()),
+        "get_status_gamer": lambda: db.get_status_gamer(ctx.u()),
+        "get_progresso_hoje": lambda: db.get_progresso_hoje(ctx.u()),
+        "get_minutos_foco": lambda: db.get_minutos_foco(ctx.u()),
+        "get_dados_graficos": lambda: db.get_dados_graficos(ctx.u(), nonce=ctx.n()),  # nonce novo: sem acerto de cache
+        "get_metas_questoes": lambda: db.get_metas_questoes(ctx.u(), nonce=ctx.n()),  # nonce novo: sem acerto de cache
+        "calcular_metas": lambda: db.calcular_metas(curriculo, desempenho, 80),
+        "get_config_plano": lambda: db.get_config_plano(ctx.u()),
+        "get_dados_pessoais": lambda: db.get_dados_pessoais(ctx.u()),
+        "listar_revisoes_completas": lambda: db.listar_revisoes_completas(ctx.u()),
+        "get_assuntos_com_revisao_pendente": lambda: db.get_assuntos_com_revisao_pendente(ctx.u()),
+        "get_fila_srs": lambda: db.get_fila_srs(ctx.u(), date(2026, 1, 15)),
+        "get_cartoes_srs": lambda: db.get_cartoes_srs(ctx.u()),
+        "listar_revisoes": lambda: db.listar_revisoes(ctx.u(), None, 500),
+        "get_agenda_resumo": lambda: db.get_agenda_resumo(ctx.u(), date(2026, 1, 15)),
+        "get_agenda_pendentes_ate": lambda: db.get_agenda_pendentes_ate(ctx.u(), date(2026, 1, 15)),
+        "get_agenda_proximos_dias": lambda: db.get_agenda_proximos_dias(ctx.u(), date(2026, 1, 15), 15),
+        "get_agenda_janela": lambda: db.get_agenda_janela(ctx.u(), date(2026, 1, 1), date(2026, 1, 31)),
+        "get_lista_assuntos_nativa": lambda: db.get_lista_assuntos_nativa(),
+        "get_area_por_assunto": lambda: db.get_area_por_assunto(ctx.tema()),
+        "normalizar_area": lambda: db.normalizar_area(" Cirurgia "),
+        "normalizar_registro_estudo": lambda: db.normalizar_registro_estudo(("Asma", 7, 10, None, None)),
+        "calcular_meta_questoes": lambda: db.calcular_meta_questoes("Diamante"),
+        "get_benchmark_dados": lambda: db.get_benchmark_dados(ctx.u(), None),
+        "get_conquistas_e_stats": lambda: db.get_conquistas_e_stats(ctx.u()),
+        "verificar_login": lambda: db.verificar_login(ctx.u(), gerador.SENHA),
+        # Escritas
+        "registrar_estudo": lambda: db.registrar_estudo(ctx.u(), ctx.tema(), 7, 10),
+        "processar_evento_estudo": lambda: db.processar_evento_estudo({"u": ctx.u(), "assunto": ctx.tema(), "area": "Cirurgia", "data": "2026-01-15", "acertos": 7, "total": 10, "tipo": "Pos-Aula", "srs": True}),
+        "agendar_revisao": lambda: db.agendar_revisao(ctx.u(), ctx.tema(), 7, 10),
+        "registrar_simulado": lambda: db.registrar_simulado(ctx.u(), simulado),
+        "registrar_estudos_em_lote": lambda: db.registrar_estudos_em_lote(ctx.u(), lote),
+        "atualizar_progresso_cronograma": lambda: db.atualizar_progresso_cronograma(ctx.u(), ctx.tema(), 5, 10),
+        "marcar_aula_feita": lambda: db.marcar_aula_feita(ctx.u(), ctx.tema(), True),
+        "marcar_aulas_feitas": lambda: db.marcar_aulas_feitas(ctx.u(), {t: i % 2 == 0 for i, t in enumerate(ctx.temas[:20])}),
+        "resetar_revisoes_aula": lambda: db.resetar_revisoes_aula(ctx.u(), ctx.tema()),
+        "salvar_caderno_erros": lambda: db.salvar_caderno_erros(ctx.u(), "Cirurgia", "Revisar apendicite"),
+        "salvar_resumo": lambda: db.salvar_resumo(ctx.u(), "Pediatria", "Revisar bronquiolite"),
+        "salvar_cronograma_status": lambda: db.salvar_cronograma_status(ctx.u(), {ctx.tema(): {"feito": True, "acertos_pos": 8, "total_pos": 10}}),
+        "registrar_sessao_foco": lambda: db.registrar_sessao_foco(ctx.u(), foco_inicio, foco_inicio + timedelta(minutes=25)),
+        "salvar_config_plano": lambda: db.salvar_config_plano(ctx.u(), date(2026, 12, 13), (6,)),
+        "avaliar_cartoes": lambda: db.avaliar_cartoes(ctx.u(), {t: 4 for t in ctx.temas[:50]}),
+        "reagendar_cartoes": lambda: db.reagendar_cartoes(ctx.u(), {t: date(2026, 2, 1) for t in ctx.temas[:50]}),
+        "concluir_revisoes": lambda: db.concluir_revisoes(*ctx.lote_revisoes(), "Bom"),
+        "adiar_revisoes": lambda: db.adiar_revisoes(*ctx.lote_revisoes(), 3),
+        "excluir_revisoes": lambda: db.excluir_revisoes(*ctx.lote_revisoes()),
+        "update_meta_diaria": lambda: db.update_meta_diaria(ctx.u(), 60),
+        "update_dados_pessoais": lambda: db.update_dados_pessoais(ctx.u(), "aluno@exemplo.com", "2000-01-01"),
+        "reagendar_inteligente": lambda: db.reagendar_inteligente(ctx.revisao(), "Bom"),
+        "excluir_revisao": lambda: db.excluir_revisao(ctx.revisao()),
+        "concluir_revisao": lambda: db.concluir_revisao(ctx.revisao(), 7, 10),
+        "criar_usuario": lambda: db.criar_usuario(f"novo{ctx.n():06d}", gerador.SENHA, "Novo"),
+        "compactar_revisoes_pendentes": lambda: db.compactar_revisoes_pendentes(),
+        "reconstruir_historico_diario": lambda: db.reconstruir_historico_diario(ctx.u()),
+        "resetar_conta_usuario": lambda: db.resetar_conta_usuario(ctx.descartavel()),
+        "migrar_cronogramas_json": lambda: db.migrar_cronogramas_json(),
+    }
+
+def publicas(db):
+    return sorted(nome for nome, obj in vars(db).items()
+                  if not nome.startswith("_") and callable(obj) and not inspect.isclass(obj)
+                  and getattr(obj, "__module__", "database") == "database" and nome not in IGNORADAS)
+
+def cronometrar(fn, reps, orcamento_s):
+    fn()  # aquecimento (caches do SQLite, imports preguiçosos)
+    amostras, inicio = [], time.perf_counter()
+    gc.collect(); gc.disable()  # como o timeit: coletas do GC não entram na amostra
+    try:
+        while len(amostras) < reps and (len(amostras) < 3 or time.perf_counter() - inicio < orcamento_s):
+            t0 = time.perf_counter()
+            fn()
+            amostras.append(time.perf_counter() - t0)
+    finally:
+        gc.enable()
+    amostras.sort()
+    return {"n": len(amostras), "mediana_ms": round(statistics.median(amostras) * 1000, 4),
+            "p95_ms": round(amostras[min(len(amostras) - 1, int(0.95 * len(amostras)))] * 1000, 4)}
+
+def preparar_tamanho(tamanho, semente):
+    import database
+    try:
+        database.get_pool().fechar()
+    except Exception:
+        pass
+    database.get_pool.clear()
+    database.DB_URL = database.DB_NAME = preparar_banco(f"suite_{tamanho}")
+    usuarios, anos, por_semana = gerador.TAMANHOS[tamanho]
+    t0 = time.perf_counter()
+    contagem = gerador.gerar(usuarios, anos, por_semana, semente)
+    contagem["gerado_em_s"] = round(time.perf_counter() - t0, 1)
+    return database, contagem
+
+def _regrediu(antes, agora, limiar, piso_ms):
+    return agora > antes * (1 + limiar) and agora - antes > piso_ms
+
+def regressoes_do_tamanho(res, ref, tabela, args):
+    """Compara com o baseline; suspeitos são recronometrados (vale a melhor mediana),
+    para que um soluço da máquina não reprove a suíte."""
+    encontradas = []
+    for nome, r in res.items():
+        b = ref.get(nome)
+        if not b or not _regrediu(b["mediana_ms"], r["mediana_ms"], args.limiar, args.piso_ms):
+            continue
+        for _ in range(args.confirmacoes):
+            nova = cronometrar(tabela[nome], args.reps, args.orcamento)
+            if nova["mediana_ms"] < r["mediana_ms"]:
+                res[nome] = r = nova
+            if not _regrediu(b["mediana_ms"], r["mediana_ms"], args.limiar, args.piso_ms):
+                break
+        else:
+            encontradas.append((nome, b["mediana_ms"], r["mediana_ms"]))
+    return encontradas
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tamanhos", default="p,m", help=f"tamanhos de {sorted(gerador.TAMANHOS)} separados por vírgula")
+    ap.add_argument("--reps", type=int, default=25)
+    ap.add_argument("--orcamento", type=float, default=2.0, help="segundos máximos por função")
+    ap.add_argument("--filtro", default=None, help="só funções cujo nome contém este texto")
+    ap.add_argument("--semente", type=int, default=42)
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--gravar-baseline", action="store_true")
+    ap.add_argument("--limiar", type=float, default=0.50, help="piora relativa tolerada na mediana")
+    ap.add_argument("--piso-ms", type=float, default=0.2, help="piora absoluta mínima para contar como regressão")
+    ap.add_argument("--confirmacoes", type=int, default=2, help="novas medições antes de declarar regressão")
+    args = ap.parse_args()
+
+    base = {}
+    if not args.gravar_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            base = json.load(f)
+
+    preparar_banco("suite")
+    os.environ["MEDPLANNER_BCRYPT_ROUNDS"] = "4"  # igual ao hash do gerador: sem rehash no login
+    resultado = {"maquina": {"python": platform.python_version(), "sqlite": sqlite3.sqlite_version, "cpus": os.cpu_count(), "plataforma": platform.platform()},
+                 "tamanhos": {}}
+    regressoes = []
+    for tamanho in args.tamanhos.split(","):
+        db, contagem = preparar_tamanho(tamanho.strip(), args.semente)
+        ctx = Contexto(db, contagem["usuarios"])
+        tabela = casos(db, ctx)
+        sem_caso = [n for n in publicas(db) if n not in tabela]
+        if sem_caso:
+            print(f"⚠️  funções públicas sem caso na suíte: {', '.join(sem_caso)}")
+        print(f"\n== tamanho {tamanho}: {contagem}")
+        res = {}
+        for nome, fn in tabela.items():
+            if args.filtro and args.filtro not in nome: continue
+            res[nome] = cronometrar(fn, args.reps, args.orcamento)
+            print(f"  {nome:32} mediana {res[nome]['mediana_ms']:>10.3f} ms | p95 {res[nome]['p95_ms']:>10.3f} ms")
+        ref = base.get("tamanhos", {}).get(tamanho, {}).get("casos", {})
+        regressoes += [(tamanho, *r) for r in regressoes_do_tamanho(res, ref, tabela, args)]
+        resultado["tamanhos"][tamanho] = {"dados": contagem, "casos": res}
+
+    if args.gravar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\nbaseline gravado em {args.baseline}")
+        return 0
+    if not base:
+        print("\nsem baseline para comparar (use --gravar-baseline)")
+        return 0
+    for tamanho, nome, antes, agora in regressoes:
+        print(f"❌ [{tamanho}] {nome}: {antes:.3f} -> {agora:.3f} ms (+{(agora / antes - 1) * 100:.0f}%)")
+    print("\n✅ sem regressões" if not regressoes else f"\n{len(regressoes)} regressão(ões) acima de {args.limiar:.0%}")
+    return 1 if regressoes else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# catalogo.py
+# Índice do currículo (aulas_medcof.BLOCOS) montado uma vez por processo e imutável.
+# Cada aula tem um id inteiro estável (CRC32 do nome: não muda se a lista for reordenada
+# ou ganhar aulas novas), bloco, área e prioridade. Busca por nome ou id em O(1).
+import functools
+import zlib
+from types import MappingProxyType
+from typing import NamedTuple
+
+PRIORIDADE_PADRAO = "Normal"
+AREA_PADRAO = "Geral"
+
+class Aula(NamedTuple):
+    id: int
+    nome: str
+    area: str
+    prioridade: str
+    bloco: str
+    ordem: int  # posição no cronograma (0 = primeira aula do bloco 1)
+
+def id_aula(nome):
+    return zlib.crc32(nome.encode("utf-8"))
+
+class Catalogo:
+    """Somente leitura: tuplas e MappingProxyType, seguro para compartilhar entre sessões."""
+    __slots__ = ("aulas", "blocos", "areas", "por_nome", "por_id", "nomes_ordenados")
+
+    def __init__(self, blocos):
+        aulas, por_nome, por_id = [], {}, {}
+        for bloco, itens in blocos:
+            for item in itens:
+                nome, area = item[0], item[1]
+                prio = item[2] if len(item) > 2 else PRIORIDADE_PADRAO
+                aula = Aula(id_aula(nome), nome, area, prio, bloco, len(aulas))
+                if nome in por_nome:
+                    raise ValueError(f"Aula repetida no currículo: {nome!r}")
+                if aula.id in por_id:
+                    raise ValueError(f"Colisão de id entre {nome!r} e {por_id[aula.id].nome!r}")
+                aulas.append(aula)
+                por_nome[nome] = por_id[aula.id] = aula
+        self.aulas = tuple(aulas)
+        self.blocos = tuple(b for b, _ in blocos)
+        self.areas = tuple(sorted({a.area for a in aulas}))
+        self.por_nome = MappingProxyType(por_nome)
+        self.por_id = MappingProxyType(por_id)
+        self.nomes_ordenados = tuple(sorted(por_nome))
+
+    def __len__(self):
+        return len(self.aulas)
+
+    def __iter__(self):
+        return iter(self.aulas)
+
+    def __contains__(self, nome):
+        return nome in self.por_nome
+
+    def aula(self, nome):
+        return self.por_nome.get(nome)
+
+    def area(self, nome, padrao=AREA_PADRAO):
+        aula = self.por_nome.get(nome)
+        return aula.area if aula else padrao
+
+    def registros(self):
+        """Lista de dicts no formato que o cronograma monta em DataFrame."""
+        return [{"Id": a.id, "Bloco": a.bloco, "Aula": a.nome, "Area": a.area, "Prioridade": a.prioridade} for a in self.aulas]
+
+@functools.lru_cache(maxsize=1)
+def catalogo():
+    import aulas_medcof
+    return Catalogo(aulas_medcof.BLOCOS)
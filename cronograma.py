@@ -1,15 +1,22 @@
 import streamlit as st
 import pandas as pd
-import re
 import time
+from datetime import datetime
 from database import (
     get_cronograma_status, 
-    salvar_cronograma_status, 
+    marcar_aulas_feitas, 
     normalizar_area, 
-    calcular_meta_questoes,
+    get_metas_questoes,
+    get_status_gamer,
+    get_config_plano,
+    salvar_config_plano,
+    CAMPOS_PROGRESSO,
     resetar_revisoes_aula,
-    registrar_estudo
+    agendar_revisao,
+    get_assuntos_com_revisao_pendente
 )
+from catalogo import catalogo
+from planejador import DIAS_SEMANA, replanejar
 
 # Configuração Visual das Prioridades
 PRIORIDADES_STYLE = {
@@ -19,16 +26,62 @@ PRIORIDADES_STYLE = {
     "Verde":    {"icon": "🟢", "color": "#388E3C", "bg": "#E8F5E9", "label": "Baixa"},
     "Normal":   {"icon": "⚪", "color": "#757575", "bg": "#F5F5F5", "label": "Normal"}
 }
+ROTULOS_PRIORIDADE = {p: f"{s['icon']} {s['label']}" for p, s in PRIORIDADES_STYLE.items()}
 
-def update_row_callback(u, aula_nome, full_state):
-    """Atualiza o checkbox de conclusão e salva."""
-    check = st.session_state.get(f"chk_{aula_nome}", False)
-    d_atual = full_state.get(aula_nome, {})
-    d_atual["feito"] = check
-    full_state[aula_nome] = d_atual
-    
-    salvar_cronograma_status(u, full_state)
-    st.toast("Progresso salvo!", icon="✅")
+# Grade: um único st.data_editor em vez de ~6 widgets por aula
+VISOES = {"Lista": "📝 Lista", "Blocos": "📅 Cards", "Grade": "▦ Grade", "Plano": "🗓️ Plano"}
+PLANO_KEY = "_plano_estudo"  # último plano calculado: só é refeito quando as entradas mudam
+DIAS_PLANO_VISIVEIS = 14
+
+# Cada grupo (expander) e a grade de cards rodam num st.fragment: marcar uma aula reexecuta
+# só aquele pedaço. Os cliques ficam em session_state e vão ao banco juntos, numa transação,
+# quando o usuário para de clicar por DEBOUNCE_S, clica em Salvar, ou no próximo rerun do app.
+# O vigia fica sempre montado: sem pendências cada volta do timer só confere o buffer e sai
+# (nenhuma consulta, nenhum elemento); a gravação é o único rerun do app por rodada de cliques.
+DEBOUNCE_S = 3
+PENDENTES_KEY = "cron_pendentes"
+ULTIMA_EDICAO_KEY = "cron_ultima_edicao"
+
+def _fragmento(fn=None, **opcoes):
+    if not hasattr(st, "fragment"):  # streamlit < 1.37: rerun inteiro (e gravação a cada clique)
+        return fn if fn is not None else (lambda f: f)
+    return st.fragment(fn, **opcoes) if fn is not None else st.fragment(**opcoes)
+
+def marcar_pendente_callback(aula_nome, key, salvo):
+    """Guarda o clique no buffer; voltar ao valor salvo cancela a pendência."""
+    pendentes = st.session_state.setdefault(PENDENTES_KEY, {})
+    check = bool(st.session_state.get(key, False))
+    if check == bool(salvo):
+        pendentes.pop(aula_nome, None)
+    else:
+        pendentes[aula_nome] = check
+    st.session_state[ULTIMA_EDICAO_KEY] = time.time()
+
+def salvar_pendentes(u):
+    """Grava as aulas marcadas/desmarcadas de uma vez. Retorna quantas foram gravadas."""
+    pendentes = st.session_state.get(PENDENTES_KEY)
+    if not pendentes:
+        return 0
+    n = marcar_aulas_feitas(u, pendentes)
+    st.session_state[PENDENTES_KEY] = {}
+    st.toast(f"Progresso salvo ({n} aula{'s' if n > 1 else ''})!", icon="✅")
+    return n
+
+def _feito(estado, aula):
+    pendentes = st.session_state.get(PENDENTES_KEY, {})
+    return pendentes[aula] if aula in pendentes else estado.get(aula, {}).get('feito', False)
+
+@_fragmento(run_every=DEBOUNCE_S)
+def _vigia_pendentes(u):
+    pendentes = st.session_state.get(PENDENTES_KEY)
+    if not pendentes:
+        return
+    quieto = time.time() - st.session_state.get(ULTIMA_EDICAO_KEY, 0) >= DEBOUNCE_S
+    c_txt, c_btn = st.columns([4, 1])
+    c_txt.caption(f"✏️ {len(pendentes)} alteração(ões) pendente(s) — salvamento automático em {DEBOUNCE_S}s sem cliques")
+    if c_btn.button("💾 Salvar", key="cron_salvar", use_container_width=True) or quieto:
+        salvar_pendentes(u)
+        st.rerun()  # KPIs, sidebar e títulos dos grupos refletem o lote salvo
 
 def reset_callback(u, aula_nome):
     """Zera o ciclo de revisão."""
@@ -38,49 +91,32 @@ def reset_callback(u, aula_nome):
         st.rerun()
 
 def agendar_revisao_callback(u, aula_nome, acertos_total, total_total):
-    """Marca como revisado e cria agendamento na agenda."""
-    msg = registrar_estudo(u, aula_nome, acertos_total, total_total, tipo_estudo="Pos-Aula", srs=True)
+    """Cria o agendamento na agenda sem registrar estudo (uma vez: com revisão pendente, não faz nada)."""
+    if aula_nome in get_assuntos_com_revisao_pendente(u):
+        st.toast(f"'{aula_nome}' já tem revisão agendada.", icon="📅")
+        return
+    msg = agendar_revisao(u, aula_nome, acertos_total, total_total)
     if "agendada" in msg or "Salvo" in msg or "salvo" in msg:
         st.toast(f"Revisão agendada para {aula_nome}!", icon="📅")
     else:
         st.error(f"Erro ao agendar: {msg}")
 
 def ler_dados_nativos():
-    """Lê o arquivo de aulas e extrai blocos e prioridades."""
-    mapa = []
-    try:
-        import aulas_medcof
-        dados_brutos = getattr(aulas_medcof, 'DADOS_LIMPOS', [])
-        
-        with open('aulas_medcof.py', 'r', encoding='utf-8') as f: lines = f.readlines()
-        
-        idx = 0
-        bloco_atual = "Geral"
-        
-        for line in lines:
-            m = re.search(r'#\s*-+\s*(BLOCO\s*.*)\s*-+', line, re.IGNORECASE)
-            if m: bloco_atual = m.group(1).strip()
-            
-            if idx < len(dados_brutos):
-                item = dados_brutos[idx]
-                nome = item[0]
-                if nome in line:
-                    area = item[1]
-                    prio = item[2] if len(item) > 2 else "Normal"
-                    mapa.append({"Bloco": bloco_atual, "Aula": nome, "Area": area, "Prioridade": prio})
-                    idx += 1
-        return mapa
-    except: return []
+    """Aulas com bloco, área e prioridade (catálogo montado uma vez por processo)."""
+    return catalogo().registros()
 
 def render_cronograma(conn_ignored):
     st.header("🗂️ Cronograma Extensivo")
     
     u = st.session_state.username
+    salvar_pendentes(u)  # troca de visão/agrupamento: o buffer vai ao banco antes de ler o estado
     dados_mapa = ler_dados_nativos()
     
     if not dados_mapa: st.warning("Sem dados de aulas."); return
     df = pd.DataFrame(dados_mapa)
     estado = get_cronograma_status(u)
+    # Metas pré/pós de todas as aulas numa passada (prioridade, acerto histórico, recência, meta diária)
+    df = df.join(get_metas_questoes(u, st.session_state.data_nonce)[["meta_pre", "meta_pos"]], on="Aula")
     
     # --- CONTROLE DE ESTADO DA VISÃO ---
     if 'cronograma_view_mode' not in st.session_state:
@@ -92,7 +128,7 @@ def render_cronograma(conn_ignored):
     c_kpi, c_ctrl1, c_ctrl2 = st.columns([4, 1.5, 1.5])
     
     with c_kpi:
-        concluidas = sum(1 for k, v in estado.items() if v.get('feito'))
+        concluidas = sum(1 for a in df['Aula'] if _feito(estado, a))
         total_aulas = len(df)
         total_q = sum((v.get('total_pos', 0) or 0) + (v.get('total_pre', 0) or 0) for v in estado.values())
         
@@ -100,11 +136,7 @@ def render_cronograma(conn_ignored):
         st.progress(prog_pct, text=f"Progresso: {concluidas}/{total_aulas} temas ({int(prog_pct*100)}%) | Questões: {total_q}")
 
     with c_ctrl1:
-        icon_view = "📅" if st.session_state.cronograma_view_mode == "Lista" else "📝"
-        label_view = "Ver Cards" if st.session_state.cronograma_view_mode == "Lista" else "Ver Lista"
-        if st.button(f"{icon_view} {label_view}", use_container_width=True):
-            st.session_state.cronograma_view_mode = "Blocos" if st.session_state.cronograma_view_mode == "Lista" else "Lista"
-            st.rerun()
+        st.selectbox("Visão", list(VISOES), key="cronograma_view_mode", format_func=VISOES.get, label_visibility="collapsed")
             
     with c_ctrl2:
         icon_grp = "📚" if st.session_state.cronograma_group_by == "Bloco" else "🗂️"
@@ -113,69 +145,24 @@ def render_cronograma(conn_ignored):
             st.session_state.cronograma_group_by = "Area" if st.session_state.cronograma_group_by == "Bloco" else "Bloco"
             st.rerun()
     
+    _vigia_pendentes(u)
     st.divider()
 
     coluna_agrupamento = st.session_state.cronograma_group_by
-    grupos_unicos = sorted(df[coluna_agrupamento].unique())
+    # Blocos na ordem do cronograma (alfabética poria o BLOCO 10 antes do BLOCO 2)
+    grupos_unicos = list(catalogo().blocos) if coluna_agrupamento == "Bloco" else sorted(df[coluna_agrupamento].unique())
 
     # --- RENDERIZAÇÃO ---
 
-    if st.session_state.cronograma_view_mode == "Blocos":
-        # === VISÃO DE CARDS ===
-        grupo_sel = st.selectbox(f"Filtrar {coluna_agrupamento}:", ["Todos"] + list(grupos_unicos))
-        df_view = df if grupo_sel == "Todos" else df[df[coluna_agrupamento] == grupo_sel]
-        
-        cols = st.columns(3)
-        for idx, row in df_view.iterrows():
-            aula = row['Aula']
-            prio = row['Prioridade']
-            d = estado.get(aula, {})
-            
-            with cols[idx % 3]:
-                with st.container(border=True):
-                    st.markdown(f"**{aula}**")
-                    
-                    style = PRIORIDADES_STYLE.get(prio, PRIORIDADES_STYLE["Normal"])
-                    st.markdown(
-                        f"<div style='background-color:{style['bg']};color:{style['color']};padding:2px;border-radius:4px;text-align:center;font-size:0.75em;font-weight:bold;margin-bottom:5px'>"
-                        f"{style['icon']} {style['label']}</div>", 
-                        unsafe_allow_html=True
-                    )
-                    
-                    c_chk, c_meta = st.columns([0.2, 0.8])
-                    c_chk.checkbox("Feito", value=d.get('feito', False), key=f"cb_blk_{aula}", on_change=update_row_callback, args=(u, aula, estado), label_visibility="collapsed")
-                    
-                    meta_pre, meta_pos = calcular_meta_questoes(prio, d.get('ultimo_desempenho'))
-                    tt_pre = d.get('total_pre', 0)
-                    tt_pos = d.get('total_pos', 0)
-                    
-                    # --- BARRA DE PROGRESSO POR ASSUNTO ---
-                    total_atual = tt_pre + tt_pos
-                    total_meta = meta_pre + meta_pos
-                    
-                    if total_meta > 0:
-                        prog_assunto = min(total_atual / total_meta, 1.0)
-                        # Cor condicional (Verde se bateu a meta, Azul se está em progresso)
-                        cor_barra = "green" if total_atual >= total_meta else "blue"
-                        st.progress(prog_assunto, text=f"{int(prog_assunto*100)}% ({total_atual}/{total_meta}q)")
-                    else:
-                        st.progress(0, text="0/0q")
-                    
-                    st.caption(f"Pré: {tt_pre}/{meta_pre} | Pós: {tt_pos}/{meta_pos}")
-                    
-                    c_agd, c_rst = st.columns(2)
-                    ac_pos = d.get('acertos_pos', 0)
-                    
-                    if c_agd.button("📅 Agendar", key=f"agd_blk_{aula}", help="Agendar Revisão", disabled=tt_pos==0):
-                        agendar_revisao_callback(u, aula, ac_pos, tt_pos)
-                        st.rerun()
-                    
-                    if c_rst.button("↺ Reset", key=f"rst_blk_{aula}"):
-                        reset_callback(u, aula)
-                        st.rerun()
-
+    if st.session_state.cronograma_view_mode == "Plano":
+        _render_plano(u, df, estado)
+    elif st.session_state.cronograma_view_mode == "Grade":
+        _render_grade(df, estado, coluna_agrupamento)
+    elif st.session_state.cronograma_view_mode == "Blocos":
+        _render_cards(u, df, estado, coluna_agrupamento, grupos_unicos)
     else:
         # === VISÃO DE LISTA (EXPANDERS) ===
+        # O título do expander vem do estado salvo: mudá-lo num rerun do fragmento fecharia o expander
         for grupo in grupos_unicos:
             df_grupo = df[df[coluna_agrupamento] == grupo]
             feitas_grupo = sum(1 for a in df_grupo['Aula'] if estado.get(a, {}).get('feito'))
@@ -184,51 +171,194 @@ def render_cronograma(conn_ignored):
             if coluna_agrupamento == 'Area': titulo_expander = f"🏥 {grupo.upper()}"
             
             with st.expander(f"{titulo_expander} ({feitas_grupo}/{len(df_grupo)})", expanded=False):
-                c_h1, c_h2, c_h3, c_h4, c_h5, c_h6 = st.columns([0.05, 0.15, 0.30, 0.15, 0.15, 0.20])
-                c_h1.caption("✔"); c_h2.caption("Prioridade"); c_h3.caption("Aula"); c_h4.caption("Pré-Aula"); c_h5.caption("Pós-Aula"); c_h6.caption("Ação")
-
-                for _, row in df_grupo.iterrows():
-                    aula = row['Aula']
-                    prio = row['Prioridade']
-                    d = estado.get(aula, {})
-                    meta_pre, meta_pos = calcular_meta_questoes(prio, d.get('ultimo_desempenho'))
-                    
-                    c1, c2, c3, c4, c5, c6 = st.columns([0.05, 0.15, 0.30, 0.15, 0.15, 0.20])
-                    
-                    c1.checkbox(" ", value=d.get('feito', False), key=f"chk_{aula}", on_change=update_row_callback, args=(u, aula, estado), label_visibility="collapsed")
-                    
-                    with c2:
-                        s = PRIORIDADES_STYLE.get(prio, PRIORIDADES_STYLE["Normal"])
-                        st.markdown(f"<div style='background:{s['bg']};color:{s['color']};padding:2px;border-radius:4px;text-align:center;font-size:0.7em;font-weight:bold'>{s['icon']} {s['label']}</div>", unsafe_allow_html=True)
-                    
-                    with c3:
-                        st.markdown(f"**{aula}**")
-                        # --- BARRA DE PROGRESSO POR ASSUNTO (Compacta) ---
-                        tt_total = d.get('total_pre', 0) + d.get('total_pos', 0)
-                        meta_total = meta_pre + meta_pos
-                        if meta_total > 0:
-                            prog_subj = min(tt_total / meta_total, 1.0)
-                            st.progress(prog_subj) # Barra sem texto para não poluir a linha
-                        else:
-                            st.caption("-")
-                    
-                    acp, ttp = d.get('acertos_pre', 0), d.get('total_pre', 0)
-                    with c4: st.progress(min(ttp/meta_pre, 1.0) if meta_pre>0 else 0, text=f"{acp}/{ttp}")
-                    
-                    acps, ttps = d.get('acertos_pos', 0), d.get('total_pos', 0)
-                    with c5: st.progress(min(ttps/meta_pos, 1.0) if meta_pos>0 else 0, text=f"{acps}/{ttps}")
-                    
-                    with c6:
-                        tt_geral = ttp + ttps
-                        if tt_geral > 0:
-                            ca, cb = st.columns(2)
-                            if ca.button("📅", key=f"agd_{aula}", help="Agendar Revisão"):
-                                agendar_revisao_callback(u, aula, acp+acps, tt_geral)
-                                st.rerun()
-                            if cb.button("↺", key=f"rst_{aula}", help="Reiniciar"):
-                                reset_callback(u, aula)
-                                st.rerun()
-                        else:
-                            st.caption("—")
-                    
-                    st.markdown("<hr style='margin:2px 0; border-top: 1px solid #f0f2f6;'>", unsafe_allow_html=True)
\ No newline at end of file
+                _render_grupo(u, df_grupo, estado)
+
+def frame_grade(df, estado):
+    """Currículo (com meta_pre/meta_pos) + progresso numa tabela só; percentuais por coluna."""
+    prog = pd.DataFrame.from_dict(estado, orient="index").reindex(columns=["feito", *CAMPOS_PROGRESSO])
+    grade = df.join(prog, on="Aula")
+    for c in CAMPOS_PROGRESSO:
+        grade[c] = grade[c].fillna(0).astype(int)
+    grade["Feito"] = grade["feito"].fillna(False).astype(bool)
+    meta_pre, meta_pos = grade["meta_pre"], grade["meta_pos"]
+    grade["Prio"] = grade["Prioridade"].map(ROTULOS_PRIORIDADE).fillna(ROTULOS_PRIORIDADE["Normal"])
+    grade["Pré"] = grade["acertos_pre"].astype(str) + "/" + grade["total_pre"].astype(str)
+    grade["Pós"] = grade["acertos_pos"].astype(str) + "/" + grade["total_pos"].astype(str)
+    grade["Pré %"] = (grade["total_pre"] / meta_pre).clip(upper=1.0) * 100
+    grade["Pós %"] = (grade["total_pos"] / meta_pos).clip(upper=1.0) * 100
+    grade["Meta %"] = ((grade["total_pre"] + grade["total_pos"]) / (meta_pre + meta_pos)).clip(upper=1.0) * 100
+    return grade[["Aula", "Feito", "Prio", "Bloco", "Area", "Meta %", "Pré", "Pré %", "Pós", "Pós %"]].set_index("Aula")
+
+@_fragmento
+def _render_grade(df, estado, coluna_agrupamento):
+    # === VISÃO DE GRADE (um único st.data_editor) ===
+    # Só "Feito" é editável. O diff contra o estado salvo entra no mesmo buffer das outras
+    # visões; a chave muda com o data_nonce, então depois de salvar o editor recomeça limpo.
+    grade = frame_grade(df, estado)
+    if coluna_agrupamento != "Bloco":  # por bloco, o currículo já vem na ordem certa
+        grade = grade.sort_values(coluna_agrupamento, kind="stable")
+    pct = lambda rotulo: st.column_config.ProgressColumn(rotulo, min_value=0, max_value=100, format="%.0f%%")
+    editado = st.data_editor(
+        grade, key=f"cron_grade_{st.session_state.data_nonce}", use_container_width=True, height=600,
+        disabled=[c for c in grade.columns if c != "Feito"],
+        column_config={"Feito": st.column_config.CheckboxColumn("✔", width="small"), "Prio": "Prioridade",
+                       "Meta %": pct("Meta"), "Pré %": pct("Pré %"), "Pós %": pct("Pós %")},
+    )
+    mudou = editado["Feito"] != grade["Feito"]
+    novas = editado.loc[mudou, "Feito"].to_dict()
+    if novas != st.session_state.get(PENDENTES_KEY, {}):
+        st.session_state[PENDENTES_KEY] = novas
+        st.session_state[ULTIMA_EDICAO_KEY] = time.time()
+
+@_fragmento
+def _render_plano(u, df, estado):
+    # === VISÃO DE PLANO (aulas pendentes distribuídas até a prova) ===
+    cfg = get_config_plano(u)
+    c_prova, c_folga = st.columns(2)
+    prova = c_prova.date_input("Data da prova", value=cfg["data_prova"], key="plano_prova")
+    folga = c_folga.multiselect("Folgas na semana", range(7), default=list(cfg["folga_semana"]),
+                                format_func=DIAS_SEMANA.__getitem__, key="plano_folga")
+    if prova != cfg["data_prova"] or tuple(sorted(folga)) != cfg["folga_semana"]:
+        salvar_config_plano(u, prova, folga)
+
+    hoje = datetime.now().date()
+    status, _ = get_status_gamer(u, st.session_state.data_nonce)
+    aulas = list(df["Aula"])
+    custos = dict(zip(aulas, (df["meta_pre"] + df["meta_pos"]).astype(int)))
+    feitas = [a for a in aulas if _feito(estado, a)]
+    plano = replanejar(st.session_state.get(PLANO_KEY), aulas, custos, feitas,
+                       status["meta_diaria"], hoje, prova, folga)
+    st.session_state[PLANO_KEY] = plano
+
+    if not plano.dias:
+        st.warning("Nenhum dia de estudo até a prova com essas folgas.")
+        return
+    pendentes = len(aulas) - len(feitas)
+    k1, k2, k3 = st.columns(3)
+    k1.metric("Dias de estudo", len(plano.dias))
+    k2.metric("Aulas pendentes", pendentes)
+    k3.metric("Questões/dia", plano.meta_necessaria, delta=plano.meta_necessaria - plano.meta_diaria or None, delta_color="inverse")
+    if not pendentes:
+        st.success("Currículo concluído! Agora é revisão até a prova.")
+        return
+    if plano.meta_necessaria > plano.meta_diaria:
+        st.warning(f"No ritmo atual ({plano.meta_diaria} q/dia) o currículo não cabe até {prova:%d/%m}: "
+                   f"são necessárias {plano.meta_necessaria} q/dia.")
+    st.caption(f"Término previsto: {plano.termino:%d/%m/%Y}")
+
+    linhas = [{"Data": f"{d:%d/%m} ({DIAS_SEMANA[d.weekday()]})", "Aulas": " · ".join(lista) or "—", "Questões": carga}
+              for d, lista, carga in zip(plano.dias, plano.aulas_por_dia, plano.carga_por_dia)
+              if d >= hoje][:DIAS_PLANO_VISIVEIS]
+    st.dataframe(pd.DataFrame(linhas), hide_index=True, use_container_width=True)
+
+@_fragmento
+def _render_cards(u, df, estado, coluna_agrupamento, grupos_unicos):
+    # === VISÃO DE CARDS ===
+    grupo_sel = st.selectbox(f"Filtrar {coluna_agrupamento}:", ["Todos"] + list(grupos_unicos))
+    df_view = df if grupo_sel == "Todos" else df[df[coluna_agrupamento] == grupo_sel]
+    
+    cols = st.columns(3)
+    for idx, row in df_view.iterrows():
+        aula = row['Aula']
+        prio = row['Prioridade']
+        d = estado.get(aula, {})
+        
+        with cols[idx % 3]:
+            with st.container(border=True):
+                st.markdown(f"**{aula}**")
+                
+                style = PRIORIDADES_STYLE.get(prio, PRIORIDADES_STYLE["Normal"])
+                st.markdown(
+                    f"<div style='background-color:{style['bg']};color:{style['color']};padding:2px;border-radius:4px;text-align:center;font-size:0.75em;font-weight:bold;margin-bottom:5px'>"
+                    f"{style['icon']} {style['label']}</div>", 
+                    unsafe_allow_html=True
+                )
+                
+                c_chk, c_meta = st.columns([0.2, 0.8])
+                c_chk.checkbox("Feito", value=_feito(estado, aula), key=f"cb_blk_{aula}", on_change=marcar_pendente_callback, args=(aula, f"cb_blk_{aula}", d.get('feito', False)), label_visibility="collapsed")
+                
+                meta_pre, meta_pos = int(row['meta_pre']), int(row['meta_pos'])
+                tt_pre = d.get('total_pre', 0)
+                tt_pos = d.get('total_pos', 0)
+                
+                # --- BARRA DE PROGRESSO POR ASSUNTO ---
+                total_atual = tt_pre + tt_pos
+                total_meta = meta_pre + meta_pos
+                
+                if total_meta > 0:
+                    prog_assunto = min(total_atual / total_meta, 1.0)
+                    # Cor condicional (Verde se bateu a meta, Azul se está em progresso)
+                    cor_barra = "green" if total_atual >= total_meta else "blue"
+                    st.progress(prog_assunto, text=f"{int(prog_assunto*100)}% ({total_atual}/{total_meta}q)")
+                else:
+                    st.progress(0, text="0/0q")
+                
+                st.caption(f"Pré: {tt_pre}/{meta_pre} | Pós: {tt_pos}/{meta_pos}")
+                
+                c_agd, c_rst = st.columns(2)
+                ac_pos = d.get('acertos_pos', 0)
+                
+                agendada = aula in get_assuntos_com_revisao_pendente(u)
+                if c_agd.button("📅 Agendar", key=f"agd_blk_{aula}", help="Revisão já agendada" if agendada else "Agendar Revisão", disabled=tt_pos==0 or agendada):
+                    salvar_pendentes(u)
+                    agendar_revisao_callback(u, aula, ac_pos, tt_pos)
+                    st.rerun()
+                
+                if c_rst.button("↺ Reset", key=f"rst_blk_{aula}"):
+                    salvar_pendentes(u)
+                    reset_callback(u, aula)
+                    st.rerun()
+
+@_fragmento
+def _render_grupo(u, df_grupo, estado):
+    c_h1, c_h2, c_h3, c_h4, c_h5, c_h6 = st.columns([0.05, 0.15, 0.30, 0.15, 0.15, 0.20])
+    c_h1.caption("✔"); c_h2.caption("Prioridade"); c_h3.caption("Aula"); c_h4.caption("Pré-Aula"); c_h5.caption("Pós-Aula"); c_h6.caption("Ação")
+
+    for _, row in df_grupo.iterrows():
+        aula = row['Aula']
+        prio = row['Prioridade']
+        d = estado.get(aula, {})
+        meta_pre, meta_pos = int(row['meta_pre']), int(row['meta_pos'])
+        
+        c1, c2, c3, c4, c5, c6 = st.columns([0.05, 0.15, 0.30, 0.15, 0.15, 0.20])
+        
+        c1.checkbox(" ", value=_feito(estado, aula), key=f"chk_{aula}", on_change=marcar_pendente_callback, args=(aula, f"chk_{aula}", d.get('feito', False)), label_visibility="collapsed")
+        
+        with c2:
+            s = PRIORIDADES_STYLE.get(prio, PRIORIDADES_STYLE["Normal"])
+            st.markdown(f"<div style='background:{s['bg']};color:{s['color']};padding:2px;border-radius:4px;text-align:center;font-size:0.7em;font-weight:bold'>{s['icon']} {s['label']}</div>", unsafe_allow_html=True)
+        
+        with c3:
+            st.markdown(f"**{aula}**")
+            # --- BARRA DE PROGRESSO POR ASSUNTO (Compacta) ---
+            tt_total = d.get('total_pre', 0) + d.get('total_pos', 0)
+            meta_total = meta_pre + meta_pos
+            if meta_total > 0:
+                prog_subj = min(tt_total / meta_total, 1.0)
+                st.progress(prog_subj) # Barra sem texto para não poluir a linha
+            else:
+                st.caption("-")
+        
+        acp, ttp = d.get('acertos_pre', 0), d.get('total_pre', 0)
+        with c4: st.progress(min(ttp/meta_pre, 1.0) if meta_pre>0 else 0, text=f"{acp}/{ttp}")
+        
+        acps, ttps = d.get('acertos_pos', 0), d.get('total_pos', 0)
+        with c5: st.progress(min(ttps/meta_pos, 1.0) if meta_pos>0 else 0, text=f"{acps}/{ttps}")
+        
+        with c6:
+            tt_geral = ttp + ttps
+            if tt_geral > 0:
+                ca, cb = st.columns(2)
+                agendada = aula in get_assuntos_com_revisao_pendente(u)
+                if ca.button("📅", key=f"agd_{aula}", help="Revisão já agendada" if agendada else "Agendar Revisão", disabled=agendada):
+                    salvar_pendentes(u)
+                    agendar_revisao_callback(u, aula, acp+acps, tt_geral)
+                    st.rerun()
+                if cb.button("↺", key=f"rst_{aula}", help="Reiniciar"):
+                    salvar_pendentes(u)
+                    reset_callback(u, aula)
+                    st.rerun()
+            else:
+                st.caption("—")
+
+        st.markdown("<hr style='margin:2px 0; border-top: 1px solid #f0f2f6;'>", unsafe_allow_html=True)
@@ -2,7 +2,7 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from database import get_status_gamer, get_dados_graficos, get_benchmark_dados
+from database import get_status_gamer, get_dados_graficos, get_benchmark_dados, get_metas_questoes
 
 def plot_pro(dataframe, col, tipo='bar'):
     # --- BLINDAGEM CONTRA ERRO DE COLUNA ---
@@ -76,6 +76,18 @@ def render_dashboard(conn_ignored):
 
     st.divider()
 
+    # --- ONDE FAZER QUESTÕES (motor de metas por aula) ---
+    metas = get_metas_questoes(u, nonce)
+    faltam = (metas["meta_pre"] + metas["meta_pos"] - metas["total"]).clip(lower=0)
+    foco = metas.assign(Faltam=faltam, Acerto=(metas["taxa"] * 100).round(0))[faltam > 0]
+    if not foco.empty:
+        st.subheader("🎯 Onde Fazer Questões")
+        foco = foco.sort_values(["Faltam", "Acerto"], ascending=[False, True]).head(10)
+        st.dataframe(foco[["Area", "Prioridade", "Acerto", "total", "meta_pre", "meta_pos", "Faltam"]]
+                     .rename(columns={"Area": "Área", "Acerto": "Acerto (%)", "total": "Feitas", "meta_pre": "Meta Pré", "meta_pos": "Meta Pós"}),
+                     use_container_width=True)
+        st.divider()
+
     st.subheader("⚖️ Comparativo (Benchmark)")
     try:
         df_bench = get_benchmark_dados(u, df)
@@ -0,0 +1,91 @@
+# importador.py
+# Importação de registros de estudo em massa (CSV ou JSON) sobre database.registrar_estudos_em_lote.
+# O arquivo é lido em streaming e gravado em lotes: a memória não cresce com o tamanho do arquivo.
+# Os lotes participam de uma única transação: um erro no meio do arquivo não deixa importação
+# parcial, e importar de novo depois de uma falha não duplica linhas.
+import csv
+import io
+import json
+from datetime import datetime
+from database import registrar_estudos_em_lote, normalizar_registro_estudo, _escrita
+
+TAMANHO_LOTE = 5000
+
+# Cabeçalhos aceitos -> campo do registro
+ALIASES = {
+    "assunto": "assunto", "assunto_nome": "assunto", "tema": "assunto", "aula": "assunto",
+    "acertos": "acertos",
+    "total": "total", "questoes": "total", "questões": "total",
+    "data": "data", "data_estudo": "data",
+    "tipo": "tipo", "tipo_estudo": "tipo", "fase": "tipo",
+}
+
+def _data_iso(valor):
+    valor = (valor or "").strip()
+    if not valor: return None
+    for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d/%m/%y"):
+        try: return datetime.strptime(valor, fmt).strftime("%Y-%m-%d")
+        except ValueError: pass
+    raise ValueError(f"Data inválida: {valor}")
+
+def _registro(bruto):
+    reg = {}
+    for k, v in bruto.items():
+        campo = ALIASES.get(str(k or "").strip().lower())
+        if campo: reg[campo] = v
+    reg["data"] = _data_iso(reg.get("data")) if isinstance(reg.get("data"), str) else reg.get("data")
+    return normalizar_registro_estudo(reg)
+
+def _ler_csv(texto):
+    amostra = texto.read(4096)
+    texto.seek(0)
+    try: dialeto = csv.Sniffer().sniff(amostra, delimiters=",;\t")
+    except csv.Error: dialeto = csv.excel
+    yield from csv.DictReader(texto, dialect=dialeto)
+
+def _ler_json(texto):
+    primeiro = texto.read(1)
+    while primeiro and primeiro.isspace(): primeiro = texto.read(1)
+    if primeiro == "[":
+        # Array JSON: carregado de uma vez (prefira JSON Lines para arquivos grandes)
+        yield from json.loads(primeiro + texto.read())
+        return
+    linha = primeiro + texto.readline()
+    while linha:
+        if linha.strip(): yield json.loads(linha)
+        linha = texto.readline()
+
+def importar_estudos(u, arquivo, formato=None, lote=TAMANHO_LOTE):
+    """
+    Importa um arquivo (caminho, arquivo binário/texto ou UploadedFile do Streamlit).
+    formato: 'csv' ou 'json' (JSON Lines ou array); inferido pela extensão se omitido.
+    Retorna {'importados': n, 'ignorados': k, 'erros': [primeiras mensagens]}. Linhas inválidas
+    são ignoradas; qualquer outra falha desfaz o arquivo inteiro.
+    """
+    nome = getattr(arquivo, "name", arquivo if isinstance(arquivo, str) else "")
+    formato = (formato or str(nome).rsplit(".", 1)[-1]).lower()
+    leitor = _ler_json if formato in ("json", "jsonl", "ndjson") else _ler_csv
+
+    fechar = isinstance(arquivo, str)
+    bruto = open(arquivo, "rb") if fechar else arquivo
+    texto = bruto if isinstance(bruto, io.TextIOBase) else io.TextIOWrapper(bruto, encoding="utf-8-sig", newline="")
+    resumo = {"importados": 0, "ignorados": 0, "erros": []}
+    pendentes = []
+    try:
+        with _escrita():  # cada lote é um bloco aninhado: o commit é um só, no fim do arquivo
+            for i, bruto_reg in enumerate(leitor(texto), start=1):
+                try:
+                    pendentes.append(_registro(bruto_reg))
+                except (ValueError, TypeError, AttributeError) as e:
+                    resumo["ignorados"] += 1
+                    if len(resumo["erros"]) < 10: resumo["erros"].append(f"linha {i}: {e}")
+                    continue
+                if len(pendentes) >= lote:
+                    resumo["importados"] += registrar_estudos_em_lote(u, pendentes)
+                    pendentes = []
+            if pendentes:
+                resumo["importados"] += registrar_estudos_em_lote(u, pendentes)
+    finally:
+        if fechar: bruto.close()
+        elif texto is not bruto: texto.detach()
+    return resumo
@@ -0,0 +1,247 @@
+# instrumentacao.py
+# Toda conexão entregue por database._leitura() / _escrita() passa por aqui: cada instrução
+# SQL registra latência, linhas, a função do app que a chamou e o rerun da sessão.
+# Instruções acima de MEDPLANNER_SLOW_MS vão para um log rotativo (JSON por linha).
+# Parâmetros nunca são gravados (podem conter hash de senha e dados pessoais).
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import warnings
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+import streamlit as st
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # versões antigas do streamlit
+    def get_script_run_ctx(suppress_warning=False): return None
+
+ATIVO = os.environ.get("MEDPLANNER_INSTRUMENTAR", "1") != "0"
+LIMIAR_LENTA_MS = float(os.environ.get("MEDPLANNER_SLOW_MS", "100"))
+ARQUIVO_LENTAS = os.environ.get("MEDPLANNER_SLOW_LOG", "slow_queries.log")
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 3
+MAX_CONSULTAS_DISTINTAS = 500   # SQL montado dinamicamente não pode crescer o agregado sem limite
+MAX_POR_RERUN = 300
+RERUNS_GUARDADOS = 20
+
+_RAIZ = os.path.dirname(os.path.abspath(__file__))
+_INTERNOS = {os.path.join(_RAIZ, "instrumentacao.py"), os.path.join(_RAIZ, "storage.py")}
+_SESSAO_KEY = "_consultas_rerun"
+
+_lock = threading.Lock()
+_agregado = {}
+_log_lentas = None
+
+# Com a conexão embrulhada o pandas usa o caminho DB-API genérico e avisa a cada leitura
+warnings.filterwarnings("ignore", message="pandas only supports SQLAlchemy")
+
+def _normalizar(sql):
+    return " ".join(sql.split())
+
+def _chamador():
+    """Primeira função do app (fora desta camada e do storage) na pilha."""
+    f = sys._getframe(2)
+    while f is not None:
+        arquivo = f.f_code.co_filename
+        if arquivo.startswith(_RAIZ) and arquivo not in _INTERNOS:
+            return f"{os.path.splitext(os.path.basename(arquivo))[0]}.{f.f_code.co_name}"
+        f = f.f_back
+    return "?"
+
+# --- SESSÃO / RERUN ---
+def _sessao():
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    if _SESSAO_KEY not in st.session_state:
+        st.session_state[_SESSAO_KEY] = {"rerun": 0, "consultas": [], "anteriores": deque(maxlen=RERUNS_GUARDADOS)}
+    return st.session_state[_SESSAO_KEY]
+
+def iniciar_rerun():
+    """Fecha o rerun anterior (resumo no histórico) e abre um novo id."""
+    sessao = _sessao()
+    if sessao is None:
+        return
+    if sessao["consultas"] or sessao["rerun"]:
+        sessao["anteriores"].append({"rerun": sessao["rerun"], "consultas": len(sessao["consultas"]),
+                                     "total_ms": round(sum(c["ms"] for c in sessao["consultas"]), 2)})
+    sessao["rerun"] += 1
+    sessao["consultas"] = []
+
+# --- REGISTRO ---
+def _logger_lentas():
+    global _log_lentas
+    if _log_lentas is None:
+        logger = logging.getLogger("medplanner.consultas_lentas")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        if not logger.handlers:
+            handler = RotatingFileHandler(ARQUIVO_LENTAS, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        _log_lentas = logger
+    return _log_lentas
+
+def _verificar_lenta(reg):
+    if not reg["lenta"] and reg["ms"] >= LIMIAR_LENTA_MS:
+        reg["lenta"] = True
+        _logger_lentas().info(json.dumps({
+            "quando": datetime.now().isoformat(timespec="milliseconds"), "ms": round(reg["ms"], 2),
+            "linhas": reg["linhas"], "funcao": reg["funcao"], "rerun": reg["rerun"], "sql": reg["sql"],
+        }, ensure_ascii=False))
+
+def _registrar(sql, ms, linhas, consulta):
+    reg = {"sql": _normalizar(sql), "ms": ms, "linhas": linhas, "funcao": _chamador(), "rerun": None, "lenta": False}
+    sessao = _sessao()
+    if sessao is not None:
+        reg["rerun"] = sessao["rerun"]
+        if len(sessao["consultas"]) < MAX_POR_RERUN:
+            sessao["consultas"].append(reg)
+    with _lock:
+        ag = _agregado.get(reg["sql"])
+        if ag is None and len(_agregado) < MAX_CONSULTAS_DISTINTAS:
+            ag = _agregado[reg["sql"]] = {"execucoes": 0, "total_ms": 0.0, "max_ms": 0.0, "linhas": 0, "funcoes": set()}
+        if ag is not None:
+            ag["execucoes"] += 1
+            ag["total_ms"] += ms
+            ag["max_ms"] = max(ag["max_ms"], ms)
+            ag["linhas"] += linhas
+            ag["funcoes"].add(reg["funcao"])
+    if not consulta:  # SELECT só entra no log depois do fetch, com as linhas contadas
+        _verificar_lenta(reg)
+    return reg
+
+def _acrescentar(reg, ms, linhas):
+    """Tempo e linhas dos fetch* entram na mesma instrução."""
+    if reg is None:
+        return
+    reg["ms"] += ms
+    reg["linhas"] += linhas
+    with _lock:
+        ag = _agregado.get(reg["sql"])
+        if ag is not None:
+            ag["total_ms"] += ms
+            ag["max_ms"] = max(ag["max_ms"], reg["ms"])
+            ag["linhas"] += linhas
+    _verificar_lenta(reg)
+
+# --- WRAPPERS ---
+class CursorInstrumentado:
+    __slots__ = ("_cur", "_reg")
+
+    def __init__(self, cur):
+        self._cur, self._reg = cur, None
+
+    def _registrar(self, sql, t0):
+        consulta = self._cur.description is not None
+        linhas = 0 if consulta else max(self._cur.rowcount, 0)
+        self._reg = _registrar(sql, (time.perf_counter() - t0) * 1000, linhas, consulta)
+
+    def execute(self, sql, params=()):
+        t0 = time.perf_counter()
+        self._cur.execute(sql, params)
+        self._registrar(sql, t0)
+        return self
+
+    def executemany(self, sql, seq):
+        t0 = time.perf_counter()
+        self._cur.executemany(sql, seq)
+        self._registrar(sql, t0)
+        return self
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        row = self._cur.fetchone()
+        _acrescentar(self._reg, (time.perf_counter() - t0) * 1000, row is not None)
+        return row
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        rows = self._cur.fetchall()
+        _acrescentar(self._reg, (time.perf_counter() - t0) * 1000, len(rows))
+        return rows
+
+    def fetchmany(self, *args):
+        t0 = time.perf_counter()
+        rows = self._cur.fetchmany(*args)
+        _acrescentar(self._reg, (time.perf_counter() - t0) * 1000, len(rows))
+        return rows
+
+    def __iter__(self):
+        linhas, ms = 0, 0.0
+        it = iter(self._cur)
+        try:
+            while True:
+                t0 = time.perf_counter()
+                try:
+                    row = next(it)
+                except StopIteration:
+                    return
+                finally:
+                    ms += (time.perf_counter() - t0) * 1000
+                linhas += 1
+                yield row
+        finally:
+            _acrescentar(self._reg, ms, linhas)
+
+    def __getattr__(self, nome):
+        return getattr(self._cur, nome)
+
+class ConexaoInstrumentada:
+    """Mesma API da conexão original; execute/executemany/cursor passam a ser medidos."""
+    __slots__ = ("_conn",)
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self):
+        return CursorInstrumentado(self._conn.cursor())
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq):
+        return self.cursor().executemany(sql, seq)
+
+    def __getattr__(self, nome):
+        return getattr(self._conn, nome)
+
+@contextmanager
+def instrumentada(gerenciador):
+    """Embrulha o context manager de leitura/escrita de um backend."""
+    with gerenciador as conn:
+        yield ConexaoInstrumentada(conn) if ATIVO else conn
+
+# --- CONSULTA DAS ESTATÍSTICAS ---
+def top_consultas(n=10, ordem="total_ms"):
+    with _lock:
+        linhas = [{"sql": sql, "execucoes": ag["execucoes"], "total_ms": round(ag["total_ms"], 2),
+                   "media_ms": round(ag["total_ms"] / ag["execucoes"], 3) if ag["execucoes"] else 0.0,
+                   "max_ms": round(ag["max_ms"], 2), "linhas": ag["linhas"], "funcoes": ", ".join(sorted(ag["funcoes"]))}
+                  for sql, ag in _agregado.items()]
+    return sorted(linhas, key=lambda r: r[ordem], reverse=True)[:n]
+
+def consultas_do_rerun():
+    sessao = _sessao()
+    if sessao is None:
+        return []
+    return [{"funcao": c["funcao"], "ms": round(c["ms"], 3), "linhas": c["linhas"], "sql": c["sql"]} for c in sessao["consultas"]]
+
+def reruns_anteriores():
+    sessao = _sessao()
+    return list(sessao["anteriores"]) if sessao is not None else []
+
+def ultimas_lentas(n=20):
+    try:
+        with open(ARQUIVO_LENTAS, encoding="utf-8") as f:
+            return [json.loads(l) for l in deque(f, maxlen=n) if l.strip()]
+    except (OSError, ValueError):
+        return []
+
+def zerar():
+    with _lock:
+        _agregado.clear()
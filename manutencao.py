@@ -0,0 +1,39 @@
+# manutencao.py
+# Comandos de manutenção do banco (SQLite local ou MEDPLANNER_DB_URL). Uso:
+#   python manutencao.py migrar
+#   python manutencao.py rollup [--usuario U]
+#   python manutencao.py compactar-revisoes
+import argparse
+import database
+
+def cmd_migrar(args):
+    aplicadas = database.aplicar_migracoes()  # o get_pool() já migra; aqui só confirma
+    with database._leitura() as conn:
+        print(f"✅ Schema na versão {database.versao_schema(conn)} ({database.get_pool().dialeto}){' | aplicadas: ' + str(aplicadas) if aplicadas else ''}")
+
+def cmd_rollup(args):
+    linhas = database.reconstruir_historico_diario(args.usuario)
+    print(f"✅ historico_diario reconstruído ({linhas} linhas)")
+
+def cmd_compactar_revisoes(args):
+    antes, depois = database.compactar_revisoes_pendentes()
+    reducao = (antes - depois) / antes * 100 if antes else 0
+    print(f"✅ revisoes: {antes} → {depois} linhas ({antes - depois} pendentes repetidas fundidas, -{reducao:.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Manutenção do MedPlanner")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    sub.add_parser("migrar", help="aplica migrações pendentes").set_defaults(func=cmd_migrar)
+
+    p = sub.add_parser("rollup", help="backfill do rollup diário a partir do histórico")
+    p.add_argument("--usuario", default=None)
+    p.set_defaults(func=cmd_rollup)
+
+    sub.add_parser("compactar-revisoes", help="funde revisões pendentes repetidas do mesmo assunto").set_defaults(func=cmd_compactar_revisoes)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from database import (
     update_dados_pessoais,
     resetar_conta_usuario # IMPORTANTE: Nova função importada
 )
+from backup import exportar_usuario, importar_usuario
 
 def render_perfil(conn_ignored):
     st.header("👤 Perfil & Conquistas")
@@ -106,7 +107,28 @@ def render_perfil(conn_ignored):
     
     st.divider()
     
-    # --- 4. ZONA DE PERIGO (COM RESET) ---
+    # --- 4. BACKUP ---
+    with st.expander("💾 Backup dos Dados"):
+        st.caption("Baixe tudo (histórico, revisões, cronograma, cadernos e perfil) antes de resetar ou para levar a outra instância.")
+        c_bk1, c_bk2 = st.columns(2)
+        with c_bk1:
+            if st.button("📦 Gerar backup", use_container_width=True):
+                with st.spinner("Exportando..."):
+                    st.session_state.backup_bytes = exportar_usuario(u)
+            if st.session_state.get("backup_bytes"):
+                st.download_button("⬇️ Baixar arquivo", st.session_state.backup_bytes,
+                                   file_name=f"medplanner_{u}_{datetime.now():%Y%m%d}.zip", mime="application/zip", use_container_width=True)
+        with c_bk2:
+            arq = st.file_uploader("Restaurar de um backup", type=["zip"], key="pf_restore")
+            if arq is not None and st.button("♻️ Restaurar (substitui os dados atuais)", use_container_width=True):
+                contagem = importar_usuario(arq, u_destino=u, incluir_conta=False)
+                st.success(f"Restaurado: {contagem.get('historico', 0)} registros de histórico.")
+                time.sleep(1)
+                st.rerun()
+
+    st.divider()
+
+    # --- 5. ZONA DE PERIGO (COM RESET) ---
     with st.expander("🚨 Zona de Perigo"):
         st.warning("Ações Críticas - Cuidado!")
         st.text_input("Usuário", value=u, disabled=True)
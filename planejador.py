@@ -0,0 +1,72 @@
+# planejador.py
+# Distribui as aulas pendentes do currículo pelos dias até a prova, na ordem dos blocos.
+# Cada aula custa as questões da sua meta (pré + pós); um dia comporta meta_diaria questões.
+# Se não couber até a prova, a carga diária sobe o mínimo necessário (meta_necessaria).
+# Replanejar é O(aulas + dias) e sem I/O: roda a cada rerun. Dia perdido ou aula adiantada
+# só mudam o conjunto pendente/o "hoje", e o plano é refeito a partir de hoje.
+import math
+from datetime import date, timedelta
+from typing import NamedTuple
+
+DIAS_SEMANA = ("Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom")
+
+class Plano(NamedTuple):
+    inicio: date
+    prova: date
+    dias: tuple            # datas de estudo (sem folgas), em ordem
+    aulas_por_dia: tuple   # tupla de tuplas de nomes, alinhada com dias
+    carga_por_dia: tuple   # questões planejadas em cada dia
+    meta_diaria: int
+    meta_necessaria: int   # >= meta_diaria quando o currículo não cabe no ritmo atual
+    termino: date          # último dia com aula (None se nada pendente)
+    chave: tuple           # entradas que geraram o plano (para replanejar só quando mudam)
+
+    def do_dia(self, dia):
+        for d, aulas in zip(self.dias, self.aulas_por_dia):
+            if d == dia:
+                return aulas
+        return ()
+
+def dias_de_estudo(inicio, prova, folga_semana=(), folga_datas=()):
+    """Datas de inicio até a véspera da prova, sem dias da semana (0=seg) ou datas de folga."""
+    folga_semana, folga_datas = frozenset(folga_semana), frozenset(folga_datas)
+    return tuple(d for d in (inicio + timedelta(n) for n in range((prova - inicio).days))
+                 if d.weekday() not in folga_semana and d not in folga_datas)
+
+def _chave(aulas, custos, feitas, meta_diaria, inicio, prova, folga_semana, folga_datas):
+    return (tuple(aulas), tuple(custos.get(a, 0) for a in aulas), frozenset(feitas), meta_diaria,
+            inicio, prova, frozenset(folga_semana), frozenset(folga_datas))
+
+def planejar(aulas, custos, feitas, meta_diaria, inicio, prova, folga_semana=(), folga_datas=()):
+    """
+    aulas: nomes na ordem do currículo. custos: {aula: questões}. feitas: aulas concluídas.
+    Uma aula entra no dia em que sua carga começa; nenhuma é dividida entre dias.
+    """
+    feitas = frozenset(feitas)
+    chave = _chave(aulas, custos, feitas, meta_diaria, inicio, prova, folga_semana, folga_datas)
+    pendentes = [a for a in aulas if a not in feitas]
+    dias = dias_de_estudo(inicio, prova, folga_semana, folga_datas)
+    meta_diaria = max(1, int(meta_diaria or 1))
+    if not dias or not pendentes:
+        return Plano(inicio, prova, dias, tuple(() for _ in dias), tuple(0 for _ in dias), meta_diaria, meta_diaria, None, chave)
+
+    carga_total = sum(custos.get(a, 0) for a in pendentes)
+    capacidade = max(meta_diaria, math.ceil(carga_total / len(dias)))
+    por_dia = [[] for _ in dias]
+    carga = [0] * len(dias)
+    ultimo = len(dias) - 1
+    acumulado = 0
+    for a in pendentes:
+        i = min(acumulado // capacidade, ultimo)
+        por_dia[i].append(a)
+        c = custos.get(a, 0)
+        carga[i] += c
+        acumulado += c
+    termino = max((d for d, lista in zip(dias, por_dia) if lista), default=None)
+    return Plano(inicio, prova, dias, tuple(tuple(l) for l in por_dia), tuple(carga), meta_diaria, capacidade, termino, chave)
+
+def replanejar(anterior, aulas, custos, feitas, meta_diaria, inicio, prova, folga_semana=(), folga_datas=()):
+    """Devolve o plano anterior se nada relevante mudou; senão refaz a partir de `inicio`."""
+    if anterior is not None and anterior.chave == _chave(aulas, custos, feitas, meta_diaria, inicio, prova, folga_semana, folga_datas):
+        return anterior
+    return planejar(aulas, custos, feitas, meta_diaria, inicio, prova, folga_semana, folga_datas)
@@ -0,0 +1,67 @@
+# pomodoro.py
+# O relógio roda no navegador (components.html): a contagem não custa rerun nenhum.
+# No servidor só fica um fragmento leve que confere a cada VERIFICACAO_S se o tempo
+# acabou, grava a sessão em sessoes_foco e então reroda o app uma vez.
+from datetime import datetime, timedelta
+import streamlit as st
+import streamlit.components.v1 as components
+from database import registrar_sessao_foco
+
+MODOS = {"Estudo (25m)": ("Estudo", 25), "Pausa (5m)": ("Pausa", 5)}
+VERIFICACAO_S = 15
+_ESTADO_KEY = "_pomodoro"
+
+_RELOGIO_HTML = """
+<div id="relogio" style="text-align:center; font: 700 56px 'Source Sans Pro', sans-serif; color: #262730;"></div>
+<script>
+const fim = __FIM_MS__;
+const el = document.getElementById("relogio");
+function tick() {
+    const r = Math.max(0, Math.round((fim - Date.now()) / 1000));
+    el.textContent = String(Math.floor(r / 60)).padStart(2, "0") + ":" + String(r % 60).padStart(2, "0");
+    if (r > 0) setTimeout(tick, 250);
+}
+tick();
+</script>
+"""
+
+def _relogio(fim):
+    # HTML idêntico entre reruns: o streamlit mantém o mesmo iframe e a contagem não reinicia
+    components.html(_RELOGIO_HTML.replace("__FIM_MS__", str(int(fim.timestamp() * 1000))), height=80)
+
+def _concluir_se_acabou(u):
+    """Grava a sessão quando o tempo passou. Retorna True se gravou."""
+    ativo = st.session_state.get(_ESTADO_KEY)
+    if not ativo or datetime.now() < ativo["fim"]:
+        return False
+    del st.session_state[_ESTADO_KEY]
+    minutos = registrar_sessao_foco(u, ativo["inicio"], ativo["fim"], ativo["tipo"])
+    st.toast(f"{ativo['tipo']} concluído: {minutos} min registrados!", icon="⏰")
+    return True
+
+def _vigia(u):
+    if _concluir_se_acabou(u):
+        st.rerun()
+
+if hasattr(st, "fragment"):
+    _vigia = st.fragment(run_every=VERIFICACAO_S)(_vigia)
+# streamlit < 1.37: sem run_every, a sessão é gravada no próximo rerun depois do fim
+
+def render_pomodoro(u):
+    c1, c2, c3 = st.columns([1, 2, 1])
+    ativo = st.session_state.get(_ESTADO_KEY)
+    with c2:
+        if ativo is None:
+            modo = st.radio("Modo:", list(MODOS), horizontal=True, key="pom_modo")
+            if st.button("🚀 Iniciar", key="pom_start"):
+                tipo, minutos = MODOS[modo]
+                inicio = datetime.now()
+                st.session_state[_ESTADO_KEY] = {"tipo": tipo, "inicio": inicio, "fim": inicio + timedelta(minutes=minutos)}
+                st.rerun()
+        else:
+            st.caption(f"{ativo['tipo']} · termina às {ativo['fim']:%H:%M}")
+            _relogio(ativo["fim"])
+            if st.button("⏹️ Cancelar", key="pom_cancel", use_container_width=True):
+                del st.session_state[_ESTADO_KEY]
+                st.rerun()
+            _vigia(u)
@@ -0,0 +1,64 @@
+# previsao.py
+# Carga de revisões prevista para os próximos HORIZONTE dias a partir dos cartões SM-2, e um
+# balanceamento que espalha os picos dentro da janela de tolerância de cada cartão.
+# Vetorizado com NumPy: cada passo do laço simula a próxima revisão de TODOS os cartões de uma
+# vez, supondo nota "Bom" (a facilidade não muda). O laço dá ~10 voltas, porque os intervalos
+# crescem geometricamente. Sem I/O.
+import numpy as np
+from repeticao import INTERVALOS_INICIAIS
+
+HORIZONTE = 365
+FOLGA_FRACAO = 0.15   # um cartão pode andar até 15% do seu intervalo...
+FOLGA_MAX_DIAS = 7    # ...e no máximo uma semana para cada lado
+
+def dias_ate(proximas, hoje):
+    """Dias de `hoje` até cada vencimento ("AAAA-MM-DD"); atrasados dão negativo."""
+    return (np.asarray(proximas, dtype="datetime64[D]") - np.datetime64(hoje, "D")).astype(int)
+
+def prever_carga(proximas, intervalos, facilidades, repeticoes, hoje, horizonte=HORIZONTE):
+    """Revisões esperadas por dia: array de tamanho horizonte, índice 0 = hoje (com as atrasadas)."""
+    dia = np.maximum(dias_ate(proximas, hoje), 0)
+    intervalo = np.asarray(intervalos, dtype=float)
+    facilidade = np.asarray(facilidades, dtype=float)
+    rep = np.asarray(repeticoes, dtype=int)
+    iniciais = np.asarray(INTERVALOS_INICIAIS, dtype=float)
+    carga = np.zeros(horizonte, dtype=int)
+    ativos = dia < horizonte
+    while ativos.any():
+        carga += np.bincount(dia[ativos], minlength=horizonte)
+        # Mesma regra de repeticao.revisar com nota 4
+        rep = rep + 1
+        crescido = np.maximum(intervalo + 1, np.round(intervalo * facilidade))
+        intervalo = np.where(rep <= len(iniciais), iniciais[np.minimum(rep, len(iniciais)) - 1], crescido)
+        dia = dia + intervalo.astype(int)
+        ativos &= dia < horizonte
+    return carga
+
+def folgas(intervalos):
+    """Quantos dias cada cartão pode andar sem distorcer o espaçamento."""
+    return np.minimum(FOLGA_MAX_DIAS, np.floor(np.asarray(intervalos, dtype=float) * FOLGA_FRACAO)).astype(int)
+
+def balancear(proximas, intervalos, hoje, limite, horizonte=HORIZONTE):
+    """
+    Novos vencimentos (em dias a partir de hoje) com no máximo `limite` revisões por dia onde a
+    janela de cada cartão permitir. Hoje e as atrasadas ficam onde estão; nada vai para antes
+    de amanhã. Dias estourados são esvaziados primeiro pelos cartões de janela maior.
+    """
+    original = dias_ate(proximas, hoje)
+    novo = original.copy()
+    folga = folgas(intervalos)
+    carga = np.bincount(np.maximum(original, 0), minlength=horizonte)
+    carga = np.pad(carga, (0, FOLGA_MAX_DIAS + 1))
+    for d in np.flatnonzero(carga[1:horizonte] > limite) + 1:
+        candidatos = np.flatnonzero(original == d)
+        for i in candidatos[np.argsort(-folga[candidatos], kind="stable")]:
+            if carga[d] <= limite or folga[i] == 0:
+                break
+            lo, hi = max(1, d - folga[i]), d + folga[i]
+            janela = np.arange(lo, hi + 1)
+            j = janela[np.argmin(carga[lo:hi + 1] * (2 * FOLGA_MAX_DIAS + 1) + np.abs(janela - d))]  # menor carga; empate: mais perto
+            if carga[j] >= limite:
+                continue
+            carga[d] -= 1; carga[j] += 1
+            novo[i] = j
+    return novo
@@ -0,0 +1,52 @@
+# repeticao.py
+# Repetição espaçada (SM-2) por (usuário, assunto). O cartão guarda facilidade, intervalo,
+# repetições seguidas e lapsos; uma nota de 0 a 5 gera o próximo estado e, daí, a próxima data.
+# Sem I/O: o database.py lê e grava os cartões (tabela cartoes_srs) na transação do chamador.
+from typing import NamedTuple
+
+FACILIDADE_INICIAL = 2.5
+FACILIDADE_MINIMA = 1.3
+INTERVALOS_INICIAIS = (7, 15)  # 1ª e 2ª revisões certas (o "7/15" de sempre); depois, intervalo × facilidade
+INTERVALO_LAPSO = 1
+NOTA_APROVACAO = 3             # abaixo disso o cartão volta ao início (lapso)
+
+# Botões da agenda -> nota SM-2
+NOTAS = {"Muito Ruim": 1, "Ruim": 2, "Bom": 4, "Excelente": 5}
+
+class Cartao(NamedTuple):
+    facilidade: float = FACILIDADE_INICIAL
+    intervalo: int = 0      # dias até a próxima revisão
+    repeticoes: int = 0     # acertos seguidos desde o último lapso
+    lapsos: int = 0
+
+def nota_por_acerto(acertos, total):
+    """Taxa de acerto de uma bateria de questões -> nota 0-5."""
+    if not total:
+        return NOTA_APROVACAO
+    taxa = acertos / total
+    for corte, nota in ((0.9, 5), (0.75, 4), (0.6, 3), (0.4, 2)):
+        if taxa >= corte:
+            return nota
+    return 1
+
+def revisar(cartao, nota):
+    """Estado do cartão depois de uma revisão com a nota dada (regra do SM-2)."""
+    nota = max(0, min(5, int(nota)))
+    if nota < NOTA_APROVACAO:  # lapso: recomeça repetições e intervalo; a facilidade fica como está
+        return Cartao(cartao.facilidade, INTERVALO_LAPSO, 0, cartao.lapsos + (cartao.repeticoes > 0))
+    erro = 5 - nota
+    facilidade = round(max(FACILIDADE_MINIMA, cartao.facilidade + 0.1 - erro * (0.08 + erro * 0.02)), 2)
+    repeticoes = cartao.repeticoes + 1
+    if repeticoes <= len(INTERVALOS_INICIAIS):
+        intervalo = INTERVALOS_INICIAIS[repeticoes - 1]
+    else:
+        intervalo = max(cartao.intervalo + 1, round(cartao.intervalo * facilidade))
+    return Cartao(facilidade, intervalo, repeticoes, cartao.lapsos)
+
+def rotulo_intervalo(dias):
+    """Texto da coluna revisoes.tipo ("1 Semana", "15 Dias"...)."""
+    if dias == 1:
+        return "1 Dia"
+    if dias % 7 == 0 and dias < 28:
+        return f"{dias // 7} Semana{'s' if dias > 7 else ''}"
+    return f"{dias} Dias"
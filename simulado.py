@@ -5,21 +5,22 @@ def render_simulado_real(conn_ignored):
     st.header("⏱️ Simulado Realista")
     u = st.session_state.username
     
+    if "sim_qtd" not in st.session_state: st.session_state.sim_qtd = 50
     c1, c2 = st.columns(2)
-    qtd = c1.slider("Questões:", 10, 100, 50, 10)
-    area = c2.selectbox("Foco:", ["Geral", "Cirurgia", "Clínica", "Pediatria", "G.O.", "Preventiva"])
+    qtd = c1.slider("Questões:", 10, 100, step=10, key="sim_qtd")
+    area = c2.selectbox("Foco:", ["Geral", "Cirurgia", "Clínica", "Pediatria", "G.O.", "Preventiva"], key="sim_area")
     
     with st.form("gab"):
         st.subheader("Gabarito")
         cols = st.columns(5)
         for i in range(1, qtd+1):
-            cols[(i-1)%5].radio(f"{i}", ["A","B","C","D"], horizontal=True, key=f"q{i}", label_visibility="collapsed")
+            cols[(i-1)%5].radio(f"{i}", ["A","B","C","D"], horizontal=True, key=f"sim_q{i}", label_visibility="collapsed")
         if st.form_submit_button("Finalizar"):
             st.session_state.sim_done = True
             
     if st.session_state.get("sim_done"):
         with st.container(border=True):
-            ac = st.number_input("Quantas você acertou?", 0, qtd)
+            ac = st.number_input("Quantas você acertou?", 0, qtd, key="sim_acertos")
             if st.button("Salvar Resultado"):
                 msg = registrar_estudo(u, f"Simulado {qtd}q", ac, qtd, area_f=area, srs=False)
                 st.success(msg); st.session_state.sim_done = False
\ No newline at end of file
@@ -0,0 +1,405 @@
+# storage.py
+# Backends de armazenamento do MedPlanner. O database.py só conhece esta interface:
+#   leitura()            -> context manager com uma conexão para SELECTs
+#   escrita()            -> context manager transacional (blocos aninhados participam do externo)
+#   apos_commit(fn)      -> roda fn depois do commit da transação externa
+#   versao_schema(conn) / aplicar_migracoes(migracoes) / colunas(conn, tabela)
+#   estatisticas() / fechar()
+# As conexões entregues aceitam o SQL do app (placeholders "?", INSERT OR IGNORE/REPLACE);
+# o backend PostgreSQL traduz para o dialeto dele.
+import functools
+import importlib.util
+import re
+import sqlite3
+import threading
+import time
+import warnings
+from collections import deque
+from contextlib import contextmanager
+
+# psycopg é opcional: sem ele só o SQLite local fica disponível
+try:
+    from psycopg_pool import ConnectionPool
+    PSYCOPG_AVAILABLE = importlib.util.find_spec("psycopg") is not None
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+BUSY_TIMEOUT_MS = 5000
+
+# --- SQLITE ---
+# WAL deixa leitores e o escritor trabalharem em paralelo: leituras usam um pool
+# de conexões somente-leitura e todas as escritas passam por UMA conexão serializada.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",       # ~8 MB por conexão (mmap cobre o resto)
+    "PRAGMA mmap_size=268435456",    # 256 MB
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+)
+
+def _abrir_conexao(caminho, somente_leitura=False):
+    conn = sqlite3.connect(caminho, check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+    conn.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    if somente_leitura:
+        conn.isolation_level = None  # autocommit: nenhuma transação de leitura fica aberta
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+class BackendSQLite:
+    """Um escritor serializado por lock + pool limitado de leitores (entrega FIFO)."""
+    dialeto = "sqlite"
+
+    def __init__(self, caminho, max_leitores=16):
+        self.caminho = caminho
+        self.max_leitores = max(1, max_leitores)
+        self._escritor = _abrir_conexao(caminho)
+        self._lock_escrita = threading.RLock()
+        self._profundidade = 0
+        self._pos_commit = []
+        self._lock_pool = threading.Lock()
+        self._livres = []
+        self._espera = deque()
+        self._criados = 0
+        # Contenção: [nº de esperas, segundos esperando] pelo escritor e pelo pool de leitura
+        self._esperas = {"escrita": [0, 0.0], "leitura": [0, 0.0]}
+
+    # Leitura
+    def _checkout(self):
+        with self._lock_pool:
+            if self._livres:
+                return self._livres.pop()
+            if self._criados < self.max_leitores:
+                self._criados += 1
+                vaga = None
+            else:
+                vaga = [None, threading.Event()]
+                self._espera.append(vaga)
+        if vaga is None:
+            return _abrir_conexao(self.caminho, somente_leitura=True)
+        t0 = time.perf_counter()
+        entregue = vaga[1].wait(BUSY_TIMEOUT_MS / 1000)
+        with self._lock_pool:
+            contador = self._esperas["leitura"]
+            contador[0] += 1; contador[1] += time.perf_counter() - t0
+            if not entregue and vaga[0] is None:
+                self._espera.remove(vaga)
+                raise sqlite3.OperationalError("pool de leitura esgotado")
+        return vaga[0]
+
+    def _devolver(self, conn):
+        with self._lock_pool:
+            if self._espera:
+                # Entrega direta ao mais antigo da fila: ninguém fura a vez
+                vaga = self._espera.popleft()
+                vaga[0] = conn
+                vaga[1].set()
+            else:
+                self._livres.append(conn)
+
+    @contextmanager
+    def leitura(self):
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._devolver(conn)
+
+    # Escrita
+    def _travar_escrita(self):
+        if self._lock_escrita.acquire(blocking=False):
+            return
+        t0 = time.perf_counter()
+        self._lock_escrita.acquire()
+        contador = self._esperas["escrita"]
+        contador[0] += 1; contador[1] += time.perf_counter() - t0
+
+    @contextmanager
+    def escrita(self):
+        """Transação no escritor único. Blocos aninhados participam da transação externa."""
+        ganchos = []
+        self._travar_escrita()
+        try:
+            self._profundidade += 1
+            try:
+                yield self._escritor
+                if self._profundidade == 1:
+                    self._escritor.commit()
+                    ganchos, self._pos_commit = self._pos_commit, []
+            except BaseException:
+                if self._profundidade == 1:
+                    self._escritor.rollback()
+                    self._pos_commit.clear()
+                raise
+            finally:
+                self._profundidade -= 1
+        finally:
+            self._lock_escrita.release()
+        # Ganchos pós-commit rodam fora do lock, na thread que escreveu
+        for fn in ganchos:
+            fn()
+
+    def apos_commit(self, fn):
+        """Agenda fn para depois do commit da transação externa (uma vez; descartada no rollback)."""
+        with self._lock_escrita:
+            if self._profundidade == 0:
+                fn()
+            elif fn not in self._pos_commit:
+                self._pos_commit.append(fn)
+
+    @property
+    def escritor(self):
+        return self._escritor
+
+    def estatisticas(self):
+        """Contadores acumulados de contenção (para benchmarks e diagnóstico)."""
+        with self._lock_pool:
+            return {"esperas_escrita": self._esperas["escrita"][0], "espera_escrita_s": round(self._esperas["escrita"][1], 4),
+                    "esperas_leitura": self._esperas["leitura"][0], "espera_leitura_s": round(self._esperas["leitura"][1], 4),
+                    "conexoes_leitura": self._criados}
+
+    # Schema: versão em PRAGMA user_version
+    def versao_schema(self, conn):
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def aplicar_migracoes(self, migracoes):
+        """Aplica os passos pendentes, cada um na própria transação. Retorna as versões aplicadas."""
+        aplicadas = []
+        conn = self._escritor
+        with self._lock_escrita:
+            for numero, descricao, passo in migracoes:
+                if numero <= self.versao_schema(conn):
+                    continue
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Outro processo pode ter migrado enquanto esperávamos o lock
+                    if numero > self.versao_schema(conn):
+                        passo(conn)
+                        conn.execute(f"PRAGMA user_version = {int(numero)}")
+                        aplicadas.append(numero)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        return aplicadas
+
+    def colunas(self, conn, tabela):
+        """[(nome, tipo declarado em maiúsculas)] na ordem da tabela."""
+        return [(r[1], (r[2] or "").upper()) for r in conn.execute(f"PRAGMA table_info({tabela})")]
+
+    def fechar(self):
+        with self._lock_escrita, self._lock_pool:
+            for conn in self._livres:
+                conn.close()
+            self._livres.clear()
+            self._criados = 0
+            self._escritor.close()
+
+# --- POSTGRESQL ---
+# Pool limitado (psycopg_pool) compartilhado por leitura e escrita; cada conexão prepara
+# no servidor os comandos a partir da N-ésima execução (prepare_threshold, 0 = sempre).
+# Com PgBouncer em modo transaction, desligue o prepare (prepare_threshold=None).
+_RE_LITERAL = re.compile(r"('(?:[^']|'')*')")
+_RE_OR_IGNORE = re.compile(r"^\s*INSERT\s+OR\s+IGNORE\s+INTO\s+", re.I)
+_RE_OR_REPLACE = re.compile(r"^\s*INSERT\s+OR\s+REPLACE\s+INTO\s+(\w+)\s*\(([^)]*)\)", re.I)
+
+def traduzir_sql(sql, chaves_primarias):
+    """SQL do app (dialeto SQLite) -> PostgreSQL: placeholders e INSERT OR IGNORE/REPLACE."""
+    # "?" fora de strings vira "%s"; todo "%" vira "%%" (o psycopg não distingue literais)
+    partes = _RE_LITERAL.split(sql.replace("%", "%%"))
+    for i in range(0, len(partes), 2):
+        partes[i] = partes[i].replace("?", "%s")
+    traduzido = "".join(partes).strip().rstrip(";")
+
+    if _RE_OR_IGNORE.match(traduzido):
+        return _RE_OR_IGNORE.sub("INSERT INTO ", traduzido, count=1) + " ON CONFLICT DO NOTHING"
+    m = _RE_OR_REPLACE.match(traduzido)
+    if m:
+        tabela, cols = m.group(1), [c.strip() for c in m.group(2).split(",")]
+        chave = chaves_primarias.get(tabela)
+        if not chave:
+            raise ValueError(f"INSERT OR REPLACE em '{tabela}' sem chave primária conhecida")
+        resto = [c for c in cols if c not in chave]
+        acao = f"DO UPDATE SET {', '.join(f'{c} = EXCLUDED.{c}' for c in resto)}" if resto else "DO NOTHING"
+        return f"INSERT INTO {tabela} ({m.group(2)}){traduzido[m.end():]} ON CONFLICT ({', '.join(chave)}) {acao}"
+    return traduzido
+
+class Linha(tuple):
+    """Linha acessível por posição e por nome, como sqlite3.Row."""
+    __slots__ = ()
+    _indice = {}
+
+    def __getitem__(self, chave):
+        if isinstance(chave, str):
+            return tuple.__getitem__(self, self._indice[chave])
+        return tuple.__getitem__(self, chave)
+
+    def keys(self):
+        return list(self._indice)
+
+@functools.lru_cache(maxsize=512)
+def _classe_linha(nomes):
+    return type("Linha", (Linha,), {"__slots__": (), "_indice": {n: i for i, n in enumerate(nomes)}})
+
+def _fabrica_linhas(cursor):
+    if cursor.description is None:
+        return tuple
+    return _classe_linha(tuple(c.name for c in cursor.description))
+
+class _CursorPostgres:
+    """Cursor DB-API (usado pelo pandas.read_sql_query) que traduz o SQL antes de executar."""
+
+    def __init__(self, cur, traduzir):
+        self._cur, self._traduzir = cur, traduzir
+
+    def execute(self, sql, params=None):
+        # Sempre com parâmetros (mesmo vazios): o "%%" da tradução só é desfeito assim
+        self._cur.execute(self._traduzir(sql), params or ())
+        return self
+
+    def executemany(self, sql, seq):
+        self._cur.executemany(self._traduzir(sql), seq)
+        return self
+
+    def __iter__(self):
+        return iter(self._cur)
+
+    def __getattr__(self, nome):
+        return getattr(self._cur, nome)
+
+class ConexaoPostgres:
+    """Fachada com a API usada pelo app (execute/executemany/cursor) sobre uma conexão psycopg."""
+
+    def __init__(self, bruta, traduzir):
+        self.bruta, self._traduzir = bruta, traduzir
+
+    def cursor(self):
+        return _CursorPostgres(self.bruta.cursor(), self._traduzir)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq):
+        return self.cursor().executemany(sql, seq)
+
+    def commit(self): self.bruta.commit()
+    def rollback(self): self.bruta.rollback()
+
+class BackendPostgres:
+    """Pool limitado de conexões PostgreSQL; transações aninhadas por thread."""
+    dialeto = "postgres"
+    # Chave fixa do advisory lock das migrações (várias réplicas sobem ao mesmo tempo)
+    LOCK_MIGRACAO = 7_150_001
+
+    def __init__(self, dsn, chaves_primarias=None, min_conexoes=1, max_conexoes=16, prepare_threshold=0):
+        if not PSYCOPG_AVAILABLE:
+            raise RuntimeError("Backend PostgreSQL requer 'psycopg[binary]' e 'psycopg_pool' instalados.")
+        self.chaves_primarias = dict(chaves_primarias or {})
+        self._traducoes = {}
+
+        def configurar(bruta):
+            bruta.prepare_threshold = prepare_threshold
+            bruta.row_factory = _fabrica_linhas
+
+        self._pool = ConnectionPool(dsn, min_size=min(min_conexoes, max_conexoes), max_size=max(1, max_conexoes),
+                                    timeout=BUSY_TIMEOUT_MS / 1000, configure=configurar, open=True)
+        self._local = threading.local()
+        # pandas avisa em toda read_sql_query com conexões DB-API que não são sqlite3
+        warnings.filterwarnings("ignore", message="pandas only supports SQLAlchemy")
+
+    def _traduzir(self, sql):
+        try:
+            return self._traducoes[sql]
+        except KeyError:
+            traduzido = self._traducoes[sql] = traduzir_sql(sql, self.chaves_primarias)
+            return traduzido
+
+    # Leitura: autocommit, nenhuma transação fica aberta entre consultas
+    @contextmanager
+    def leitura(self):
+        with self._pool.connection() as bruta:
+            bruta.autocommit = True
+            yield ConexaoPostgres(bruta, self._traduzir)
+
+    # Escrita
+    @contextmanager
+    def escrita(self):
+        """Transação numa conexão do pool. Blocos aninhados (mesma thread) participam da externa."""
+        atual = getattr(self._local, "transacao", None)
+        if atual is not None:
+            atual["profundidade"] += 1
+            try:
+                yield atual["conn"]
+            finally:
+                atual["profundidade"] -= 1
+            return
+
+        ganchos = []
+        with self._pool.connection() as bruta:
+            bruta.autocommit = False
+            trans = self._local.transacao = {"conn": ConexaoPostgres(bruta, self._traduzir), "profundidade": 1, "ganchos": []}
+            try:
+                yield trans["conn"]
+                bruta.commit()
+                ganchos = trans["ganchos"]
+            except BaseException:
+                bruta.rollback()
+                raise
+            finally:
+                self._local.transacao = None
+        for fn in ganchos:
+            fn()
+
+    def apos_commit(self, fn):
+        """Agenda fn para depois do commit da transação externa desta thread (uma vez)."""
+        atual = getattr(self._local, "transacao", None)
+        if atual is None:
+            fn()
+        elif fn not in atual["ganchos"]:
+            atual["ganchos"].append(fn)
+
+    def estatisticas(self):
+        """Contadores acumulados do psycopg_pool no mesmo formato do SQLite."""
+        st = self._pool.get_stats()
+        return {"esperas_escrita": 0, "espera_escrita_s": 0.0,
+                "esperas_leitura": st.get("requests_queued", 0), "espera_leitura_s": round(st.get("requests_wait_ms", 0) / 1000, 4),
+                "conexoes_leitura": st.get("pool_size", 0)}
+
+    @property
+    def escritor(self):
+        raise RuntimeError("PostgreSQL não tem conexão de escrita única; use escrita().")
+
+    # Schema: versão na tabela schema_versao
+    def versao_schema(self, conn):
+        row = conn.execute("SELECT COALESCE(MAX(versao), 0) FROM schema_versao").fetchone()
+        return row[0]
+
+    def aplicar_migracoes(self, migracoes):
+        aplicadas = []
+        with self.escrita() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS schema_versao (versao INTEGER PRIMARY KEY, aplicada_em TIMESTAMPTZ DEFAULT now())")
+        for numero, descricao, passo in migracoes:
+            with self.escrita() as conn:
+                # Serializa réplicas concorrentes; liberado no commit/rollback
+                conn.execute("SELECT pg_advisory_xact_lock(?)", (self.LOCK_MIGRACAO,))
+                if numero > self.versao_schema(conn):
+                    passo(conn)
+                    conn.execute("INSERT INTO schema_versao (versao) VALUES (?)", (numero,))
+                    aplicadas.append(numero)
+        return aplicadas
+
+    def colunas(self, conn, tabela):
+        rows = conn.execute("SELECT column_name, data_type FROM information_schema.columns WHERE table_schema = current_schema() AND table_name=? ORDER BY ordinal_position", (tabela,)).fetchall()
+        return [(r[0], (r[1] or "").upper()) for r in rows]
+
+    def fechar(self):
+        self._pool.close()
+
+def criar_backend(url, **opcoes):
+    """'postgresql://...' / 'postgres://...' -> BackendPostgres; qualquer outra coisa é um arquivo SQLite."""
+    if re.match(r"^postgres(ql)?://", url or ""):
+        pg = {k: v for k, v in opcoes.items() if k in ("chaves_primarias", "min_conexoes", "max_conexoes", "prepare_threshold")}
+        return BackendPostgres(url, **pg)
+    return BackendSQLite(url, max_leitores=opcoes.get("max_conexoes", 16))